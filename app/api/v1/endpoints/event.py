@@ -27,6 +27,11 @@ TRUST_PENALTIES = {
     "GAME_EXECUTED": -3,
 }
 
+# ⚡ Events that trigger an immediate command on the user's live SyncClient stream
+EVENT_COMMANDS = {
+    "DROWSINESS_DETECTED": "SHAKE_MOUSE",  # 졸음 깨우기 (물리)
+}
+
 @router.post("/events", response_model=EventCreateResponse)
 async def create_event(
     request: EventCreateRequest,
@@ -63,6 +68,17 @@ async def create_event(
             except Exception as trust_err:
                 logger.warning(f"Failed to update trust score: {trust_err}")
         
+        # ⚡ Push to connected client right away (no heartbeat round-trip)
+        if event_type_str in EVENT_COMMANDS:
+            from app.core.stream_registry import stream_registry
+            from app.protos import core_pb2
+            command_type = core_pb2.ServerCommand.CommandType.Value(EVENT_COMMANDS[event_type_str])
+            delivered = stream_registry.push(
+                request.user_id,
+                core_pb2.ServerCommand(type=command_type, payload=event_type_str)
+            )
+            logger.info(f"⚡ [Event] Pushed {EVENT_COMMANDS[event_type_str]} to {delivered} stream(s)")
+        
         return EventCreateResponse(
             id=str(event.id),
             user_id=event.user_id,
@@ -0,0 +1,39 @@
+from fastapi import APIRouter, HTTPException
+from app.core.stream_registry import stream_registry
+from app.protos import core_pb2
+from app.schemas.stream import StreamPushRequest, StreamPushResponse, StreamStatsResponse, StreamMemoryResponse
+
+router = APIRouter()
+
+@router.post("/push", response_model=StreamPushResponse)
+async def push_command(request: StreamPushRequest):
+    """
+    Pushes a ServerCommand to the user's live SyncClient streams immediately
+    (no need to wait for the next heartbeat).
+    """
+    try:
+        command_type = core_pb2.ServerCommand.CommandType.Value(request.type)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Unknown command type: {request.type}")
+
+    delivered = stream_registry.push(
+        request.user_id,
+        core_pb2.ServerCommand(type=command_type, payload=request.payload)
+    )
+    print(f"📨 [Streams] Pushed {request.type} to {request.user_id} ({delivered} streams)")
+    return StreamPushResponse(user_id=request.user_id, delivered=delivered)
+
+@router.get("/stats", response_model=StreamStatsResponse)
+async def get_stream_stats():
+    """
+    Live SyncClient connection counts for capacity planning.
+    """
+    return StreamStatsResponse(**stream_registry.stats())
+
+@router.get("/memory", response_model=StreamMemoryResponse)
+async def get_stream_memory():
+    """
+    Per-session memory accounting for live SyncClient streams
+    (used to size how many idle streams one pod can hold).
+    """
+    return StreamMemoryResponse(**stream_registry.memory_stats())
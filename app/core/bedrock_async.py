@@ -0,0 +1,150 @@
+import asyncio
+import base64
+import contextlib
+import importlib.util
+import json
+from typing import AsyncIterator, Optional
+from urllib.parse import quote
+
+import boto3
+import httpx
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.eventstream import EventStreamBuffer
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+ANTHROPIC_VERSION = "bedrock-2023-05-31"
+_HTTP2 = importlib.util.find_spec("h2") is not None  # optional: pip install h2
+
+
+class BedrockStreamError(Exception):
+    """Bedrock rejected the request or reported an error inside the event stream."""
+
+
+class AsyncBedrockChat:
+    """
+    Native async InvokeModelWithResponseStream for Anthropic models on Bedrock.
+
+    Requests are SigV4-signed with botocore and sent through a shared
+    httpx.AsyncClient (HTTP/2 when `h2` is installed); the binary event stream
+    is decoded as it arrives. No executor threads are involved, so concurrent
+    voice sessions are bounded by the connection pool, not the thread pool.
+
+    `astream(prompt)` yields text deltas (str), the same way the LangChain
+    ChatBedrock stream is consumed. If the native call fails before the first
+    token, the turn is retried once through LangChain.
+    """
+
+    def __init__(self, model_id: str, temperature: float = 0.0, max_tokens: int = 4096):
+        self.model_id = model_id
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.url = (f"https://bedrock-runtime.{settings.BEDROCK_REGION}.amazonaws.com"
+                    f"/model/{quote(model_id, safe='')}/invoke-with-response-stream")
+
+    def body(self, prompt: str, system: Optional[str] = None) -> dict:
+        body = {
+            "anthropic_version": ANTHROPIC_VERSION,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system:
+            body["system"] = system
+        return body
+
+    async def astream(self, prompt: str, system: Optional[str] = None) -> AsyncIterator[str]:
+        produced = False
+        try:
+            # aclosing: a barge-in closing this generator also closes the HTTP stream right away
+            async with contextlib.aclosing(self.stream_body(self.body(prompt, system))) as stream:
+                async for text in stream:
+                    produced = True
+                    yield text
+        except (httpx.HTTPError, BedrockStreamError) as e:
+            if produced:
+                raise
+            print(f"⚠️ [Bedrock] Native stream failed ({e}), falling back to LangChain")
+            from app.core.llm import get_llm
+            messages = [("system", system), ("human", prompt)] if system else prompt
+            async for chunk in get_llm(self.model_id, self.temperature).astream(messages):
+                yield chunk.content
+
+    async def stream_body(self, body: dict) -> AsyncIterator[str]:
+        """Streams the text deltas of an Anthropic Messages request body."""
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        headers = _sign(self.url, payload)
+        async with get_http_client().stream("POST", self.url, content=payload, headers=headers) as response:
+            if response.status_code != 200:
+                detail = (await response.aread()).decode("utf-8", "replace")[:300]
+                raise BedrockStreamError(f"HTTP {response.status_code}: {detail}")
+
+            events = EventStreamBuffer()
+            async for data in response.aiter_bytes():
+                events.add_data(data)
+                for message in events:
+                    text = _text_delta(message)
+                    if text:
+                        yield text
+
+
+def _text_delta(message) -> Optional[str]:
+    headers = message.headers
+    if headers.get(":message-type") == "exception":
+        raise BedrockStreamError(f"{headers.get(':exception-type')}: {message.payload.decode('utf-8', 'replace')}")
+    if headers.get(":event-type") != "chunk":
+        return None
+    event = json.loads(base64.b64decode(json.loads(message.payload)["bytes"]))
+    if event.get("type") == "content_block_delta":
+        return event["delta"].get("text")
+    return None
+
+
+# =============================================================================
+# Shared transport
+# =============================================================================
+
+_credentials = None
+_http_client: Optional[httpx.AsyncClient] = None
+_http_loop = None
+
+
+def _sign(url: str, payload: bytes) -> dict:
+    global _credentials
+    if _credentials is None:
+        # Explicit keys only (no stale AWS_SESSION_TOKEN from the environment), else the default chain
+        _credentials = boto3.Session(
+            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        ).get_credentials()
+    if _credentials is None:
+        raise BedrockStreamError("No AWS credentials configured")
+    request = AWSRequest(method="POST", url=url, data=payload, headers={
+        "Content-Type": "application/json",
+        "Accept": "application/vnd.amazon.eventstream",
+    })
+    SigV4Auth(_credentials.get_frozen_credentials(), "bedrock", settings.BEDROCK_REGION).add_auth(request)
+    return dict(request.headers.items())
+
+
+def reset_credentials():
+    global _credentials
+    _credentials = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Keep-alive connection pool of the running event loop (rebuilt if the loop changes)."""
+    global _http_client, _http_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            http2=_HTTP2,
+            timeout=httpx.Timeout(settings.BEDROCK_READ_TIMEOUT, connect=settings.BEDROCK_CONNECT_TIMEOUT),
+            limits=httpx.Limits(max_connections=settings.BEDROCK_MAX_POOL_CONNECTIONS,
+                                max_keepalive_connections=settings.BEDROCK_MAX_POOL_CONNECTIONS),
+        )
+        _http_loop = loop
+    return _http_client
@@ -0,0 +1,90 @@
+import collections
+import time
+from typing import Optional
+
+
+class CircuitBreaker:
+    """
+    Health-based circuit breaker for an external provider.
+
+    CLOSED:    calls go through; consecutive failures or a window of mostly
+               slow calls trips it OPEN.
+    OPEN:      calls are routed elsewhere until `cooldown_seconds` pass.
+    HALF_OPEN: one probe call is let through; success closes the breaker,
+               failure opens it again.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(self, name: str, failure_threshold: int = 3, slow_call_seconds: float = 4.0,
+                 slow_call_ratio: float = 0.5, window: int = 20, min_calls: int = 5,
+                 cooldown_seconds: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_ratio = slow_call_ratio
+        self.min_calls = min_calls
+        self.cooldown_seconds = cooldown_seconds
+
+        self.state = self.CLOSED
+        self._slow = collections.deque(maxlen=window)   # True = slow call
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+        self.trips = 0
+
+    def allow(self, now: Optional[float] = None) -> bool:
+        """True if the next call may go to the provider."""
+        if self.state == self.CLOSED:
+            return True
+        now = time.monotonic() if now is None else now
+        if self.state == self.OPEN:
+            if now - self._opened_at < self.cooldown_seconds:
+                return False
+            self.state = self.HALF_OPEN
+            self._probe_started_at = None
+        # HALF_OPEN: a single probe at a time (a lost probe is retried after another cooldown)
+        if self._probe_started_at is None or now - self._probe_started_at >= self.cooldown_seconds:
+            self._probe_started_at = now
+            return True
+        return False
+
+    def record_success(self, latency: float):
+        if self.state == self.HALF_OPEN:
+            print(f"✅ [Breaker] {self.name} recovered ({latency:.2f}s). Closing.")
+            self._reset()
+            return
+        self._consecutive_failures = 0
+        self._slow.append(latency >= self.slow_call_seconds)
+        if len(self._slow) >= self.min_calls and sum(self._slow) / len(self._slow) >= self.slow_call_ratio:
+            self._trip(f"{sum(self._slow)}/{len(self._slow)} calls slower than {self.slow_call_seconds}s")
+
+    def record_failure(self, reason: str = ""):
+        self._consecutive_failures += 1
+        if self.state == self.HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+            self._trip(f"{self._consecutive_failures} consecutive failures {reason}".strip())
+
+    def _trip(self, why: str):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_started_at = None
+        self.trips += 1
+        print(f"⚠️ [Breaker] {self.name} OPEN: {why}. Retrying in {self.cooldown_seconds:.0f}s.")
+
+    def _reset(self):
+        self.state = self.CLOSED
+        self._slow.clear()
+        self._consecutive_failures = 0
+        self._probe_started_at = None
+
+    def stats(self) -> dict:
+        return {
+            "name": self.name,
+            "state": self.state,
+            "trips": self.trips,
+            "consecutive_failures": self._consecutive_failures,
+            "slow_calls": sum(self._slow),
+            "window_calls": len(self._slow),
+        }
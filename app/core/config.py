@@ -14,6 +14,12 @@ class Settings(BaseSettings):
     AWS_REGION: str = os.getenv("AWS_REGION", "us-east-1")
     BEDROCK_REGION: str = os.getenv("BEDROCK_REGION", "us-west-2") # Cross-Region for Bedrock
     AWS_S3_REGION: str = os.getenv("AWS_S3_REGION", os.getenv("AWS_REGION", "us-east-1"))
+    BEDROCK_MAX_POOL_CONNECTIONS: int = int(os.getenv("BEDROCK_MAX_POOL_CONNECTIONS", "50"))  # shared client's HTTPS pool
+    BEDROCK_CONNECT_TIMEOUT: float = float(os.getenv("BEDROCK_CONNECT_TIMEOUT", "5"))
+    BEDROCK_READ_TIMEOUT: float = float(os.getenv("BEDROCK_READ_TIMEOUT", "60"))
+    BEDROCK_MAX_ATTEMPTS: int = int(os.getenv("BEDROCK_MAX_ATTEMPTS", "3"))  # incl. the first call (standard retry mode)
+    BEDROCK_ASYNC_STREAM: bool = os.getenv("BEDROCK_ASYNC_STREAM", "true").lower() == "true"  # native async streaming (Highway)
+    BEDROCK_PROMPT_CACHE: bool = os.getenv("BEDROCK_PROMPT_CACHE", "false").lower() == "true"  # cached system block (below Haiku's minimum yet)
 
     # Long-Term Memory (PostgreSQL)
     PG_HOST: str = os.getenv("PG_HOST", os.getenv("pg_host", "localhost"))
@@ -37,6 +43,23 @@ class Settings(BaseSettings):
     KAFKA_BOOTSTRAP_SERVERS: str = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
     KAFKA_TOPIC_AI_INTENT: str = os.getenv("KAFKA_TOPIC_AI_INTENT", "jiaa.ai.intent")
 
+    # Voice (STT)
+    STT_STREAMING: bool = os.getenv("STT_STREAMING", "true").lower() == "true"  # transcribe while audio streams in
+    STT_UPLOAD_FORMAT: str = os.getenv("STT_UPLOAD_FORMAT", "flac")  # wav (no CPU) | flac (lossless) | opus (smallest)
+    STT_BACKEND: str = os.getenv("STT_BACKEND", "groq")      # groq | local
+    STT_FALLBACK: str = os.getenv("STT_FALLBACK", "local")   # local | none (used when the primary's breaker is open)
+    STT_LOCAL_MODEL: str = os.getenv("STT_LOCAL_MODEL", "small")  # faster-whisper model size (int8 on CPU)
+    STT_HEDGE: bool = os.getenv("STT_HEDGE", "true").lower() == "true"     # duplicate slow Groq calls
+    STT_HEDGE_PERCENTILE: float = float(os.getenv("STT_HEDGE_PERCENTILE", "90"))  # hedge after this latency percentile
+    STT_HEDGE_BUDGET: float = float(os.getenv("STT_HEDGE_BUDGET", "0.1"))  # max share of requests hedged
+    VOICE_MAX_AUDIO_BYTES: int = int(os.getenv("VOICE_MAX_AUDIO_BYTES", str(4 * 1024 * 1024)))  # per stream (~2 min of 16kHz PCM)
+    VOICE_MAX_STREAM_SECONDS: float = float(os.getenv("VOICE_MAX_STREAM_SECONDS", "150"))  # wall-clock cap per stream
+    VOICE_SPOOL_BYTES: int = int(os.getenv("VOICE_SPOOL_BYTES", str(1024 * 1024)))  # move audio to a temp file past this
+    TTS_LATENCY_TARGET_MS: int = int(os.getenv("TTS_LATENCY_TARGET_MS", "500"))  # max wait for the first TTS chunk
+    TTS_MAX_WAIT_MS: int = int(os.getenv("TTS_MAX_WAIT_MS", "1200"))  # max wait for later chunks
+    TTS_MIN_CHUNK_CHARS: int = int(os.getenv("TTS_MIN_CHUNK_CHARS", "10"))  # later chunks merge sentences up to this size
+    COMMAND_ROUTER: bool = os.getenv("COMMAND_ROUTER", "true").lower() == "true"  # answer plain commands without the LLM
+
     class Config:
         case_sensitive = True
 
@@ -13,8 +13,10 @@ from grpc_health.v1 import health
 from grpc_health.v1 import health_pb2
 from grpc_health.v1 import health_pb2_grpc
 
-from app.protos import audio_pb2, audio_pb2_grpc
+from app.protos import audio_pb2, audio_pb2_grpc, text_ai_pb2
 from app.services import stt, classifier, chat
+from app.services.audio_buffer import AudioBuffer, AudioStreamLimits, AudioLimitExceeded, UnsupportedAudioFormat
+from app.services.voice_turns import voice_turns
 from app.schemas.intelligence import ClassifyRequest, ChatRequest, SolveRequest
 from app.core.kafka import kafka_producer
 from app.core.config import get_settings
@@ -25,6 +27,35 @@ from grpc_health.v1 import health_pb2_grpc
 settings = get_settings()
 
 
+async def stream_chat(chat_req: ChatRequest):
+    """
+    TextAIService.ChatStream messages for one request: text chunks, then the
+    intent with the same action contract as unary Chat (GENERATE_NOTE is
+    turned into WRITE_FILE + note markdown before it is sent).
+    """
+    full_text = ""
+    async for text_chunk, is_complete, metadata in chat.chat_with_persona_stream(chat_req):
+        if not is_complete:
+            full_text += text_chunk
+            yield text_ai_pb2.ChatStreamResponse(
+                text_chunk=text_chunk,
+                chunk_index=metadata.get("chunk_index", 0),
+                emotion=metadata.get("emotion", "NORMAL")
+            )
+            continue
+
+        data = await chat.apply_action_hooks({**metadata, "message": full_text})
+        yield text_ai_pb2.ChatStreamResponse(
+            is_complete=True,
+            message=data.get("message") or "",
+            intent=data.get("intent", "CHAT"),
+            action_code=data.get("action_code", "NONE"),
+            action_detail=data.get("action_detail") or "",
+            emotion=data.get("emotion", "NORMAL"),
+            judgment=data.get("judgment", "NEUTRAL")
+        )
+
+
 class AudioService(audio_pb2_grpc.AudioServiceServicer):
     """Dev 1(OS Agent)과의 오디오 스트리밍 서비스"""
     
@@ -33,13 +64,14 @@ class AudioService(audio_pb2_grpc.AudioServiceServicer):
         Receives AudioStream, aggregates bytes, performs STT -> Chat.
         Matches Dev 1's Proto definition.
         """
-        audio_buffer = bytearray()
+        audio_buffer = AudioBuffer(spool_bytes=settings.VOICE_SPOOL_BYTES)
+        limits = AudioStreamLimits(settings.VOICE_MAX_AUDIO_BYTES, settings.VOICE_MAX_STREAM_SECONDS)
         
         # Context Accumulator
         final_media_info = {}
 
         try:
-            async for request in request_iterator:
+            async for request in limits.guard(request_iterator):
                 audio_buffer.extend(request.audio_data)
                 
                 # [DEBUG] Check for media_info_json
@@ -53,6 +85,14 @@ class AudioService(audio_pb2_grpc.AudioServiceServicer):
 
                 if request.is_final:
                     break
+        except AudioLimitExceeded as e:
+            print(f"🛑 [Server] Dropping audio stream: {e}")
+            audio_buffer.close()
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+        except UnsupportedAudioFormat as e:
+            print(f"🛑 [Server] Dropping audio stream: {e}")
+            audio_buffer.close()
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
         except Exception as e:
             print(f"gRPC Stream Error: {e}")
 
@@ -61,7 +101,8 @@ class AudioService(audio_pb2_grpc.AudioServiceServicer):
         # 1. STT
         import time
         start_stt = time.time()
-        stt_response = await stt.transcribe_bytes(bytes(audio_buffer), file_ext="mp3")
+        stt_response = await stt.transcribe_bytes(audio_buffer)
+        audio_buffer.close()
         stt_duration = time.time() - start_stt
         print(f"⏱️ [Perf] STT Duration: {stt_duration:.2f}s")
         
@@ -81,7 +122,8 @@ class AudioService(audio_pb2_grpc.AudioServiceServicer):
 
         # 2. Chat (Tsundere Response)
         # Extract user_id from accumulated media_info or default to dev1
-        user_id = final_media_info.get("user_id", "dev1")
+        identity = final_media_info.get("user_id")
+        user_id = identity or "dev1"
         print(f"👤 [Audio] Chatting as User: {user_id}")
         # Pass running apps context if available for game detection
         user_text_with_context = user_text
@@ -106,7 +148,16 @@ class AudioService(audio_pb2_grpc.AudioServiceServicer):
                 print(f"⚠️ [Context] Failed to parse windows: {e}")
         
         chat_request = ChatRequest(text=user_text_with_context, user_id=user_id)
-        chat_response = await chat.chat_with_persona(chat_request)
+        # [Barge-in] A newer utterance from the same user cancels this turn (LLM call + Kafka emission).
+        # Without a user_id in media_info the turn is keyed by this stream, not the shared "dev1"
+        turn = voice_turns.begin(user_id, key=None if identity else f"stream:{id(context)}")
+        try:
+            chat_response = await turn.run(chat.chat_with_persona(chat_request))
+        finally:
+            voice_turns.end(turn)
+        if chat_response is None:
+            print(f"✋ [Audio] Turn #{turn.turn_id} superseded, dropping response")
+            return audio_pb2.AudioResponse(transcript=user_text, is_emergency=False, intent="{}")
 
         # 3. Construct JSON Intent (스키마에 맞게 매핑)
         # 3. Construct JSON Intent (스키마에 맞게 매핑)
@@ -260,11 +311,12 @@ class IntelligenceService:
         """
         print("[IntelligenceService] TranscribeAudio stream started")
         
-        audio_buffer = bytearray()
+        audio_buffer = AudioBuffer(spool_bytes=settings.VOICE_SPOOL_BYTES)
+        limits = AudioStreamLimits(settings.VOICE_MAX_AUDIO_BYTES, settings.VOICE_MAX_STREAM_SECONDS)
         client_id = ""
         
         try:
-            async for chunk in request_iterator:
+            async for chunk in limits.guard(request_iterator):
                 client_id = chunk.client_id
                 audio_buffer.extend(chunk.audio_data)
                 if chunk.is_final:
@@ -280,7 +332,7 @@ class IntelligenceService:
                     "audio_level": 0.0
                 }
 
-            stt_response = await stt.transcribe_bytes(bytes(audio_buffer), file_ext="wav")
+            stt_response = await stt.transcribe_bytes(audio_buffer)
             
             print(f"[IntelligenceService] Transcribed: {stt_response.text}")
             
@@ -288,9 +340,15 @@ class IntelligenceService:
                 "success": True,
                 "text": stt_response.text,
                 "is_final": True,
-                "audio_level": 60.0
+                "audio_level": stt_response.audio_level or 0.0
             }
             
+        except AudioLimitExceeded as e:
+            print(f"[IntelligenceService] ⚠️ Dropping stream from {client_id or 'unknown'}: {e}")
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(e))
+        except UnsupportedAudioFormat as e:
+            print(f"[IntelligenceService] ⚠️ Rejecting stream from {client_id or 'unknown'}: {e}")
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
         except Exception as e:
             print(f"[IntelligenceService] TranscribeAudio Error: {e}")
             return {
@@ -299,6 +357,8 @@ class IntelligenceService:
                 "is_final": True,
                 "audio_level": 0.0
             }
+        finally:
+            audio_buffer.close()
 
 
 # =============================================================================
@@ -378,7 +438,13 @@ async def serve_grpc():
 
     # 3. TrackingService 등록 (New Hybrid Logic)
     from app.services.tracking_service import TrackingService
+    from app.services.blacklist_service import blacklist_refresher
     tracking_servicer = TrackingService()
+    # Blacklist is fetched once per process in the background (not per SyncClient connect)
+    await blacklist_refresher.start()
+    # Local Whisper (if configured) loads in the background so the first fallback isn't slow
+    from app.services.stt_backends import stt_router
+    stt_router.start()
     
     tracking_rpc_handlers = {
         'SendAppList': unary_unary_rpc_method_handler(
@@ -466,6 +532,13 @@ async def serve_grpc():
                 judgment=chat_res.judgment
             )
 
+        async def ChatStream(self, request, context):
+            """Chat with Highway streaming: reply text as it is generated, intent on the last message."""
+            print(f"💬 [TextAI] ChatStream Request from {request.client_id}: {request.text}")
+            chat_req = ChatRequest(text=request.text, user_id=request.client_id)
+            async for response in stream_chat(chat_req):
+                yield response
+
         async def GenerateQuiz(self, request, context):
             print(f"🧠 [Quiz] Generating Quiz: {request.topic} ({request.difficulty})")
             
@@ -543,4 +616,9 @@ async def serve_grpc():
     print("=" * 50)
     
     await server.start()
-    await server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        # Process-wide background tasks started above (blacklist refresh, STT model preload)
+        await blacklist_refresher.stop()
+        await stt_router.stop()
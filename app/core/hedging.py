@@ -0,0 +1,114 @@
+import asyncio
+import collections
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import numpy as np
+
+T = TypeVar("T")
+
+
+class HedgePolicy:
+    """
+    When to send a duplicate request, and how many are allowed.
+
+    - Delay: the `percentile` of recently observed call latencies (a fixed
+      default until `min_samples` calls were seen), never below `min_delay`.
+    - Budget: every request earns `budget_ratio` tokens and a hedge costs one,
+      so hedges never exceed `budget_ratio` of traffic (short bursts up to
+      `max_burst` hedges).
+    """
+
+    def __init__(self, percentile: float = 90, budget_ratio: float = 0.1, window: int = 200,
+                 min_samples: int = 20, default_delay: float = 2.0, min_delay: float = 0.3,
+                 max_burst: float = 5.0):
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.min_samples = min_samples
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_burst = max_burst
+
+        self._latencies = collections.deque(maxlen=window)
+        self._tokens = 0.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def delay(self) -> float:
+        if len(self._latencies) < self.min_samples:
+            return self.default_delay
+        return max(self.min_delay, float(np.percentile(self._latencies, self.percentile)))
+
+    def record(self, latency: float):
+        self._latencies.append(latency)
+
+    def on_request(self):
+        self.requests += 1
+        self._tokens = min(self.max_burst, self._tokens + self.budget_ratio)
+
+    def try_hedge(self) -> bool:
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        self.hedges += 1
+        return True
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": round(self.hedges / self.requests, 4) if self.requests else 0.0,
+            "delay_s": round(self.delay(), 3),
+            "samples": len(self._latencies),
+        }
+
+
+async def hedged_call(call: Callable[[], Awaitable[T]], policy: HedgePolicy, name: str = "") -> T:
+    """
+    Runs `call()`; if it has not finished after policy.delay() (and the budget
+    allows), starts a duplicate and returns whichever succeeds first. The loser
+    is cancelled. Raises only when every attempt failed.
+
+    Latency samples: the winner counts from the start of the request (what the
+    caller waited), failed attempts their own duration, and a cancelled loser the
+    time it had run so far (a lower bound), so hedging cannot pull the delay down.
+    """
+    policy.on_request()
+    request_started = time.perf_counter()
+    started = {}
+    pending = set()
+
+    def launch(label: str):
+        task = asyncio.ensure_future(call())
+        started[task] = (label, time.perf_counter())
+        pending.add(task)
+
+    launch("primary")
+    last_error: Optional[BaseException] = None
+    try:
+        done, _ = await asyncio.wait(pending, timeout=policy.delay())
+        if not done and policy.try_hedge():
+            print(f"🪁 [Hedge] {name} slower than {policy.delay():.2f}s, sending a duplicate")
+            launch("hedge")
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            now = time.perf_counter()
+            for task in done:
+                label, task_started = started[task]
+                if task.exception() is not None:
+                    last_error = task.exception()
+                    policy.record(now - task_started)
+                    continue
+                policy.record(now - request_started)
+                for loser in pending:
+                    policy.record(now - started[loser][1])
+                if label == "hedge":
+                    policy.hedge_wins += 1
+                return task.result()
+        raise last_error
+    finally:
+        for task in pending:
+            task.cancel()
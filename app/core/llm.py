@@ -1,5 +1,12 @@
+import os
+import threading
+from typing import Dict, Tuple
+
 import boto3
+from botocore.config import Config
 from langchain_aws import ChatBedrock
+from langchain_core.messages import SystemMessage
+from app.core.bedrock_async import AsyncBedrockChat, reset_credentials
 from app.core.config import get_settings
 
 settings = get_settings()
@@ -8,11 +15,35 @@ settings = get_settings()
 HAIKU_MODEL_ID = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
 SONNET_MODEL_ID = "anthropic.claude-3-5-sonnet-20240620-v1:0"
 
-def get_bedrock_client():
+# Models with Bedrock prompt caching (cache_control checkpoints). Prefixes shorter than
+# the model's minimum (2048 tokens on Haiku) are processed normally, uncached.
+PROMPT_CACHE_MODELS = {HAIKU_MODEL_ID}
+
+# Process-level pool: one bedrock-runtime client (boto3 clients are thread-safe and
+# keep their HTTPS connections alive) and one ChatBedrock per (model, temperature)
+_client = None
+_llm_cache: Dict[Tuple[str, float], ChatBedrock] = {}
+_async_cache: Dict[Tuple[str, float], AsyncBedrockChat] = {}
+_lock = threading.RLock()
+
+
+def bedrock_client_config() -> Config:
+    """Connection pool, keepalive, timeout and retry settings of the Bedrock client."""
+    return Config(
+        region_name=settings.BEDROCK_REGION,
+        max_pool_connections=settings.BEDROCK_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=settings.BEDROCK_CONNECT_TIMEOUT,
+        read_timeout=settings.BEDROCK_READ_TIMEOUT,
+        retries={"mode": "standard", "max_attempts": settings.BEDROCK_MAX_ATTEMPTS},
+    )
+
+
+def create_bedrock_client():
     """
-    Returns a boto3 client for bedrock-runtime.
+    Builds a new boto3 client for bedrock-runtime.
+    Use get_bedrock_client() instead unless a private connection pool is really needed.
     """
-    import os
     # Prevent usage of stale session tokens from environment if using long-term keys
     if settings.AWS_ACCESS_KEY_ID and settings.AWS_ACCESS_KEY_ID.startswith("AKIA"):
         os.environ.pop("AWS_SESSION_TOKEN", None)
@@ -23,19 +54,77 @@ def get_bedrock_client():
         region_name=settings.BEDROCK_REGION,
         aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
         aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        config=bedrock_client_config(),
     )
 
+
+def get_bedrock_client():
+    """
+    Returns the shared boto3 client for bedrock-runtime (created on first use).
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = create_bedrock_client()
+    return _client
+
+
 def get_llm(model_id: str, temperature: float = 0.0):
     """
     Returns a LangChain ChatBedrock instance.
+    Instances are cached per (model_id, temperature) and share one client,
+    so repeated calls cost a dict lookup instead of a client build + TLS handshake.
     """
-    client = get_bedrock_client()
-    return ChatBedrock(
-        client=client,
-        model_id=model_id,
-        model_kwargs={
-            "temperature": temperature,
-            "max_tokens": 4096
-        },
-        region_name=settings.BEDROCK_REGION
-    )
+    key = (model_id, float(temperature))
+    llm = _llm_cache.get(key)
+    if llm is None:
+        with _lock:
+            llm = _llm_cache.get(key)
+            if llm is None:
+                llm = ChatBedrock(
+                    client=get_bedrock_client(),
+                    model_id=model_id,
+                    model_kwargs={
+                        "temperature": temperature,
+                        "max_tokens": 4096
+                    },
+                    region_name=settings.BEDROCK_REGION
+                )
+                _llm_cache[key] = llm
+    return llm
+
+
+def get_streaming_llm(model_id: str, temperature: float = 0.0):
+    """
+    Model for latency-critical streaming (`async for text in llm.astream(prompt)`).
+    The native async Bedrock client when BEDROCK_ASYNC_STREAM is on, else the
+    pooled ChatBedrock (whose chunks carry the text in `.content`).
+    """
+    if not settings.BEDROCK_ASYNC_STREAM:
+        return get_llm(model_id, temperature)
+    key = (model_id, float(temperature))
+    llm = _async_cache.get(key)
+    if llm is None:
+        llm = _async_cache.setdefault(key, AsyncBedrockChat(model_id, temperature))
+    return llm
+
+
+def cached_system_message(text: str, model_id: str) -> SystemMessage:
+    """
+    System prompt with a cache checkpoint at its end, so Bedrock reuses the
+    processed prefix across calls (plain system prompt where unsupported).
+    """
+    if settings.BEDROCK_PROMPT_CACHE and model_id in PROMPT_CACHE_MODELS:
+        return SystemMessage(content=[{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}])
+    return SystemMessage(content=text)
+
+
+def reset_llm_pool():
+    """Drops the pooled client and models (e.g. after rotating AWS credentials)."""
+    global _client
+    with _lock:
+        _client = None
+        _llm_cache.clear()
+        _async_cache.clear()
+    reset_credentials()
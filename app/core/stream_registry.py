@@ -0,0 +1,88 @@
+import asyncio
+from typing import Dict, Optional
+
+
+class StreamRegistry:
+    """
+    Process-wide registry of live SyncClient streams.
+
+    Holds one session object per connection (anything with `session_id`,
+    `user_id` and `outbox`), indexed by session id and by user, so lookup and
+    cleanup on disconnect are O(1). Any subsystem (HTTP endpoints, Kafka
+    consumers, background AI jobs) can push a ServerCommand straight to a
+    connected user without waiting for a heartbeat.
+    """
+
+    def __init__(self):
+        self._sessions: Dict[int, object] = {}
+        self._by_user: Dict[str, Dict[int, object]] = {}
+        self.total_connections = 0   # lifetime counter
+        self.dropped_commands = 0
+
+    def register(self, session):
+        self._sessions[session.session_id] = session
+        self._by_user.setdefault(session.user_id, {})[session.session_id] = session
+        self.total_connections += 1
+
+    def unregister(self, session):
+        self._sessions.pop(session.session_id, None)
+        user_sessions = self._by_user.get(session.user_id)
+        if user_sessions is None:
+            return
+        user_sessions.pop(session.session_id, None)
+        if not user_sessions:
+            del self._by_user[session.user_id]
+
+    def get(self, session_id: int) -> Optional[object]:
+        return self._sessions.get(session_id)
+
+    def sessions_for(self, user_id: str) -> list:
+        return list(self._by_user.get(user_id, {}).values())
+
+    def is_connected(self, user_id: str) -> bool:
+        return user_id in self._by_user
+
+    def push(self, user_id: str, command) -> int:
+        """
+        Pushes a ServerCommand to every live stream of `user_id`.
+        Non-blocking; returns the number of streams it was delivered to.
+        """
+        delivered = 0
+        for session in self._by_user.get(user_id, {}).values():
+            if self.offer(session.outbox, command):
+                delivered += 1
+        return delivered
+
+    def offer(self, outbox: asyncio.Queue, command) -> bool:
+        """Non-blocking put; drops the command if the client is not draining its stream."""
+        try:
+            outbox.put_nowait(command)
+            return True
+        except asyncio.QueueFull:
+            self.dropped_commands += 1
+            print(f"⚠️ [Streams] Outbox full, dropping command: {command.type}")
+            return False
+
+    def stats(self) -> dict:
+        """Connection counts for capacity planning."""
+        return {
+            "connected_users": len(self._by_user),
+            "live_streams": len(self._sessions),
+            "total_connections": self.total_connections,
+            "dropped_commands": self.dropped_commands,
+        }
+
+    def memory_stats(self) -> dict:
+        """Per-session memory accounting (sessions must implement `memory_bytes()`)."""
+        sizes = [session.memory_bytes() for session in self._sessions.values()]
+        total = sum(sizes)
+        return {
+            "sessions": len(sizes),
+            "total_bytes": total,
+            "avg_bytes_per_session": total // len(sizes) if sizes else 0,
+            "max_bytes_per_session": max(sizes) if sizes else 0,
+        }
+
+
+# Global Instance
+stream_registry = StreamRegistry()
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10proto/core.proto\x12\tjiaa.core\"\xf2\x02\n\x0f\x43lientHeartbeat\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\x16\n\x0emouse_distance\x18\x02 \x01(\x05\x12\x13\n\x0b\x63lick_count\x18\x03 \x01(\x05\x12\x17\n\x0fkeystroke_count\x18\x04 \x01(\x05\x12\x12\n\nis_os_idle\x18\x05 \x01(\x08\x12\x16\n\x0eis_eyes_closed\x18\x06 \x01(\x08\x12\x1b\n\x13\x63oncentration_score\x18\x07 \x01(\x02\x12\x18\n\x10keyboard_entropy\x18\x08 \x01(\x02\x12\x1b\n\x13\x61\x63tive_window_title\x18\t \x01(\t\x12\x13\n\x0bis_dragging\x18\n \x01(\x08\x12\x16\n\x0e\x61vg_dwell_time\x18\x0b \x01(\x01\x12\x17\n\x0fscroll_distance\x18\x0c \x01(\x05\x12\x17\n\x0f\x62\x61\x63kspace_count\x18\r \x01(\x05\x12\x14\n\x0chotkey_count\x18\x0e \x01(\x05\x12\x11\n\tapps_json\x18\x0f \x01(\t\"\xc4\x01\n\rServerCommand\x12\x32\n\x04type\x18\x01 \x01(\x0e\x32$.jiaa.core.ServerCommand.CommandType\x12\x0f\n\x07payload\x18\x02 \x01(\t\"n\n\x0b\x43ommandType\x12\x08\n\x04NONE\x10\x00\x12\x0f\n\x0bSHAKE_MOUSE\x10\x01\x12\x10\n\x0c\x42LOCK_SCREEN\x10\x02\x12\x10\n\x0cSHOW_MESSAGE\x10\x03\x12\x0e\n\nPLAY_SOUND\x10\x04\x12\x10\n\x0cKILL_PROCESS\x10\x05\"/\n\x0e\x41nalysisReport\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\"\x16\n\x03\x41\x63k\x12\x0f\n\x07success\x18\x01 \x01(\x08\"6\n\x0e\x41ppListRequest\x12\x11\n\tapps_json\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x03\"X\n\x0f\x41ppListResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x03 \x01(\t\x12\x12\n\ntarget_app\x18\x04 \x01(\t\"\x87\x01\n\x0c\x41udioRequest\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x10\n\x08is_final\x18\x02 \x01(\x08\x12\x11\n\ttimestamp\x18\x03 \x01(\x03\x12\x17\n\x0fmedia_info_json\x18\x04 \x01(\t\x12\x14\n\x0cprocess_info\x18\n \x01(\t\x12\x0f\n\x07windows\x18\x0b \x01(\t\"I\n\rAudioResponse\x12\x12\n\ntranscript\x18\x01 \x01(\t\x12\x14\n\x0cis_emergency\x18\x02 \x01(\x08\x12\x0e\n\x06intent\x18\x03 \x01(\t2\xa6\x02\n\x0b\x43oreService\x12\x46\n\nSyncClient\x12\x1a.jiaa.core.ClientHeartbeat\x1a\x18.jiaa.core.ServerCommand(\x01\x30\x01\x12\x41\n\x14ReportAnalysisResult\x12\x19.jiaa.core.AnalysisReport\x1a\x0e.jiaa.core.Ack\x12\x44\n\x0bSendAppList\x12\x19.jiaa.core.AppListRequest\x1a\x1a.jiaa.core.AppListResponse\x12\x46\n\x0fTranscribeAudio\x12\x17.jiaa.core.AudioRequest\x1a\x18.jiaa.core.AudioResponse(\x01\x42\x34\n\x14\x63om.jiaa.common.coreP\x01Z\x1ajiaa-server-core/pkg/protob\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10proto/core.proto\x12\tjiaa.core\"\x87\x03\n\x0f\x43lientHeartbeat\x12\x11\n\tclient_id\x18\x01 \x01(\t\x12\x16\n\x0emouse_distance\x18\x02 \x01(\x05\x12\x13\n\x0b\x63lick_count\x18\x03 \x01(\x05\x12\x17\n\x0fkeystroke_count\x18\x04 \x01(\x05\x12\x12\n\nis_os_idle\x18\x05 \x01(\x08\x12\x16\n\x0eis_eyes_closed\x18\x06 \x01(\x08\x12\x1b\n\x13\x63oncentration_score\x18\x07 \x01(\x02\x12\x18\n\x10keyboard_entropy\x18\x08 \x01(\x02\x12\x1b\n\x13\x61\x63tive_window_title\x18\t \x01(\t\x12\x13\n\x0bis_dragging\x18\n \x01(\x08\x12\x16\n\x0e\x61vg_dwell_time\x18\x0b \x01(\x01\x12\x17\n\x0fscroll_distance\x18\x0c \x01(\x05\x12\x17\n\x0f\x62\x61\x63kspace_count\x18\r \x01(\x05\x12\x14\n\x0chotkey_count\x18\x0e \x01(\x05\x12\x11\n\tapps_json\x18\x0f \x01(\t\x12\x13\n\x0binterval_ms\x18\x10 \x01(\x05\"\xe1\x01\n\rServerCommand\x12\x32\n\x04type\x18\x01 \x01(\x0e\x32$.jiaa.core.ServerCommand.CommandType\x12\x0f\n\x07payload\x18\x02 \x01(\t\"\x8a\x01\n\x0b\x43ommandType\x12\x08\n\x04NONE\x10\x00\x12\x0f\n\x0bSHAKE_MOUSE\x10\x01\x12\x10\n\x0c\x42LOCK_SCREEN\x10\x02\x12\x10\n\x0cSHOW_MESSAGE\x10\x03\x12\x0e\n\nPLAY_SOUND\x10\x04\x12\x10\n\x0cKILL_PROCESS\x10\x05\x12\x1a\n\x16SET_HEARTBEAT_INTERVAL\x10\x06\"/\n\x0e\x41nalysisReport\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0f\n\x07\x63ontent\x18\x02 \x01(\t\"\x16\n\x03\x41\x63k\x12\x0f\n\x07success\x18\x01 \x01(\x08\"6\n\x0e\x41ppListRequest\x12\x11\n\tapps_json\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x03\"X\n\x0f\x41ppListResponse\x12\x0f\n\x07success\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x03 \x01(\t\x12\x12\n\ntarget_app\x18\x04 \x01(\t\"\x87\x01\n\x0c\x41udioRequest\x12\x12\n\naudio_data\x18\x01 \x01(\x0c\x12\x10\n\x08is_final\x18\x02 \x01(\x08\x12\x11\n\ttimestamp\x18\x03 \x01(\x03\x12\x17\n\x0fmedia_info_json\x18\x04 \x01(\t\x12\x14\n\x0cprocess_info\x18\n \x01(\t\x12\x0f\n\x07windows\x18\x0b \x01(\t\"I\n\rAudioResponse\x12\x12\n\ntranscript\x18\x01 \x01(\t\x12\x14\n\x0cis_emergency\x18\x02 \x01(\x08\x12\x0e\n\x06intent\x18\x03 \x01(\t2\xa6\x02\n\x0b\x43oreService\x12\x46\n\nSyncClient\x12\x1a.jiaa.core.ClientHeartbeat\x1a\x18.jiaa.core.ServerCommand(\x01\x30\x01\x12\x41\n\x14ReportAnalysisResult\x12\x19.jiaa.core.AnalysisReport\x1a\x0e.jiaa.core.Ack\x12\x44\n\x0bSendAppList\x12\x19.jiaa.core.AppListRequest\x1a\x1a.jiaa.core.AppListResponse\x12\x46\n\x0fTranscribeAudio\x12\x17.jiaa.core.AudioRequest\x1a\x18.jiaa.core.AudioResponse(\x01\x42\x34\n\x14\x63om.jiaa.common.coreP\x01Z\x1ajiaa-server-core/pkg/protob\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -33,23 +33,23 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['DESCRIPTOR']._loaded_options = None
   _globals['DESCRIPTOR']._serialized_options = b'\n\024com.jiaa.common.coreP\001Z\032jiaa-server-core/pkg/proto'
   _globals['_CLIENTHEARTBEAT']._serialized_start=32
-  _globals['_CLIENTHEARTBEAT']._serialized_end=402
-  _globals['_SERVERCOMMAND']._serialized_start=405
-  _globals['_SERVERCOMMAND']._serialized_end=601
-  _globals['_SERVERCOMMAND_COMMANDTYPE']._serialized_start=491
-  _globals['_SERVERCOMMAND_COMMANDTYPE']._serialized_end=601
-  _globals['_ANALYSISREPORT']._serialized_start=603
-  _globals['_ANALYSISREPORT']._serialized_end=650
-  _globals['_ACK']._serialized_start=652
-  _globals['_ACK']._serialized_end=674
-  _globals['_APPLISTREQUEST']._serialized_start=676
-  _globals['_APPLISTREQUEST']._serialized_end=730
-  _globals['_APPLISTRESPONSE']._serialized_start=732
-  _globals['_APPLISTRESPONSE']._serialized_end=820
-  _globals['_AUDIOREQUEST']._serialized_start=823
-  _globals['_AUDIOREQUEST']._serialized_end=958
-  _globals['_AUDIORESPONSE']._serialized_start=960
-  _globals['_AUDIORESPONSE']._serialized_end=1033
-  _globals['_CORESERVICE']._serialized_start=1036
-  _globals['_CORESERVICE']._serialized_end=1330
+  _globals['_CLIENTHEARTBEAT']._serialized_end=423
+  _globals['_SERVERCOMMAND']._serialized_start=426
+  _globals['_SERVERCOMMAND']._serialized_end=651
+  _globals['_SERVERCOMMAND_COMMANDTYPE']._serialized_start=513
+  _globals['_SERVERCOMMAND_COMMANDTYPE']._serialized_end=651
+  _globals['_ANALYSISREPORT']._serialized_start=653
+  _globals['_ANALYSISREPORT']._serialized_end=700
+  _globals['_ACK']._serialized_start=702
+  _globals['_ACK']._serialized_end=724
+  _globals['_APPLISTREQUEST']._serialized_start=726
+  _globals['_APPLISTREQUEST']._serialized_end=780
+  _globals['_APPLISTRESPONSE']._serialized_start=782
+  _globals['_APPLISTRESPONSE']._serialized_end=870
+  _globals['_AUDIOREQUEST']._serialized_start=873
+  _globals['_AUDIOREQUEST']._serialized_end=1008
+  _globals['_AUDIORESPONSE']._serialized_start=1010
+  _globals['_AUDIORESPONSE']._serialized_end=1083
+  _globals['_CORESERVICE']._serialized_start=1086
+  _globals['_CORESERVICE']._serialized_end=1380
 # @@protoc_insertion_point(module_scope)
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18\x61pp/protos/text_ai.proto\x12\tjiaa.text\" \n\x0bGoalRequest\x12\x11\n\tgoal_text\x18\x01 \x01(\t\" \n\x0cGoalResponse\x12\x10\n\x08subgoals\x18\x01 \x03(\t\".\n\x0b\x43hatRequest\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x11\n\tclient_id\x18\x02 \x01(\t\"~\n\x0c\x43hatResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0e\n\x06intent\x18\x02 \x01(\t\x12\x13\n\x0b\x61\x63tion_code\x18\x03 \x01(\t\x12\x15\n\raction_detail\x18\x04 \x01(\t\x12\x0f\n\x07\x65motion\x18\x05 \x01(\t\x12\x10\n\x08judgment\x18\x06 \x01(\t\"0\n\x0bQuizRequest\x12\r\n\x05topic\x18\x01 \x01(\t\x12\x12\n\ndifficulty\x18\x02 \x01(\t\"R\n\x08QuizItem\x12\x10\n\x08question\x18\x01 \x01(\t\x12\x0f\n\x07options\x18\x02 \x03(\t\x12\x0e\n\x06\x61nswer\x18\x03 \x01(\t\x12\x13\n\x0b\x65xplanation\x18\x04 \x01(\t\"D\n\x0bSubgoalQuiz\x12\x0f\n\x07subgoal\x18\x01 \x01(\t\x12$\n\x07quizzes\x18\x02 \x03(\x0b\x32\x13.jiaa.text.QuizItem\"5\n\x0cQuizResponse\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.jiaa.text.SubgoalQuiz2\xce\x01\n\rTextAIService\x12\x43\n\x10GenerateSubgoals\x12\x16.jiaa.text.GoalRequest\x1a\x17.jiaa.text.GoalResponse\x12\x37\n\x04\x43hat\x12\x16.jiaa.text.ChatRequest\x1a\x17.jiaa.text.ChatResponse\x12?\n\x0cGenerateQuiz\x12\x16.jiaa.text.QuizRequest\x1a\x17.jiaa.text.QuizResponseB\x11\n\rcom.jiaa.textP\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18\x61pp/protos/text_ai.proto\x12\tjiaa.text\" \n\x0bGoalRequest\x12\x11\n\tgoal_text\x18\x01 \x01(\t\" \n\x0cGoalResponse\x12\x10\n\x08subgoals\x18\x01 \x03(\t\".\n\x0b\x43hatRequest\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x11\n\tclient_id\x18\x02 \x01(\t\"~\n\x0c\x43hatResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x0e\n\x06intent\x18\x02 \x01(\t\x12\x13\n\x0b\x61\x63tion_code\x18\x03 \x01(\t\x12\x15\n\raction_detail\x18\x04 \x01(\t\x12\x0f\n\x07\x65motion\x18\x05 \x01(\t\x12\x10\n\x08judgment\x18\x06 \x01(\t\"\xc2\x01\n\x12\x43hatStreamResponse\x12\x12\n\ntext_chunk\x18\x01 \x01(\t\x12\x13\n\x0bis_complete\x18\x02 \x01(\x08\x12\x13\n\x0b\x63hunk_index\x18\x03 \x01(\x05\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x0e\n\x06intent\x18\x05 \x01(\t\x12\x13\n\x0b\x61\x63tion_code\x18\x06 \x01(\t\x12\x15\n\raction_detail\x18\x07 \x01(\t\x12\x0f\n\x07\x65motion\x18\x08 \x01(\t\x12\x10\n\x08judgment\x18\t \x01(\t\"0\n\x0bQuizRequest\x12\r\n\x05topic\x18\x01 \x01(\t\x12\x12\n\ndifficulty\x18\x02 \x01(\t\"R\n\x08QuizItem\x12\x10\n\x08question\x18\x01 \x01(\t\x12\x0f\n\x07options\x18\x02 \x03(\t\x12\x0e\n\x06\x61nswer\x18\x03 \x01(\t\x12\x13\n\x0b\x65xplanation\x18\x04 \x01(\t\"D\n\x0bSubgoalQuiz\x12\x0f\n\x07subgoal\x18\x01 \x01(\t\x12$\n\x07quizzes\x18\x02 \x03(\x0b\x32\x13.jiaa.text.QuizItem\"5\n\x0cQuizResponse\x12%\n\x05items\x18\x01 \x03(\x0b\x32\x16.jiaa.text.SubgoalQuiz2\x95\x02\n\rTextAIService\x12\x43\n\x10GenerateSubgoals\x12\x16.jiaa.text.GoalRequest\x1a\x17.jiaa.text.GoalResponse\x12\x37\n\x04\x43hat\x12\x16.jiaa.text.ChatRequest\x1a\x17.jiaa.text.ChatResponse\x12\x45\n\nChatStream\x12\x16.jiaa.text.ChatRequest\x1a\x1d.jiaa.text.ChatStreamResponse0\x01\x12?\n\x0cGenerateQuiz\x12\x16.jiaa.text.QuizRequest\x1a\x17.jiaa.text.QuizResponseB\x11\n\rcom.jiaa.textP\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -40,14 +40,16 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_CHATREQUEST']._serialized_end=153
   _globals['_CHATRESPONSE']._serialized_start=155
   _globals['_CHATRESPONSE']._serialized_end=281
-  _globals['_QUIZREQUEST']._serialized_start=283
-  _globals['_QUIZREQUEST']._serialized_end=331
-  _globals['_QUIZITEM']._serialized_start=333
-  _globals['_QUIZITEM']._serialized_end=415
-  _globals['_SUBGOALQUIZ']._serialized_start=417
-  _globals['_SUBGOALQUIZ']._serialized_end=485
-  _globals['_QUIZRESPONSE']._serialized_start=487
-  _globals['_QUIZRESPONSE']._serialized_end=540
-  _globals['_TEXTAISERVICE']._serialized_start=543
-  _globals['_TEXTAISERVICE']._serialized_end=749
+  _globals['_CHATSTREAMRESPONSE']._serialized_start=284
+  _globals['_CHATSTREAMRESPONSE']._serialized_end=478
+  _globals['_QUIZREQUEST']._serialized_start=480
+  _globals['_QUIZREQUEST']._serialized_end=528
+  _globals['_QUIZITEM']._serialized_start=530
+  _globals['_QUIZITEM']._serialized_end=612
+  _globals['_SUBGOALQUIZ']._serialized_start=614
+  _globals['_SUBGOALQUIZ']._serialized_end=682
+  _globals['_QUIZRESPONSE']._serialized_start=684
+  _globals['_QUIZRESPONSE']._serialized_end=737
+  _globals['_TEXTAISERVICE']._serialized_start=740
+  _globals['_TEXTAISERVICE']._serialized_end=1017
 # @@protoc_insertion_point(module_scope)
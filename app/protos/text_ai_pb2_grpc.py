@@ -45,6 +45,11 @@ class TextAIServiceStub(object):
                 request_serializer=app_dot_protos_dot_text__ai__pb2.ChatRequest.SerializeToString,
                 response_deserializer=app_dot_protos_dot_text__ai__pb2.ChatResponse.FromString,
                 _registered_method=True)
+        self.ChatStream = channel.unary_stream(
+                '/jiaa.text.TextAIService/ChatStream',
+                request_serializer=app_dot_protos_dot_text__ai__pb2.ChatRequest.SerializeToString,
+                response_deserializer=app_dot_protos_dot_text__ai__pb2.ChatStreamResponse.FromString,
+                _registered_method=True)
         self.GenerateQuiz = channel.unary_unary(
                 '/jiaa.text.TextAIService/GenerateQuiz',
                 request_serializer=app_dot_protos_dot_text__ai__pb2.QuizRequest.SerializeToString,
@@ -70,6 +75,13 @@ class TextAIServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def ChatStream(self, request, context):
+        """Streaming Chat with Persona: reply text chunks first, intent last ("Text First, JSON Last")
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GenerateQuiz(self, request, context):
         """Generate Technical Quiz
         """
@@ -90,6 +102,11 @@ def add_TextAIServiceServicer_to_server(servicer, server):
                     request_deserializer=app_dot_protos_dot_text__ai__pb2.ChatRequest.FromString,
                     response_serializer=app_dot_protos_dot_text__ai__pb2.ChatResponse.SerializeToString,
             ),
+            'ChatStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.ChatStream,
+                    request_deserializer=app_dot_protos_dot_text__ai__pb2.ChatRequest.FromString,
+                    response_serializer=app_dot_protos_dot_text__ai__pb2.ChatStreamResponse.SerializeToString,
+            ),
             'GenerateQuiz': grpc.unary_unary_rpc_method_handler(
                     servicer.GenerateQuiz,
                     request_deserializer=app_dot_protos_dot_text__ai__pb2.QuizRequest.FromString,
@@ -161,6 +178,33 @@ class TextAIService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def ChatStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/jiaa.text.TextAIService/ChatStream',
+            app_dot_protos_dot_text__ai__pb2.ChatRequest.SerializeToString,
+            app_dot_protos_dot_text__ai__pb2.ChatStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GenerateQuiz(request,
             target,
@@ -61,6 +61,7 @@ class QuizGenerateRequest(BaseModel):
 # STT
 class STTResponse(BaseModel):
     text: str
+    audio_level: Optional[float] = None  # speech RMS in dB (VAD), raw PCM only
 
 # Chat
 class ChatRequest(BaseModel):
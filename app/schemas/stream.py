@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+
+
+class StreamPushRequest(BaseModel):
+    """연결된 SyncClient 스트림으로 ServerCommand 푸시 요청"""
+    user_id: str
+    type: str = Field(..., description="ServerCommand.CommandType name (e.g. SHOW_MESSAGE, KILL_PROCESS)")
+    payload: str = ""
+
+class StreamPushResponse(BaseModel):
+    """푸시 결과"""
+    user_id: str
+    delivered: int  # 전달된 스트림 수 (0 = 연결 없음)
+
+class StreamStatsResponse(BaseModel):
+    """SyncClient 연결 현황 (용량 계획용)"""
+    connected_users: int
+    live_streams: int
+    total_connections: int
+    dropped_commands: int
+
+class StreamMemoryResponse(BaseModel):
+    """SyncClient 세션 메모리 사용량 (세션당 바이트)"""
+    sessions: int
+    total_bytes: int
+    avg_bytes_per_session: int
+    max_bytes_per_session: int
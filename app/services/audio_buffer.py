@@ -0,0 +1,293 @@
+import asyncio
+import io
+import mmap
+import struct
+import tempfile
+import time
+from typing import AsyncIterator, Callable, Optional, Tuple, TypeVar
+
+WAV_HEADER_BYTES = 44
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+_WAV_CHUNK = struct.Struct('<4sI')
+_WAV_FMT = struct.Struct('<HHIIHH')
+
+T = TypeVar("T")
+
+
+def strip_wav_header(data: bytes) -> bytes:
+    """Returns the PCM payload of a WAV chunk (anything up to the 'data' subchunk is dropped)."""
+    idx = data.find(b'data', 12)
+    return data[idx + 8:] if idx >= 0 else data[WAV_HEADER_BYTES:]
+
+
+def wav_format(data: bytes) -> Optional[Tuple[int, int, int]]:
+    """
+    (sample_rate, channels, bits_per_sample) from the 'fmt ' chunk of a WAV header,
+    None if the chunk is missing (or cut off).
+    """
+    pos = 12
+    while pos + _WAV_CHUNK.size <= len(data):
+        chunk_id, chunk_size = _WAV_CHUNK.unpack_from(data, pos)
+        pos += _WAV_CHUNK.size
+        if chunk_id == b'data':
+            return None
+        if chunk_id == b'fmt ':
+            if pos + _WAV_FMT.size > len(data):
+                return None
+            _, channels, sample_rate, _, _, bits_per_sample = _WAV_FMT.unpack_from(data, pos)
+            return sample_rate, channels, bits_per_sample
+        pos += chunk_size + chunk_size % 2
+    return None
+
+
+class AudioLimitExceeded(Exception):
+    """A voice stream went past its byte or duration cap (reported as gRPC RESOURCE_EXHAUSTED)."""
+
+
+class UnsupportedAudioFormat(Exception):
+    """A client WAV header announces a format other than the buffer's (reported as gRPC INVALID_ARGUMENT)."""
+
+
+class AudioStreamLimits:
+    """
+    Per-stream caps on received audio: `max_bytes` of payload and `max_seconds`
+    of wall-clock time the stream may stay open (0 disables a cap). The time cap
+    also fires while the client stalls without sending anything.
+    """
+
+    __slots__ = ("max_bytes", "max_seconds", "started_at", "received")
+
+    def __init__(self, max_bytes: int = 0, max_seconds: float = 0):
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+        self.started_at = time.monotonic()
+        self.received = 0
+
+    def add(self, nbytes: int):
+        self.received += nbytes
+        if self.max_bytes and self.received > self.max_bytes:
+            raise AudioLimitExceeded(f"audio stream exceeds {self.max_bytes} bytes")
+
+    def remaining_seconds(self) -> Optional[float]:
+        if not self.max_seconds:
+            return None
+        return self.max_seconds - (time.monotonic() - self.started_at)
+
+    async def guard(self, request_iterator: AsyncIterator[T], size: Callable[[T], int] = lambda r: len(r.audio_data)) -> AsyncIterator[T]:
+        """Relays the request stream, raising AudioLimitExceeded as soon as a cap is passed."""
+        iterator = request_iterator.__aiter__()
+        while True:
+            remaining = self.remaining_seconds()
+            if remaining is not None and remaining <= 0:
+                raise AudioLimitExceeded(f"audio stream open longer than {self.max_seconds:.0f}s")
+            try:
+                request = await asyncio.wait_for(iterator.__anext__(), remaining)
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError:
+                raise AudioLimitExceeded(f"audio stream open longer than {self.max_seconds:.0f}s") from None
+            self.add(size(request))
+            yield request
+
+
+class AudioBuffer:
+    """
+    Growable PCM buffer that is already a WAV file.
+
+    The first 44 bytes are reserved for the RIFF header, which is filled in
+    place when the buffer is handed out, so streaming chunks are copied once
+    (into the buffer) and the upload reads straight out of it: no bytes(),
+    no header + PCM concatenation, no BytesIO copy.
+
+    With `spool_bytes`, audio past that size moves to an mmap-ed temp file, so
+    long utterances live in the page cache instead of the Python heap. Views
+    work the same either way.
+    """
+
+    __slots__ = ("_buf", "_size", "_spool", "spool_bytes", "sample_rate", "channels", "bits_per_sample")
+
+    def __init__(self, sample_rate: int = 16000, channels: int = 1, bits_per_sample: int = 16, spool_bytes: int = 0):
+        self._buf = bytearray(WAV_HEADER_BYTES)  # bytearray, or an mmap once spooled
+        self._size = WAV_HEADER_BYTES            # bytes of _buf in use (header included)
+        self._spool = None                       # temp file behind the mmap
+        self.spool_bytes = spool_bytes           # 0 = always in memory
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.bits_per_sample = bits_per_sample
+
+    @classmethod
+    def from_pcm(cls, pcm: bytes, **kwargs) -> "AudioBuffer":
+        buffer = cls(**kwargs)
+        buffer.extend(pcm)
+        return buffer
+
+    def extend(self, data: bytes):
+        """
+        Appends a chunk. A client-sent WAV header on the first chunk is dropped (ours is
+        rebuilt), after checking that its 'fmt ' chunk matches the buffer's format:
+        VAD, segmenting and encoding all assume it, so other WAVs raise UnsupportedAudioFormat.
+        """
+        if not data:
+            return
+        if self._size == WAV_HEADER_BYTES and data[:4] == b'RIFF':
+            fmt = wav_format(data)
+            if fmt is not None and fmt != (self.sample_rate, self.channels, self.bits_per_sample):
+                rate, channels, bits = fmt
+                raise UnsupportedAudioFormat(
+                    f"WAV must be {self.sample_rate} Hz, {self.channels} channel(s), {self.bits_per_sample}-bit PCM "
+                    f"(got {rate} Hz, {channels} channel(s), {bits}-bit)"
+                )
+            data = strip_wav_header(data)
+        self._append(data)
+
+    def _append(self, data):
+        end = self._size + len(data)
+        if self._spool is None and self.spool_bytes and end - WAV_HEADER_BYTES > self.spool_bytes:
+            self._spill(end)
+        if self._spool is None:
+            self._buf += data
+        else:
+            if end > len(self._buf):
+                self._buf.resize(max(end, 2 * len(self._buf)))
+            self._buf[self._size:end] = data
+        self._size = end
+
+    def _spill(self, capacity: int):
+        """Moves the buffer into an (already unlinked) temp file mapped into memory."""
+        spool = tempfile.TemporaryFile(prefix="voice-")
+        spool.truncate(max(capacity, 2 * self._size))
+        mapped = mmap.mmap(spool.fileno(), 0)
+        mapped[:self._size] = self._buf
+        self._buf, self._spool = mapped, spool
+        print(f"💾 [Audio] Spooling stream to disk past {self.spool_bytes // 1024}KB")
+
+    def _truncate(self, end: int):
+        if self._spool is None:
+            del self._buf[end:]
+        self._size = min(end, self._size)
+
+    @property
+    def spooled(self) -> bool:
+        return self._spool is not None
+
+    def __len__(self) -> int:
+        """PCM bytes (header excluded)."""
+        return self._size - WAV_HEADER_BYTES
+
+    @property
+    def bytes_per_second(self) -> int:
+        return self.sample_rate * self.channels * self.bits_per_sample // 8
+
+    @property
+    def duration_seconds(self) -> float:
+        return len(self) / self.bytes_per_second
+
+    def pcm(self) -> memoryview:
+        """
+        Read-only view of the PCM samples.
+        Release it (or let it go out of scope) before calling extend()/split() again.
+        """
+        return memoryview(self._buf)[WAV_HEADER_BYTES:self._size].toreadonly()
+
+    def split(self, at: int, overlap: int = 0) -> "AudioBuffer":
+        """
+        Truncates this buffer in place at PCM byte `at` and returns a new buffer with
+        the rest (plus the last `overlap` bytes before the cut). Only the rest is copied.
+        """
+        at -= at % 2
+        start = max(0, at - overlap + overlap % 2)
+        rest = AudioBuffer(self.sample_rate, self.channels, self.bits_per_sample, self.spool_bytes)
+        with memoryview(self._buf) as view:
+            rest._append(view[WAV_HEADER_BYTES + start:self._size])
+        self._truncate(WAV_HEADER_BYTES + at)
+        return rest
+
+    def trim(self, start: int, end: int):
+        """Keeps PCM bytes [start, end) in place (no new buffer)."""
+        self._truncate(WAV_HEADER_BYTES + end - end % 2)
+        start = min(start - start % 2, len(self))
+        if self._spool is None:
+            del self._buf[WAV_HEADER_BYTES:WAV_HEADER_BYTES + start]
+        else:
+            self._buf.move(WAV_HEADER_BYTES, WAV_HEADER_BYTES + start, len(self) - start)
+        self._size -= start
+
+    def clear(self):
+        self._truncate(WAV_HEADER_BYTES)
+
+    def close(self):
+        """Drops a disk spool right away (otherwise it goes with the buffer). Views must be released."""
+        if self._spool is None:
+            return
+        try:
+            self._buf.close()
+        except BufferError:
+            return  # an upload still reads from it; the GC closes it afterwards
+        self._spool.close()
+        self._buf, self._spool, self._size = bytearray(WAV_HEADER_BYTES), None, WAV_HEADER_BYTES
+
+    def wav(self) -> memoryview:
+        """Fills in the RIFF header and returns a read-only view of the complete WAV file."""
+        data_size = len(self)
+        block_align = self.channels * self.bits_per_sample // 8
+        _WAV_HEADER.pack_into(
+            self._buf, 0,
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, self.channels, self.sample_rate,
+            self.bytes_per_second, block_align, self.bits_per_sample,
+            b'data', data_size
+        )
+        return memoryview(self._buf)[:self._size].toreadonly()
+
+    def as_file(self, name: str = "voice.wav") -> "MemoryFile":
+        """WAV file object for upload clients (Groq/OpenAI need a `name`)."""
+        return MemoryFile(self.wav(), name)
+
+
+class MemoryFile(io.RawIOBase):
+    """Read-only, seekable file over a memoryview (io.BytesIO would copy it)."""
+
+    def __init__(self, view: memoryview, name: str):
+        super().__init__()
+        self._view = view
+        self._pos = 0
+        self.name = name
+
+    @property
+    def size(self) -> int:
+        return self._view.nbytes
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else min(len(self._view), self._pos + size)
+        chunk = self._view[self._pos:end].tobytes()
+        self._pos = max(self._pos, end)
+        return chunk
+
+    def readinto(self, b) -> int:
+        chunk = self._view[self._pos:self._pos + len(b)]
+        n = len(chunk)
+        b[:n] = chunk
+        self._pos += n
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._view.release()
+        super().close()
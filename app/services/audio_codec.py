@@ -0,0 +1,50 @@
+import io
+from typing import Tuple
+
+import numpy as np
+
+from app.services.audio_buffer import AudioBuffer, MemoryFile
+
+# Upload formats for Whisper, smallest CPU cost first:
+#   wav  - no encoding, 32 KB per second of speech
+#   flac - lossless, ~40-60% of WAV for speech, <1ms per second of audio
+#   opus - lossy (Ogg/Opus), ~8x smaller than WAV, but ~50ms CPU per second of audio
+UPLOAD_FORMATS = ("wav", "flac", "opus")
+
+# libsndfile compression level 0.0 (fastest / highest bitrate) ~ 1.0 (smallest)
+FLAC_COMPRESSION = 0.6
+OPUS_COMPRESSION = 0.9    # ~32 kbps, transparent enough for Whisper
+
+_SOUNDFILE_FORMATS = {
+    "flac": ("FLAC", "PCM_16", FLAC_COMPRESSION),
+    "opus": ("OGG", "OPUS", OPUS_COMPRESSION),
+}
+
+try:
+    import soundfile
+except (ImportError, OSError):  # OSError: wheel present but libsndfile missing
+    soundfile = None
+    print("⚠️ [STT] soundfile not available. Audio uploads fall back to WAV.")
+
+
+def encode(buffer: AudioBuffer, upload_format: str = "flac") -> Tuple[MemoryFile, str]:
+    """
+    Encodes 16-bit PCM for upload. Returns (file object, extension).
+    CPU-bound: call it through asyncio.to_thread (libsndfile releases the GIL).
+    Unknown formats or a missing codec fall back to the zero-copy WAV file.
+    """
+    spec = _SOUNDFILE_FORMATS.get(upload_format)
+    if spec is None or soundfile is None:
+        return buffer.as_file("voice.wav"), "wav"
+
+    container, subtype, compression = spec
+    out = io.BytesIO()
+    with buffer.pcm() as pcm:
+        samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, buffer.channels)
+        soundfile.write(out, samples, buffer.sample_rate, subtype=subtype, format=container,
+                        compression_level=compression)
+        del samples
+
+    ext = "ogg" if container == "OGG" else "flac"
+    # getbuffer() exposes BytesIO's storage without another copy
+    return MemoryFile(out.getbuffer(), f"voice.{ext}"), ext
@@ -0,0 +1,84 @@
+from typing import Iterable, Optional, Tuple
+
+
+class BlacklistMatcher:
+    """
+    Case-insensitive multi-pattern substring matcher (Aho-Corasick).
+
+    Built once per blacklist version and shared by every SyncClient stream.
+    A scan costs one pass over the characters of each app name, regardless of
+    how many blacklist entries the admin page holds.
+    """
+
+    __slots__ = ("patterns", "_goto", "_fail", "_out")
+
+    def __init__(self, patterns: Iterable[str]):
+        # Keep the original spelling for logging / equality checks; empty
+        # entries would match every app, so they are dropped.
+        self.patterns: Tuple[str, ...] = tuple(p for p in patterns if p)
+
+        self._goto = [{}]   # state -> {char: next_state}
+        self._fail = [0]    # state -> failure link
+        self._out = [-1]    # state -> index of a pattern ending here (-1 = none)
+
+        for idx, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern.lower():
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(-1)
+                state = nxt
+            if self._out[state] < 0:
+                self._out[state] = idx
+
+        # BFS to build failure links. Outputs are inherited along the failure
+        # chain so `match` can stop at the first state that reports one.
+        queue = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                link = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = link if link != nxt else 0
+                if self._out[nxt] < 0:
+                    self._out[nxt] = self._out[self._fail[nxt]]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def match(self, text: str) -> Optional[str]:
+        """
+        Returns the first blacklist entry found inside `text`, or None.
+        """
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        state = 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state] >= 0:
+                return self.patterns[out[state]]
+        return None
+
+    def find(self, apps: Iterable[str]) -> Optional[str]:
+        """
+        Returns the first app whose name contains a blacklist entry, or None.
+        Same semantics as the old nested `bad.lower() in app.lower()` loop.
+        """
+        if not self.patterns:
+            return None
+        for app in apps:
+            if isinstance(app, str) and self.match(app) is not None:
+                return app
+        return None
@@ -0,0 +1,93 @@
+import asyncio
+import random
+from typing import Optional
+
+import httpx
+
+from app.services.blacklist_matcher import BlacklistMatcher
+
+# Internal Cluster URL for Data Service (Admin Page blacklist)
+BLACKLIST_URL = "http://jiaa-server-data.jiaa.svc.cluster.local:8082/api/v1/blacklist"
+REFRESH_INTERVAL = 60  # seconds
+REFRESH_JITTER = 10    # seconds, spreads pods so they don't poll in lockstep
+
+# Fallback when the Data Service is unreachable
+DEFAULT_BLACKLIST = ["Overwatch", "MapleStory", "Destiny", "Battle.net", "Steam", "League of Legends", "Riot Client"]
+
+
+class BlacklistRefresher:
+    """
+    Process-wide blacklist snapshot, refreshed by one background task.
+
+    SyncClient streams only read `matcher`, an immutable BlacklistMatcher that
+    is swapped in a single assignment. The fetch uses a persistent HTTP client
+    and ETag / If-None-Match, so reconnect storms never reach the Data Service.
+    """
+
+    def __init__(self, url: str = BLACKLIST_URL, interval: float = REFRESH_INTERVAL):
+        self.url = url
+        self.interval = interval
+        self.matcher = BlacklistMatcher(DEFAULT_BLACKLIST)
+        self.etag: Optional[str] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Fetches once, then keeps refreshing in the background."""
+        if self._task is not None:
+            return
+        self._client = httpx.AsyncClient(timeout=2.0)
+        await self.refresh()
+        self._task = asyncio.create_task(self._run())
+        print(f"✅ [Blacklist] Refresher started ({len(self.matcher)} items)")
+
+    async def stop(self):
+        """Stops the refresh task and closes its HTTP client (server shutdown)."""
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            await asyncio.wait({task})
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval + random.uniform(0, REFRESH_JITTER))
+            await self.refresh()
+
+    async def refresh(self) -> bool:
+        """
+        Conditional GET of the blacklist. Returns True if a new snapshot was swapped in.
+        """
+        if self._client is None:
+            return False
+
+        headers = {"If-None-Match": self.etag} if self.etag else {}
+        try:
+            resp = await self._client.get(self.url, headers=headers)
+            if resp.status_code == 304:
+                return False
+            if resp.status_code != 200:
+                print(f"⚠️ [Blacklist] Fetch failed: {resp.status_code}")
+                return False
+
+            data = resp.json().get("data", [])
+            # Extract appName from list of objects
+            new_list = [item["appName"] for item in data if item.get("appName")]
+            self.etag = resp.headers.get("ETag")
+
+            # Keep the current snapshot on empty responses or if nothing changed
+            if not new_list or tuple(new_list) == self.matcher.patterns:
+                return False
+
+            self.matcher = BlacklistMatcher(new_list)
+            print(f"🔄 [Blacklist] Updated: {len(new_list)} items")
+            return True
+        except Exception as e:
+            print(f"⚠️ [Blacklist] Failed to fetch blacklist: {e}")
+            return False
+
+
+# Global Instance
+blacklist_refresher = BlacklistRefresher()
@@ -1,27 +1,85 @@
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.prompts import PromptTemplate
-from app.core.llm import get_llm, HAIKU_MODEL_ID
+from app.core.config import get_settings
+from app.core.llm import get_llm, get_streaming_llm, cached_system_message, HAIKU_MODEL_ID
 from app.schemas.intelligence import ChatRequest, ChatResponse
 from app.schemas.game import GameDetectRequest
 from app.services.memory_service import memory_service
 from app.services import game_detector
+from app.services.persona_prompt import PERSONA_SINGLE_PROMPT, PERSONA_SYSTEM_PROMPT
+from app.services.intent_stream import IntentStreamParser
+from app.services.command_router import command_router
+from app.services.tts_segmenter import TTSSegmenter, iterate_with_timer
 import re
 import json
 import asyncio
-from typing import AsyncGenerator, Tuple
+import contextlib
+from typing import AsyncGenerator, Optional, Tuple
 
 
 from app.services.statistic_service import statistic_service
 
 
+# [Prompt Caching] chat_with_persona sends its static rules as a cached system block
+def persona_system_message(model_id: str) -> SystemMessage:
+    return cached_system_message(PERSONA_SYSTEM_PROMPT, model_id)
+
+
+def format_usage(message) -> str:
+    """'in 812 (cache read 2105, write 0) / out 64' from a Bedrock response's usage metadata."""
+    usage = getattr(message, "usage_metadata", None)
+    if not usage:
+        return "usage n/a"
+    details = usage.get("input_token_details") or {}
+    return (f"in {usage.get('input_tokens', 0)} (cache read {details.get('cache_read', 0)}, "
+            f"write {details.get('cache_creation', 0)}) / out {usage.get('output_tokens', 0)}")
+
+
+# [Command Router] Plain commands are answered by rules: no prompt, no LLM call
+def route_command(request: ChatRequest) -> Optional[dict]:
+    if not get_settings().COMMAND_ROUTER:
+        return None
+    routed = command_router.route(request.text)
+    if routed is not None:
+        print(f"⚡ [Router] {routed['action_code']} {routed['action_detail']} (LLM skipped)")
+    return routed
+
+
+async def generate_note(data: dict) -> dict:
+    """GENERATE_NOTE -> WRITE_FILE with the markdown note as the message."""
+    topic = data.get("action_detail") or "Summary"
+    print(f"DEBUG: Generating Note for topic: {topic}")
+    
+    # Generate Content
+    markdown_content = await memory_service.get_recent_summary_markdown(topic)
+    
+    # Mutate Response to WRITE_FILE for Client
+    data["action_code"] = "WRITE_FILE"
+    valid_filename = f"{topic.replace(' ', '_')}_Note.md"
+    data["action_detail"] = valid_filename
+    data["message"] = markdown_content
+    return data
+
+
+async def apply_action_hooks(data: dict) -> dict:
+    """Server-side actions of a reply intent, shared by unary and streamed chat (GENERATE_NOTE -> WRITE_FILE)."""
+    if data.get("action_code") == "GENERATE_NOTE":
+        data = await generate_note(data)
+    return data
+
+
 # =============================================================================
 # [Highway AI] Streaming Chat Implementation
 # =============================================================================
 
-async def chat_with_persona_stream(request: ChatRequest) -> AsyncGenerator[Tuple[str, bool, dict], None]:
+async def chat_with_persona_stream(request: ChatRequest, context: Optional[asyncio.Future] = None) -> AsyncGenerator[Tuple[str, bool, dict], None]:
     """
     Streaming version of chat_with_persona.
     Yields (text_chunk, is_complete, metadata) tuples.
     
+    context: optional task resolving to a prefetched VoiceContext (trust score,
+    stats, recent violations), started by the caller while STT was running.
+    
     - is_complete=False: Partial text for TTS playback
     - is_complete=True: Final chunk with full intent/command JSON
     
@@ -30,22 +88,49 @@ async def chat_with_persona_stream(request: ChatRequest) -> AsyncGenerator[Tuple
     """
     import time
     
-    llm = get_llm(model_id=HAIKU_MODEL_ID, temperature=0.1)
+    routed = route_command(request)
+    if routed is not None:
+        yield (routed["message"], False, {"emotion": routed["emotion"], "chunk_index": 0})
+        yield ("", True, {k: v for k, v in routed.items() if k != "message"})
+        return
+    
+    llm = get_streaming_llm(model_id=HAIKU_MODEL_ID, temperature=0.1)
     
     # Get context (simplified, non-blocking with very short timeout)
     memory_context = ""
     trust_score = 50  # Default mid-trust
+    prefetched = None
+    
+    # Only the query-dependent search starts now; the rest was prefetched during STT
+    memory_task = asyncio.ensure_future(asyncio.to_thread(memory_service.get_user_context, request.text))
+    if context is not None:
+        try:
+            prefetched = await asyncio.wait_for(asyncio.shield(context), timeout=0.3)
+            trust_score = prefetched.trust_score
+        except Exception:
+            pass  # Use defaults if the prefetch isn't done
+    else:
+        try:
+            trust_score = await asyncio.wait_for(asyncio.to_thread(memory_service.get_trust_score, request.user_id), timeout=0.3)
+        except Exception:
+            pass
     
     try:
         # Quick context fetch (300ms timeout for streaming responsiveness)
-        async def quick_memory():
-            return memory_service.get_user_context(request.text)
-        
-        memory_context = await asyncio.wait_for(quick_memory(), timeout=0.3)
-        trust_score = memory_service.get_trust_score(request.user_id)
+        memory_context = await asyncio.wait_for(memory_task, timeout=0.3)
     except Exception:
         pass  # Use defaults if timeout
     
+    # Prefetched behaviour summary (kept short: this prompt is latency-critical)
+    behavior_line = ""
+    if prefetched is not None and prefetched.stats:
+        stats = prefetched.stats
+        violations = ", ".join(stats.get("violations", [])[:3]) or "(none)"
+        behavior_line = (f"Recent 3 days: study {stats['study_count']} min, play {stats['play_count']} min "
+                         f"(play ratio {stats['ratio']:.1f}%). Recent violations: {violations}\n")
+    if prefetched is not None and prefetched.recent_violations:
+        behavior_line += f"Violation Memory: {prefetched.recent_violations[:200]}\n"
+    
     # Determine persona based on trust
     # [TEMP] All users get GENTLE mode for testing
     if trust_score >= 0:  # Changed from 70 to 0 - everyone gets GENTLE
@@ -77,7 +162,7 @@ Example output:
 {{ "intent": "COMMAND", "judgment": "STUDY", "action_code": "OPEN_APP", "action_detail": "Code", "emotion": "NORMAL" }}
 
 User's Trust Score: {trust_score}/100
-Memory Context: {memory_context[:200] if memory_context else "(none)"}
+{behavior_line}Memory Context: {memory_context[:200] if memory_context else "(none)"}
 
 User Input: {request.text}
 
@@ -85,60 +170,41 @@ Now respond in the format above (spoken text first, then [INTENT], then JSON):
 """
     
     # Stream the LLM response
-    text_buffer = ""
-    json_buffer = ""
-    separator_found = False
+    parser = IntentStreamParser(TTSSegmenter.from_settings())
     chunk_count = 0
     
     start_time = time.time()
     
     try:
-        async for chunk in llm.astream(streaming_prompt):
-            chunk_text = chunk.content if hasattr(chunk, 'content') else str(chunk)
-            
-            if not separator_found:
-                # Check if separator is in this chunk
-                if "[INTENT]" in (text_buffer + chunk_text):
-                    # Split at separator
-                    combined = text_buffer + chunk_text
-                    parts = combined.split("[INTENT]", 1)
-                    text_buffer = parts[0].strip()
-                    json_buffer = parts[1] if len(parts) > 1 else ""
-                    separator_found = True
-                    
-                    # Yield final text chunk before separator
-                    if text_buffer:
-                        yield (text_buffer, False, {"emotion": "NORMAL", "chunk_index": chunk_count})
-                        chunk_count += 1
+        async with contextlib.aclosing(llm.astream(streaming_prompt)) as llm_stream, \
+                contextlib.aclosing(iterate_with_timer(llm_stream, parser.wait_time)) as stream:
+            async for chunk in stream:
+                if chunk is None:
+                    # [TTS Timer] No natural break within the latency target: speak what we have
+                    segments = parser.poll()
                 else:
-                    text_buffer += chunk_text
-                    
-                    # Yield text chunks periodically (every ~50 chars or on natural breaks)
-                    # Look for natural break points: periods, commas, exclamation marks
-                    break_points = [".", ",", "~", "♡", "!", "?", "\\n"]
-                    for bp in break_points:
-                        if bp in text_buffer:
-                            idx = text_buffer.rfind(bp)
-                            
-                            # [Optimization] Immediate yield for strong delimiters (!, ?, ♡, \n)
-                            # Allow short phrases for exclamations (e.g. "사용자님!") to reduce latency
-                            min_chunk_size = 2 if bp in ["!", "?", "♡", "\\n"] else 10
-                            
-                            if idx >= min_chunk_size:  
-                                to_yield = text_buffer[:idx + 1]
-                                text_buffer = text_buffer[idx + 1:]
-                                yield (to_yield.strip(), False, {"emotion": "NORMAL", "chunk_index": chunk_count})
-                                chunk_count += 1
-                                break
-            else:
-                # After separator, accumulate JSON
-                json_buffer += chunk_text
+                    chunk_text = chunk.content if hasattr(chunk, 'content') else str(chunk)  # native client yields str
+                    # TTS segments completed by this chunk (the separator may span chunks)
+                    segments = parser.feed(chunk_text)
+                
+                for segment in segments:
+                    yield (segment, False, {"emotion": "NORMAL", "chunk_index": chunk_count})
+                    chunk_count += 1
+                
+                if parser.intent is not None:
+                    # [Early Dispatch] JSON closed: hand the command over now instead of
+                    # waiting for the end of the stream (closing it stops generation)
+                    print(f"⚡ [Highway] Intent ready after {time.time() - start_time:.2f}s")
+                    break
+        
+        for segment in parser.finish():
+            yield (segment, False, {"emotion": "NORMAL", "chunk_index": chunk_count})
+            chunk_count += 1
         
-        # Parse final JSON
         elapsed = time.time() - start_time
         print(f"⏱️ [Highway] Stream completed in {elapsed:.2f}s ({chunk_count} chunks)")
         
-        intent_data = {
+        intent_data = parser.intent or {
             "intent": "CHAT",
             "judgment": "NEUTRAL",
             "action_code": "NONE",
@@ -146,13 +212,6 @@ Now respond in the format above (spoken text first, then [INTENT], then JSON):
             "emotion": "NORMAL"
         }
         
-        try:
-            json_match = re.search(r'(\{.*\})', json_buffer, re.DOTALL)
-            if json_match:
-                intent_data = json.loads(json_match.group(1))
-        except Exception as e:
-            print(f"⚠️ [Highway] JSON parse warning: {e}")
-        
         # Yield final chunk with intent
         yield ("", True, intent_data)
         
@@ -170,6 +229,11 @@ async def chat_with_persona(request: ChatRequest) -> ChatResponse:
     Intelligent Chatbot with Tsundere Persona.
     Uses Claude 3.5 Haiku.
     """
+    routed = route_command(request)
+    if routed is not None:
+        memory_service.update_interaction_time()
+        return ChatResponse(**await apply_action_hooks(routed))
+    
     llm = get_llm(model_id=HAIKU_MODEL_ID, temperature=0.1) 
     
     # [OPTIMIZATION] Parallel Context Retrieval
@@ -290,114 +354,35 @@ Persona: {persona_name}
          safe_report = "(No Report)"
 
     
-    final_prompt = f"""
-You are "Alpine" (알파인), a high-performance AI study assistant.
-Your user is **"{request.user_id}"** whom you address as **"사용자님"** (Master).
+    # [Prompt Caching] Static rules go in the (cached) system block; only this part changes per turn.
+    # Off by default: the static block is below Haiku's cache minimum, so the original single prompt is kept.
+    turn_prompt = f"""Your user is **"{request.user_id}"**.
 
+[Persona]
 {persona_instruction}
 
-*** PERSONA SYSTEM (TRUST-BASED) ***
-Your personality changes based on the user's TRUST SCORE:
-
-4.  **Competence**: 
-   - Even while insulting or obsessing, you execute commands efficiently.
-   - If Low Trust & Game request -> REFUSE and INSULT MORE.
-
-5.  **Game Detection Follow-up (CRITICAL)**:
-   - **Excuse Detection**: If the user makes excuses for playing games, look for these patterns:
-     * "한 판만 할게", "한 판만", "하나만 더", "조금만", "조금만 더", "이번만", "이번만 할게", "진짜 마지막", "마지막 한 판"
-     * When you detect these excuses, check the [Behavioral Report] and [Semantic Memory] for recent violations.
-     * If there's ANY recent violation or record of them saying the same thing, REFUSE firmly with:
-       - "저번에도 그러셨잖아요! 안 됩니다!"
-       - "또 그런 말 하시는 거예요? 안 됩니다!"
-       - Set **action_code: NONE**, **judgment: PLAY**, **emotion: ANGRY**
-   
-   - **Agreement/Surrender Detection**: If the user agrees to stop playing, look for these patterns:
-     * "알았어", "알았어요", "알겠어", "알겠어요", "그만할게", "그만할게요", "이제 끌게", "끌게", "종료할게"
-     * When you detect agreement, IMMEDIATELY execute **KILL_APP** action:
-       - Set **action_code: KILL_APP**
-       - Set **action_detail** to the game process name (check [Semantic Memory] for recently detected games, or use "LeagueClient" if League of Legends was mentioned)
-       - Set **judgment: PLAY**, **intent: COMMAND**
-       - Message: "프로세스 종료합니다." or "롤 프로세스 종료합니다."
-       - **emotion: SILLY** or **ANGRY**
-
-*** MEMORY & BEHAVIOR REPORT ***
-Use these to judge the user.
-If Trust Score is LOW, YOU MUST REFUSE PLAY REQUESTS (YouTube/Game).
-**If High Trust and 'Phone' or 'Distraction' is mentioned -> Trigger Yandere Jealousy.**
-
 [Semantic Memory]
 {safe_context}
 
 [Behavioral Report]
 {safe_report}
-************************************
 
 Input Text: {safe_text}
-
-*** LENGTH RULE: MAX 1-2 SENTENCES (CRITICAL) ***
-- Absolutely NO Intro/Outro.
-- Speak like a real person, not an AI.
-- Keep it short.
-
-*** CRITICAL GAME DETECTION LOGIC ***
-Before processing, check if the input contains:
-- **Excuse patterns**: "한 판만", "하나만 더", "조금만", "이번만", "마지막"
-- **Agreement patterns**: "알았어", "알겠어", "그만할게", "끌게", "종료할게"
-
-If excuse detected AND [Behavioral Report] shows violations → REFUSE (action_code: NONE)
-If agreement detected → KILL_APP (action_detail: check [Semantic Memory] for "LeagueClient", "Riot Client", "League of Legends", or use "LeagueClient" as default)
-
-Logic:
-1. **Analyze Intent & Judgment**:
-   - **COMMAND**: User asks to control an app ("Open VSCode", "Turn off Chrome").
-     - **OPEN**: "Open/Start" -> **action_code: OPEN_APP**. Detail: App Name or URL.
-       - **STUDY APPS**: "VSCode", "https://www.acmicpc.net/" (Baekjoon), "https://github.com" -> Always ACTION: OPEN_APP.
-       - If Trust is LOW and app is PLAY -> **action_code: NONE**. Message: "Refuse with disgust."
-     - **CLOSE**: "Turn off/Kill/Quit" -> **action_code: KILL_APP**. 
-       - **Detail MUST be the SYSTEM PROCESS NAME** (Capitalized is fine):
-         - "VSCode" -> "Code"
-         - "Chrome" -> "Chrome"
-         - "YouTube" -> "Chrome" (Since it's in browser)
-         - "League of Legends" -> "LeagueClient"
-         - "Discord" -> "Discord"
-
-   - **NOTE**: User asks to summarize ("Summarize this").
-     - **action_code: GENERATE_NOTE**. Detail: Topic string.
-
-   - **CHAT**: General conversation.
-     - **NEUTRAL**: Just talking. -> **action_code: NONE**.
-
-2. **Persona Response (Message) Examples**:
-   - **High Trust (Play)**: "저와 함께 시간을 보내신다는 거죠? 다만 공부 시간에는 집중해주세요." (emotion: NORMAL)
-   - **Low Trust (Play)**: "현재 학습 목표를 먼저 달성하시는 게 좋겠습니다." (emotion: NORMAL)
-   - **Low Trust (Kill App)**: "프로세스를 종료하겠습니다." (action_code: KILL_APP, emotion: NORMAL)
-   - **Note Gen**: "요청하신 내용을 정리해드렸습니다." (action_code: GENERATE_NOTE)
-
-3. **Output Constraints (CRITICAL)**:
-   - **Output ONLY valid JSON**.
-   - **NO intro/outro text**.
-   - **Language**: Korean.
-
-   {{
-     "intent": "COMMAND" | "CHAT" | "NOTE",
-     "judgment": "STUDY" | "PLAY" | "NEUTRAL",
-     "action_code": "OPEN_APP" | "NONE" | "WRITE_FILE" | "MINIMIZE_APP" | "KILL_APP" | "GENERATE_NOTE", 
-     "action_detail": "Code" | "Chrome" | "LeagueClient" | "Summary",
-     "message": "한국어 대사...",
-     "emotion": "NORMAL" | "SLEEPING" | "ANGRY" | "EMERGENCY" | "CRY" | "LOVE" | "EXCITE" | "LAUGH" | "SILLY" | "STUNNED" | "PUZZLE" | "HEART"
-   }}
-
-IMPORTANT: DO NOT OUTPUT ANYTHING BEFORE OR AFTER THE JSON.
-START THE RESPONSE WITH '{{' AND END WITH '}}'.
-    """
+"""
+    if get_settings().BEDROCK_PROMPT_CACHE:
+        messages = [persona_system_message(HAIKU_MODEL_ID), HumanMessage(content=turn_prompt)]
+    else:
+        messages = PERSONA_SINGLE_PROMPT.format(
+            user_id=request.user_id, persona_instruction=persona_instruction,
+            safe_context=safe_context, safe_report=safe_report, safe_text=safe_text,
+        )
 
     try:
         # LLM 호출
         start_llm = time.time()
-        response_msg = await llm.ainvoke(final_prompt)
+        response_msg = await llm.ainvoke(messages)
         llm_duration = time.time() - start_llm
-        print(f"⏱️ [Perf] LLM Generation: {llm_duration:.2f}s")
+        print(f"⏱️ [Perf] LLM Generation: {llm_duration:.2f}s ({format_usage(response_msg)})")
         
         raw_content = response_msg.content
         
@@ -422,18 +407,7 @@ START THE RESPONSE WITH '{{' AND END WITH '}}'.
                 print(f"[Chat/Game][DEBUG] Log error: {dbg_err}")
 
             # [LOGIC HOOK] Handle Smart Note Generation
-            if data.get("action_code") == "GENERATE_NOTE":
-                topic = data.get("action_detail", "Summary")
-                print(f"DEBUG: Generating Note for topic: {topic}")
-                
-                # Generate Content
-                markdown_content = await memory_service.get_recent_summary_markdown(topic)
-                
-                # Mutate Response to WRITE_FILE for Client
-                data["action_code"] = "WRITE_FILE"
-                valid_filename = f"{topic.replace(' ', '_')}_Note.md"
-                data["action_detail"] = valid_filename
-                data["message"] = markdown_content 
+            data = await apply_action_hooks(data)
 
             # [LOGIC HOOK] Handle Game Agreement Detection
             # If user agreed to stop playing and action_code is KILL_APP, use AI to detect game process from running apps
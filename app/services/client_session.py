@@ -0,0 +1,83 @@
+import asyncio
+import itertools
+import sys
+import time
+
+from app.protos import core_pb2
+from app.services.input_window import InputWindow
+from app.services.heartbeat_pacer import HeartbeatPacer
+
+# Max commands buffered per SyncClient stream before new ones are dropped
+OUTBOX_MAXSIZE = 64
+
+_session_ids = itertools.count(1)
+
+
+class ClientSession:
+    """
+    Per-connection state of one SyncClient stream.
+
+    Slotted because it is multiplied by the number of live connections
+    (a pod should hold 20k+ mostly idle streams).
+    """
+
+    __slots__ = (
+        "session_id", "user_id", "outbox", "connected_at", "heartbeats",
+        # [Fast Path] verdict cache for the current app list
+        "apps_json", "matcher", "apps", "verdict_type", "verdict_payload", "ai_judged",
+        # Background AI judgment
+        "ai_task", "ai_task_apps_json",
+        # [Wall 2] rolling input features
+        "input_window",
+        # Adaptive heartbeat cadence
+        "pacer",
+    )
+
+    def __init__(self, user_id: str, outbox_maxsize: int = OUTBOX_MAXSIZE):
+        self.session_id = next(_session_ids)
+        self.user_id = user_id
+        self.outbox = asyncio.Queue(maxsize=outbox_maxsize)
+        self.connected_at = time.time()
+        self.heartbeats = 0
+
+        self.apps_json = None
+        self.matcher = None
+        self.apps = []
+        self.verdict_type = core_pb2.ServerCommand.NONE
+        self.verdict_payload = ""
+        self.ai_judged = False
+
+        self.ai_task = None
+        self.ai_task_apps_json = None
+
+        self.input_window = InputWindow()
+        self.pacer = HeartbeatPacer()
+
+    def reset_apps(self, apps_json: str, matcher):
+        """Starts a new verdict for a changed app list (or blacklist snapshot)."""
+        self.apps_json = apps_json
+        self.matcher = matcher
+        self.apps = []
+        self.verdict_type = core_pb2.ServerCommand.NONE
+        self.verdict_payload = ""
+        self.ai_judged = False
+
+    def close(self):
+        """Cancels any in-flight background work of this stream."""
+        if self.ai_task is not None and not self.ai_task.done():
+            self.ai_task.cancel()
+        self.ai_task = None
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate bytes held by this session (object, app list, input window, outbox).
+        The shared blacklist matcher is not counted.
+        """
+        size = sys.getsizeof(self)
+        size += sys.getsizeof(self.apps_json or "")
+        size += sys.getsizeof(self.apps) + sum(sys.getsizeof(app) for app in self.apps)
+        size += self.input_window.memory_bytes()
+        size += sys.getsizeof(self.pacer)
+        size += sys.getsizeof(self.outbox) + sum(sys.getsizeof(v) for v in vars(self.outbox).values())
+        size += sum(sys.getsizeof(item) for item in self.outbox._queue)
+        return size
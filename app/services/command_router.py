@@ -0,0 +1,172 @@
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+
+class App(NamedTuple):
+    name: str               # spoken name in the reply
+    aliases: str            # regex alternation (matched case-insensitively)
+    judgment: str           # STUDY | PLAY | NEUTRAL
+    process: str = ""       # KILL_APP detail (system process name), "" = cannot be killed
+    open_target: str = ""   # OPEN_APP detail (app name or URL), "" = left to the LLM
+
+
+# Same process names / study URLs as the persona prompt's COMMAND rules.
+# PLAY apps have no open_target: whether to allow them depends on trust and history.
+APPS = [
+    App("VSCode", r"vs\s?code|비주얼\s?스튜디오\s?코드|브이에스\s?코드|비스코", "STUDY", "Code", "Code"),
+    App("백준", r"백준|baekjoon|boj", "STUDY", open_target="https://www.acmicpc.net/"),
+    App("깃허브", r"github|깃허브|깃헙", "STUDY", open_target="https://github.com"),
+    App("크롬", r"chrome|크롬", "NEUTRAL", "Chrome", "Chrome"),
+    App("유튜브", r"youtube|유튜브|유투브", "PLAY", "Chrome"),
+    App("롤", r"league\s?of\s?legends|리그\s?오브\s?레전드|lol|롤", "PLAY", "LeagueClient"),
+    App("마인크래프트", r"minecraft|마인크래프트|마크", "PLAY", "Minecraft"),
+    App("디스코드", r"discord|디스코드|디코", "PLAY", "Discord"),
+]
+
+# Excuse patterns of the persona prompt. They always go to the LLM: refusing needs the violation history.
+EXCUSE_KEYWORDS = ["한 판만", "한판만", "하나만 더", "조금만", "이번만", "마지막"]
+
+_RUNNING_APPS = re.compile(r"\[현재 실행 중인 앱:\s*([^\]]+)\]")
+_EXCUSE = re.compile("|".join(re.escape(k).replace(r"\ ", r"\s*") for k in EXCUSE_KEYWORDS))
+
+# Route only short utterances (commands are a few words); long text goes straight to the LLM
+MAX_ROUTE_CHARS = 60
+
+# Atomic groups / possessive quantifiers: no two filler words overlap and a matched
+# word is never re-split, so a failing match is linear in the input (no backtracking blow-up)
+_FILLER_WORDS = r"알파인아|알파인|야|자|음|아|응|어|네|그래|ㅇㅋ|오케이|그럼|이제|진짜|빨리|얼른|지금|바로"
+_SEP = r"[\s,.~!]*+"
+_FILLER = rf"(?:(?>{_FILLER_WORDS}){_SEP})*+"
+_POLITE = r"(?:줘|줘요|주세요|줄래|줄래요|줄래\?|봐|라|요)?"
+_TAIL = r"[\s.!?~♡ㅋㅎㅠ]*+"
+# Agreement patterns of the persona prompt ("알았어", "그만할게", "끌게", "종료할게")
+_AGREE = r"알았어요|알았어|알겠어요|알겠어|알겠습니다|알았다고"
+_STOP = r"그만\s?할게요?|끌게요?|종료할게요?|끌께요?|그만\s?할께요?"
+
+# One utterance = [filler / agreement words] [app [particle] [좀]] [verb]; anything else is "unsure"
+_COMMAND = re.compile(
+    rf"(?:(?>{_FILLER_WORDS}|(?P<agree>{_AGREE})){_SEP})*+"
+    rf"(?:(?P<app>{'|'.join(f'(?:{app.aliases})' for app in APPS)})(?:을|를|은|는)?\s*(?:좀\s*)?)?"
+    rf"(?:(?P<open>(?:켜|열어|실행\s?해|실행\s?시켜|틀어|띄워)\s?{_POLITE})"
+    rf"|(?P<kill>(?:꺼|닫아|종료\s?해|종료\s?시켜|꺼\s?버려|닫아\s?버려)\s?{_POLITE}|종료)"
+    rf"|(?P<stop>{_STOP}))?{_TAIL}",
+    re.IGNORECASE,
+)
+# tracking_service's TIL keywords, as a whole request ("TIL 정리해줘", "오늘 공부한 거 정리해줘")
+_TIL = re.compile(
+    rf"{_FILLER}(?:오늘(?:\s*(?:하루|공부한\s*(?:거|것|내용)))?\s*(?:을|를)?\s*)?"
+    r"(?P<til>til|퀴즈|quiz|report|리포트|회고록)?\s*(?:을|를)?\s*"
+    rf"(?P<verb>정리\s?해\s?{_POLITE}|(?:써|내|만들어|작성\s?해|보여)\s?{_POLITE})?{_TAIL}",
+    re.IGNORECASE,
+)
+_APP_PATTERNS = [(re.compile(app.aliases, re.IGNORECASE), app) for app in APPS]
+
+# Templated persona lines (GENTLE tone, short: they go straight to TTS)
+MESSAGES = {
+    "OPEN": "{name} 열어드릴게요! 오늘도 화이팅~",
+    "KILL": "{name} 종료합니다.",
+    "SURRENDER": "{name} 프로세스 종료합니다. 잘 참으셨어요!",
+    "NOTE": "오늘 공부한 내용 정리해드릴게요.",
+}
+
+
+class CommandRouter:
+    """
+    Deterministic pre-router for plain voice commands ("VSCode 켜줘", "유튜브 꺼",
+    "알았어 롤 끌게", "TIL 정리해줘").
+
+    The whole utterance must match one compiled pattern (optional filler,
+    agreement, one app, one verb); route() then returns the intent JSON plus a
+    templated line, with no LLM call. Anything else returns None and goes to
+    the LLM: excuses (refusal depends on violation history), PLAY app launches
+    (depend on trust), several commands, extra words, or anything longer than
+    MAX_ROUTE_CHARS. route() runs on the event loop, so every pattern is
+    written to fail in linear time.
+    """
+
+    def __init__(self):
+        self.routed = 0
+        self.deferred = 0
+
+    def route(self, text: str) -> Optional[Dict[str, str]]:
+        result = self._route(text or "")
+        if result is None:
+            self.deferred += 1
+        else:
+            self.routed += 1
+        return result
+
+    def _route(self, text: str) -> Optional[Dict[str, str]]:
+        running_apps = []
+        apps_match = _RUNNING_APPS.search(text)
+        if apps_match:
+            running_apps = [a.strip() for a in apps_match.group(1).split(",") if a.strip()]
+            text = _RUNNING_APPS.sub(" ", text)
+        text = text.strip()
+        if not text or len(text) > MAX_ROUTE_CHARS or _EXCUSE.search(text):
+            return None
+
+        match = _COMMAND.fullmatch(text)
+        if match and any(match.group(g) for g in ("agree", "app", "open", "kill", "stop")):
+            return self._command(match, running_apps)
+
+        match = _TIL.fullmatch(text)
+        if match and (match.group("til") or (match.group("verb") or "").startswith("정리")):
+            return _result("NOTE", "NEUTRAL", "GENERATE_NOTE", "Daily_Report", MESSAGES["NOTE"], "NORMAL")
+        return None
+
+    def _command(self, match: re.Match, running_apps: List[str]) -> Optional[Dict[str, str]]:
+        app = _app(match.group("app")) if match.group("app") else None
+        if match.group("open"):
+            if app is None or not app.open_target or app.judgment == "PLAY":
+                return None
+            return _result("COMMAND", app.judgment, "OPEN_APP", app.open_target,
+                           MESSAGES["OPEN"].format(name=app.name), "EXCITE")
+        if match.group("kill"):
+            if app is None or not app.process:
+                return None
+            return _result("COMMAND", app.judgment, "KILL_APP", app.process,
+                           MESSAGES["KILL"].format(name=app.name), "NORMAL")
+        if not (match.group("agree") or match.group("stop")):
+            return None  # an app name alone
+        if app is None:
+            app = _running_game(running_apps)  # "알았어": the game the client reports as running
+        elif not match.group("stop"):
+            return None  # "알았어 롤": not a command
+        if app is None or not app.process:
+            return None
+        if app.judgment != "PLAY":
+            return _result("COMMAND", app.judgment, "KILL_APP", app.process,
+                           MESSAGES["KILL"].format(name=app.name), "NORMAL")
+        return _result("COMMAND", "PLAY", "KILL_APP", app.process,
+                       MESSAGES["SURRENDER"].format(name=app.name), "SILLY")
+
+
+def _app(mention: str) -> Optional[App]:
+    for pattern, app in _APP_PATTERNS:
+        if pattern.fullmatch(mention):
+            return app
+    return None
+
+
+def _running_game(running_apps: List[str]) -> Optional[App]:
+    """The game among the client's running processes, if exactly one is found."""
+    # Browser-hosted PLAY apps (YouTube) are not identifiable from the process list
+    found = [app for app in APPS if app.judgment == "PLAY" and app.process != "Chrome"
+             and any(app.process.lower() in running.lower() for running in running_apps)]
+    return found[0] if len(found) == 1 else None
+
+
+def _result(intent: str, judgment: str, action_code: str, action_detail: str, message: str, emotion: str) -> Dict[str, str]:
+    return {
+        "intent": intent,
+        "judgment": judgment,
+        "action_code": action_code,
+        "action_detail": action_detail,
+        "message": message,
+        "emotion": emotion,
+    }
+
+
+# Global Instance
+command_router = CommandRouter()
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from typing import Optional
+
+from app.services.memory_service import memory_service
+from app.services.statistic_service import statistic_service
+
+# Same fixed query chat_with_persona uses for excuse detection (query-independent)
+VIOLATION_QUERY = "게임 위반, 게임 감지, 딴짓, 공부 안함"
+PREFETCH_TIMEOUT = 3.0   # upper bound; normally hidden behind STT
+
+
+class VoiceContext:
+    """
+    Query-independent context of one voice turn: everything about the user that
+    does not depend on what they are about to say. Fetched while audio streams in
+    and STT runs; only the transcript-dependent vector search waits for the text.
+
+    There is no recent-dialogue buffer to include: chat turns are not stored
+    (STM only holds violation / achievement / quiz events).
+    """
+
+    __slots__ = ("user_id", "trust_score", "stats", "recent_violations", "elapsed")
+
+    def __init__(self, user_id: str):
+        self.user_id = user_id
+        self.trust_score = 50          # memory_service default
+        self.stats: Optional[dict] = None
+        self.recent_violations = ""
+        self.elapsed = 0.0
+
+
+async def prefetch_user_context(user_id: str) -> VoiceContext:
+    """Trust score, 3-day stats summary and recent violations, fetched in parallel."""
+    context = VoiceContext(user_id)
+    started = time.perf_counter()
+
+    # Redis / vector store clients are synchronous: run them off the event loop
+    trust, stats, violations = await asyncio.gather(
+        asyncio.wait_for(asyncio.to_thread(memory_service.get_trust_score, user_id), PREFETCH_TIMEOUT),
+        asyncio.wait_for(statistic_service.get_recent_summary(user_id=user_id, days=3), PREFETCH_TIMEOUT),
+        asyncio.wait_for(asyncio.to_thread(memory_service.get_user_context, VIOLATION_QUERY), PREFETCH_TIMEOUT),
+        return_exceptions=True,
+    )
+    if not isinstance(trust, BaseException):
+        context.trust_score = trust
+    if isinstance(stats, dict):
+        context.stats = stats
+    if isinstance(violations, str):
+        context.recent_violations = violations
+
+    context.elapsed = time.perf_counter() - started
+    print(f"⚡ [Prefetch] Context for {user_id} ready in {context.elapsed * 1000:.0f}ms")
+    return context
@@ -0,0 +1,68 @@
+from typing import Optional
+
+# Heartbeat intervals announced to the client via SET_HEARTBEAT_INTERVAL (ms)
+FAST_INTERVAL_MS = 1000   # default client cadence; anything suspicious
+CALM_INTERVAL_MS = 3000   # stably studying (no suspicion, no verdict)
+IDLE_INTERVAL_MS = 5000   # OS idle
+
+CALM_AFTER_BEATS = 30     # consecutive calm heartbeats before slowing down
+IDLE_AFTER_BEATS = 10     # consecutive idle heartbeats before backing off further
+
+
+def is_activity_spike(heartbeat, seconds: float = 1.0) -> bool:
+    """
+    Single-sample gaming-like input (the original Wall 2 rules, per second:
+    the heartbeat's counts cover `seconds`).
+    Too noisy to wake the AI Judge, but enough to go back to full cadence.
+    """
+    return (heartbeat.keystroke_count / seconds > 5 and heartbeat.keyboard_entropy < 3.0) \
+        or heartbeat.click_count / seconds > 10 or heartbeat.mouse_distance / seconds > 1000
+
+
+class HeartbeatPacer:
+    """
+    Per-stream heartbeat rate negotiation.
+
+    Backs the client off while it is idle or calmly studying, and snaps back
+    to 1 Hz as soon as anything suspicious shows up, so idle fleets stop
+    costing CPU and network on the gRPC tier.
+    """
+
+    __slots__ = ("interval_ms", "calm_beats", "idle_beats")
+
+    def __init__(self):
+        self.interval_ms = FAST_INTERVAL_MS
+        self.calm_beats = 0
+        self.idle_beats = 0
+
+    def interval_seconds(self, heartbeat) -> float:
+        """
+        Seconds of input a heartbeat's counts cover: the interval_ms it reports,
+        else the interval last announced (older clients don't send it).
+        """
+        return (heartbeat.interval_ms or self.interval_ms) / 1000
+
+    def update(self, heartbeat, alert: bool = False) -> Optional[int]:
+        """
+        Feeds one heartbeat. `alert` = the server sees something worth watching
+        (app list changed, pending verdict, windowed suspicion).
+        Returns the new interval in ms if the client should change cadence, else None.
+        """
+        if alert or is_activity_spike(heartbeat, self.interval_seconds(heartbeat)):
+            self.calm_beats = 0
+            self.idle_beats = 0
+            target = FAST_INTERVAL_MS
+        else:
+            self.calm_beats += 1
+            self.idle_beats = self.idle_beats + 1 if heartbeat.is_os_idle else 0
+            if self.idle_beats >= IDLE_AFTER_BEATS:
+                target = IDLE_INTERVAL_MS
+            elif self.calm_beats >= CALM_AFTER_BEATS:
+                target = CALM_INTERVAL_MS
+            else:
+                target = FAST_INTERVAL_MS
+
+        if target == self.interval_ms:
+            return None
+        self.interval_ms = target
+        return target
@@ -0,0 +1,147 @@
+import sys
+
+import numpy as np
+
+# Default window: 60 seconds of input, whatever the heartbeat cadence. Valid range 30 ~ 120.
+DEFAULT_WINDOW = 60
+MIN_SECONDS = 10
+
+# Per-second thresholds (same as the original single-sample rules).
+# Heartbeat counts cover the whole heartbeat interval and are divided by it first.
+ACTIVE_KEYS = 5           # keystrokes/s that count as "typing"
+LOW_ENTROPY = 3.0         # WASD/QWER-style typing
+HIGH_CLICKS = 10          # clicks/s
+HIGH_MOUSE = 1000         # px/s
+
+# Windowed rules
+GAMING_KEY_RATIO = 0.6    # share of typing seconds that look like gaming
+MIN_ACTIVE_SECONDS = 5
+HIGH_MOUSE_RATIO = 0.25   # p75(clicks or mouse) above threshold <=> >25% of seconds above it
+ENTROPY_EWMA_ALPHA = 0.2
+ENTROPY_DROP = 0.5        # recent entropy this far below the window mean = trending to gaming
+
+_KEYS, _ENTROPY, _CLICKS, _MOUSE, _GAMING_KEY, _HIGH_MOUSE, _SECONDS = range(7)
+
+
+class InputWindow:
+    """
+    Fixed-size ring buffer of heartbeat input features for "Wall 2" suspicion.
+
+    Keeps the last `window` seconds of keystroke/entropy/click/mouse samples in
+    a preallocated NumPy array. Each sample is weighted by the seconds it covers
+    (1s at full cadence, more once the HeartbeatPacer slows the client down), so
+    the window spans the same wall time at any cadence. Column sums are updated
+    in O(1) per heartbeat (add new row, subtract evicted rows), so suspicion is
+    judged from windowed statistics instead of a single noisy sample.
+    """
+
+    __slots__ = ("window", "_buf", "_sums", "_pos", "_count", "_entropy_ewma")
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window  # seconds; also the slot count (one heartbeat per second at most)
+        self._buf = np.zeros((window, 7), dtype=np.float32)
+        self._sums = np.zeros(7, dtype=np.float64)
+        self._pos = 0
+        self._count = 0
+        self._entropy_ewma = None
+
+    def push(self, keystroke_count: int, keyboard_entropy: float, click_count: int, mouse_distance: int,
+             seconds: float = 1.0):
+        """
+        Adds one heartbeat sample covering `seconds` of input (counts are totals over
+        that interval), evicting the oldest samples that fall out of the window.
+        """
+        is_typing = keystroke_count / seconds > ACTIVE_KEYS
+        row = (
+            is_typing * seconds,
+            keyboard_entropy * seconds if is_typing else 0.0,  # entropy is only meaningful while typing
+            click_count,
+            mouse_distance,
+            (is_typing and keyboard_entropy < LOW_ENTROPY) * seconds,
+            (click_count / seconds > HIGH_CLICKS or mouse_distance / seconds > HIGH_MOUSE) * seconds,
+            seconds,
+        )
+        while self._count and (self._count == self.window or self._sums[_SECONDS] + seconds > self.window):
+            self._evict()
+        slot = self._buf[self._pos]
+        slot[:] = row
+        self._sums += slot
+        self._count += 1
+        self._pos = (self._pos + 1) % self.window
+
+        if is_typing:
+            if self._entropy_ewma is None:
+                self._entropy_ewma = keyboard_entropy
+            else:
+                # Same decay per second at any cadence
+                alpha = 1 - (1 - ENTROPY_EWMA_ALPHA) ** seconds
+                self._entropy_ewma += alpha * (keyboard_entropy - self._entropy_ewma)
+
+    def _evict(self):
+        self._count -= 1
+        if self._count:
+            self._sums -= self._buf[(self._pos - self._count - 1) % self.window]
+        else:
+            self._sums[:] = 0  # no float drift carried over an emptied window
+
+    def push_heartbeat(self, heartbeat, seconds: float = 1.0):
+        """Convenience wrapper for core_pb2.ClientHeartbeat covering `seconds` of input."""
+        self.push(heartbeat.keystroke_count, heartbeat.keyboard_entropy,
+                  heartbeat.click_count, heartbeat.mouse_distance, seconds)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def memory_bytes(self) -> int:
+        """Bytes held by this window (object + NumPy buffers)."""
+        return sys.getsizeof(self) + sys.getsizeof(self._buf) + sys.getsizeof(self._sums)
+
+    @property
+    def seconds(self) -> float:
+        """Wall time covered by the samples in the window."""
+        return float(self._sums[_SECONDS])
+
+    @property
+    def active_seconds(self) -> int:
+        return int(self._sums[_KEYS])
+
+    def mean_active_entropy(self) -> float:
+        """Mean keyboard entropy over the seconds the user was actually typing."""
+        active = self._sums[_KEYS]
+        return float(self._sums[_ENTROPY] / active) if active else 0.0
+
+    def entropy_trend(self) -> float:
+        """Recent (EWMA) entropy minus the window mean. Negative = drifting towards repetitive keys."""
+        if self._entropy_ewma is None or not self._sums[_KEYS]:
+            return 0.0
+        return float(self._entropy_ewma - self.mean_active_entropy())
+
+    def mean_clicks(self) -> float:
+        """Clicks per second over the window."""
+        return float(self._sums[_CLICKS] / self._sums[_SECONDS]) if self._count else 0.0
+
+    def mean_mouse(self) -> float:
+        """Mouse distance (px) per second over the window."""
+        return float(self._sums[_MOUSE] / self._sums[_SECONDS]) if self._count else 0.0
+
+    def is_suspicious(self) -> bool:
+        """
+        Windowed replacement for the single-sample Wall 2 rules:
+        - Keyboard: most typing seconds are low-entropy and the mean typing entropy is low
+          (or it is dropping fast towards that).
+        - Mouse: clicks/movement above the gaming threshold in more than a quarter of
+          the window (i.e. the 75th percentile exceeds it), not just one spike.
+        """
+        if self._sums[_SECONDS] < MIN_SECONDS:
+            return False
+
+        active = self._sums[_KEYS]
+        if active >= MIN_ACTIVE_SECONDS:
+            gaming_ratio = self._sums[_GAMING_KEY] / active
+            mean_entropy = self._sums[_ENTROPY] / active
+            if gaming_ratio >= GAMING_KEY_RATIO and (
+                mean_entropy < LOW_ENTROPY or self.entropy_trend() <= -ENTROPY_DROP
+            ):
+                return True
+
+        return self._sums[_HIGH_MOUSE] / self._sums[_SECONDS] > HIGH_MOUSE_RATIO
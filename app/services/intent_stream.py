@@ -0,0 +1,114 @@
+import json
+import re
+from typing import List, Optional
+
+from app.services.tts_segmenter import TTSSegmenter
+
+SEPARATOR = "[INTENT]"
+
+_TAIL_JSON = re.compile(r"(\{.*\})", re.DOTALL)
+
+
+class IntentStreamParser:
+    """
+    Single-pass parser for the Highway "Text First, JSON Last" stream:
+
+        <spoken text> [INTENT] { ...intent json... }
+
+    feed() takes LLM deltas and returns the TTS segments completed by them
+    (cut by a TTSSegmenter; poll() / wait_time() drive its timer). The
+    separator is matched across chunk boundaries and the JSON tail is
+    brace-matched as it streams, so `intent` is set the moment the object
+    closes (before the LLM stream ends).
+    """
+
+    __slots__ = ("segmenter", "_pending", "separator_found", "_json", "_depth",
+                 "_in_string", "_escape", "_start", "intent")
+
+    def __init__(self, segmenter: Optional[TTSSegmenter] = None):
+        self.segmenter = segmenter or TTSSegmenter()
+        self._pending = ""      # chars that may be the start of the separator
+        self.separator_found = False
+        self._json = ""         # everything after the separator
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._start = -1        # index of the opening brace in _json
+        self.intent: Optional[dict] = None
+
+    def feed(self, chunk: str) -> List[str]:
+        if not chunk:
+            return []
+        if self.separator_found:
+            self._feed_json(chunk)
+            return []
+
+        data = self._pending + chunk
+        idx = data.find(SEPARATOR)
+        if idx >= 0:
+            self.separator_found = True
+            self._pending = ""
+            segments = self.segmenter.push(data[:idx]) + self.segmenter.flush()
+            self._feed_json(data[idx + len(SEPARATOR):])
+            return segments
+
+        # Hold back a suffix that could still become the separator ("[INT" + "ENT]")
+        keep = 0
+        for size in range(min(len(SEPARATOR) - 1, len(data)), 0, -1):
+            if SEPARATOR.startswith(data[-size:]):
+                keep = size
+                break
+        self._pending = data[len(data) - keep:] if keep else ""
+        return self.segmenter.push(data[:len(data) - keep])
+
+    def wait_time(self) -> Optional[float]:
+        """Seconds until poll() may emit a timed-out segment (None: nothing waiting)."""
+        return None if self.separator_found else self.segmenter.wait_time()
+
+    def poll(self) -> List[str]:
+        return [] if self.separator_found else self.segmenter.poll()
+
+    def _feed_json(self, chunk: str):
+        if self.intent is not None:
+            return
+        offset = len(self._json)
+        self._json += chunk
+        for i, ch in enumerate(chunk, offset):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = self._depth > 0
+            elif ch == "{":
+                if self._depth == 0:
+                    self._start = i
+                self._depth += 1
+            elif ch == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        self.intent = json.loads(self._json[self._start:i + 1])
+                        return
+                    except ValueError:
+                        self._start = -1  # not valid JSON: keep looking for the next object
+
+    @property
+    def json_tail(self) -> str:
+        return self._json
+
+    def finish(self) -> List[str]:
+        """Stream ended: returns the remaining text and makes a last attempt at the JSON tail."""
+        pending, self._pending = self._pending, ""
+        segments = self.segmenter.push(pending) + self.segmenter.flush()
+        if self.intent is None and self._json:
+            match = _TAIL_JSON.search(self._json)
+            if match:
+                try:
+                    self.intent = json.loads(match.group(1))
+                except ValueError as e:
+                    print(f"⚠️ [Highway] JSON parse warning: {e}")
+        return segments
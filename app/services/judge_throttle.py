@@ -0,0 +1,65 @@
+import time
+from typing import Dict, List, Optional, Set
+
+# Token bucket: a user may burst a few judgments, then gets one per REFILL_SECONDS.
+BURST = 3
+REFILL_SECONDS = 30.0
+MAX_TRACKED_USERS = 10000
+
+
+class JudgeThrottle:
+    """
+    Per-user rate limit for the AI game judge (Bedrock call).
+
+    - Token bucket caps how often one user can trigger a judgment.
+    - Debounce: only one judgment per user may be in flight at a time.
+    """
+
+    def __init__(self, burst: int = BURST, refill_seconds: float = REFILL_SECONDS):
+        self.burst = burst
+        self.refill_seconds = refill_seconds
+        self._buckets: Dict[str, List[float]] = {}  # user_id -> [tokens, last_refill_ts]
+        self._in_flight: Set[str] = set()
+
+    def try_acquire(self, user_id: str, now: Optional[float] = None) -> bool:
+        """
+        Takes a token for `user_id`. Returns False if a judgment is already
+        running for this user or the bucket is empty.
+        """
+        if user_id in self._in_flight:
+            return False
+
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            if len(self._buckets) >= MAX_TRACKED_USERS:
+                self._prune(now)
+            bucket = [float(self.burst), now]
+            self._buckets[user_id] = bucket
+        else:
+            elapsed = now - bucket[1]
+            bucket[0] = min(float(self.burst), bucket[0] + elapsed / self.refill_seconds)
+            bucket[1] = now
+
+        if bucket[0] < 1.0:
+            return False
+
+        bucket[0] -= 1.0
+        self._in_flight.add(user_id)
+        return True
+
+    def release(self, user_id: str):
+        """Marks the in-flight judgment for `user_id` as finished."""
+        self._in_flight.discard(user_id)
+
+    def _prune(self, now: float):
+        # A bucket that has fully refilled is equivalent to no bucket at all
+        full_after = self.burst * self.refill_seconds
+        stale = [uid for uid, (_, last) in self._buckets.items()
+                 if uid not in self._in_flight and now - last >= full_after]
+        for uid in stale:
+            del self._buckets[uid]
+
+
+# Global Instance (shared by all SyncClient streams in this process)
+judge_throttle = JudgeThrottle()
@@ -6,9 +6,11 @@ from app.core.llm import get_llm, SONNET_MODEL_ID
 from langchain_core.prompts import PromptTemplate
 
 class ReportService:
-    def __init__(self):
+    @property
+    def llm(self):
         # [User Request] Use Sonnet for higher quality reports and better Korean support
-        self.llm = get_llm(model_id=SONNET_MODEL_ID, temperature=0.7)
+        # Resolved per use from the shared pool (no Bedrock client built at import)
+        return get_llm(model_id=SONNET_MODEL_ID, temperature=0.7)
 
     async def generate_daily_wrapped(self, user_id: str) -> str:
         """
@@ -7,7 +7,6 @@ from app.services.memory_service import memory_service
 
 class ReviewService:
     def __init__(self):
-        self.llm = get_llm(model_id=HAIKU_MODEL_ID, temperature=0.7)
         self.blog_prompt = PromptTemplate(
             input_variables=["error_log", "solution_code", "date", "daily_log"],
             template="""
@@ -44,6 +43,11 @@ class ReviewService:
             """
         )
 
+    @property
+    def llm(self):
+        # Resolved per use from the shared pool (no Bedrock client built at import)
+        return get_llm(model_id=HAIKU_MODEL_ID, temperature=0.7)
+
     async def generate_blog_post(self, error_log: str = "", solution_code: str = "", user_id: str = "dev1") -> dict:
         """
         Generates a Blog Post markdown using LLM and saves it to the Desktop.
@@ -0,0 +1,132 @@
+import asyncio
+from typing import Awaitable, Callable, List, Optional
+
+from app.schemas.intelligence import STTResponse
+from app.services.audio_buffer import AudioBuffer
+from app.services.vad import FRAME_BYTES, frame_rms
+
+# Client audio: 16kHz mono 16-bit PCM
+SAMPLE_RATE = 16000
+BYTES_PER_SECOND = SAMPLE_RATE * 2
+
+SILENCE_RMS = 500            # int16 RMS below this = pause
+PAUSE_SECONDS = 0.4          # pause long enough to cut a segment
+MIN_SEGMENT_SECONDS = 1.5    # shorter segments hurt Whisper accuracy
+MAX_SEGMENT_SECONDS = 8.0    # forced cut when the user never pauses
+OVERLAP_SECONDS = 0.5        # re-sent audio around a forced cut (word boundaries)
+MAX_OVERLAP_WORDS = 6
+
+Transcribe = Callable[[AudioBuffer, str], Awaitable[STTResponse]]
+
+
+def merge_transcripts(parts: List[str]) -> str:
+    """
+    Joins segment transcripts in order. Words repeated across an overlapping
+    cut (suffix of the previous part == prefix of the next) are kept once.
+    """
+    words: List[str] = []
+    for part in parts:
+        new_words = part.split()
+        if not new_words:
+            continue
+        overlap = 0
+        for k in range(min(MAX_OVERLAP_WORDS, len(words), len(new_words)), 0, -1):
+            if words[-k:] == new_words[:k]:
+                overlap = k
+                break
+        words.extend(new_words[overlap:])
+    return " ".join(words)
+
+
+class IncrementalTranscriber:
+    """
+    Transcribes an utterance while it is still being streamed.
+
+    Incoming PCM is cut into segments at natural pauses (or forcibly every
+    MAX_SEGMENT_SECONDS, with a short overlap), and each closed segment is
+    sent to STT in the background. When the client signals is_final only the
+    tail segment is still outstanding, so most of the STT time overlaps with
+    the user speaking instead of being added after it.
+    """
+
+    def __init__(self, transcribe: Optional[Transcribe] = None, file_ext: str = "raw"):
+        if transcribe is None:
+            from app.services import stt
+            transcribe = stt.transcribe_bytes
+        self._transcribe = transcribe
+        self._file_ext = file_ext
+        self._pending = AudioBuffer()  # audio of the open segment
+        self._scan_pos = 0            # bytes of _pending already analysed
+        self._silent_bytes = 0        # trailing silence of the open segment
+        self._voiced_bytes = 0        # speech frames in the open segment
+        self._tasks: List[asyncio.Task] = []
+        self.total_bytes = 0
+
+    @property
+    def segments(self) -> int:
+        """Segments already handed to STT."""
+        return len(self._tasks)
+
+    def feed(self, data: bytes):
+        """Adds a chunk of PCM; may start background STT for a finished segment."""
+        if not data:
+            return
+        self._pending.extend(data)
+        self.total_bytes += len(data)
+
+        pause = int(PAUSE_SECONDS * BYTES_PER_SECOND)
+        min_len = int(MIN_SEGMENT_SECONDS * BYTES_PER_SECOND)
+        max_len = int(MAX_SEGMENT_SECONDS * BYTES_PER_SECOND)
+
+        # All newly completed 30ms frames in one vectorized pass
+        # (the view must be released before the buffer can be split)
+        with self._pending.pcm() as pcm:
+            levels = frame_rms(pcm[self._scan_pos:]).tolist()
+
+        for rms in levels:
+            self._scan_pos += FRAME_BYTES
+            if rms < SILENCE_RMS:
+                self._silent_bytes += FRAME_BYTES
+            else:
+                self._silent_bytes = 0
+                self._voiced_bytes += FRAME_BYTES
+
+            if self._silent_bytes >= pause and self._scan_pos >= min_len:
+                # Cut in the middle of the pause
+                self._flush(self._scan_pos - self._silent_bytes // 2, overlap=0)
+            elif self._scan_pos >= max_len:
+                self._flush(self._scan_pos, overlap=int(OVERLAP_SECONDS * BYTES_PER_SECOND))
+
+    def _flush(self, end: int, overlap: int):
+        # The segment keeps the buffer (truncated in place); only the short tail is copied
+        segment = self._pending
+        self._pending = segment.split(end, overlap)
+        if self._voiced_bytes:
+            self._tasks.append(asyncio.create_task(self._transcribe(segment, self._file_ext)))
+        self._scan_pos = max(0, self._scan_pos - max(0, len(segment) - overlap))
+        self._silent_bytes = 0
+        self._voiced_bytes = 0
+
+    async def finish(self) -> STTResponse:
+        """Sends the tail segment and returns the merged transcript of all segments."""
+        if self._pending:
+            self._flush(len(self._pending), overlap=0)
+
+        texts = []
+        levels = []
+        for result in await asyncio.gather(*self._tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"⚠️ [STT] Segment transcription failed: {result}")
+                continue
+            texts.append(result.text)
+            if result.audio_level is not None:
+                levels.append(result.audio_level)
+        return STTResponse(text=merge_transcripts(texts), audio_level=max(levels, default=None))
+
+    def cancel(self):
+        """Abandons the utterance (stream error / client gone)."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        self._tasks.clear()
+        self._pending.clear()
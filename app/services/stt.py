@@ -1,32 +1,14 @@
-import os
-import io
 import struct
+from typing import Optional, Union
 from fastapi import UploadFile
-from groq import AsyncGroq
 from app.schemas.intelligence import STTResponse
 from app.core.config import get_settings
+from app.services.audio_buffer import AudioBuffer
+from app.services import vad
+from app.services.stt_backends import stt_router, get_groq_client  # noqa: F401 (re-export)
 
 settings = get_settings()
 
-# Initialize Groq Client (Lazy)
-_client_instance = None
-
-def get_groq_client():
-    global _client_instance
-    if _client_instance:
-        return _client_instance
-    
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
-        print("[STT] ⚠️ GROQ_API_KEY not found. Helper will fail if called.")
-        return None
-        
-    _client_instance = AsyncGroq(
-        api_key=api_key,
-        timeout=10.0
-    )
-    return _client_instance
-
 async def transcribe_audio(file: UploadFile) -> STTResponse:
     """
     HTTP Wrapper: Transcribes UploadFile using Groq Whisper.
@@ -69,55 +51,46 @@ def create_wav_header(pcm_data: bytes, sample_rate: int = 16000, channels: int =
     
     return wav_header + pcm_data
 
-async def transcribe_bytes(file_content: bytes, file_ext: str = "mp3") -> STTResponse:
+async def transcribe_bytes(file_content: Union[bytes, AudioBuffer], file_ext: str = "mp3",
+                           upload_format: Optional[str] = None) -> STTResponse:
     """
-    Core Logic: Calls Groq Whisper API.
+    Core Logic: Calls the STT backend (Groq Whisper, local Whisper on breaker trip).
+    Pass an AudioBuffer to upload straight from the streaming buffer (no copies).
+    Raw PCM is VAD-trimmed first (in place) and silence never reaches Groq.
+    upload_format: wav | flac | opus (default: STT_UPLOAD_FORMAT).
     """
-    # Initialize client first to avoid UnboundLocalError
-    client = get_groq_client()
-    if not client:
-        print("❌ STT Error: Groq client not initialized. Please set GROQ_API_KEY environment variable.")
-        return STTResponse(text="")
-    
     try:
         # 🔧 Handle Raw PCM (Dev 1 Source)
         # OpenAI/Groq Whisper expects a file with a header (wav, mp3, etc.)
-        if file_ext in ["raw", "pcm", "mp3"]: # 'mp3' might be mislabeled raw data from some clients
-             # Optimization: Check if it already has a RIFF header? 
-             # For now, trust the logic: if generic name, assume raw PCM from Dev 1
-             if not file_content.startswith(b'RIFF'):
-                 file_content = create_wav_header(file_content, sample_rate=16000, channels=1, bits_per_sample=16)
-                 file_ext = "wav"
-                 # print(f"[STT] Converted raw PCM to WAV ({len(file_content)} bytes)")
+        audio_level = None
+        if not isinstance(file_content, AudioBuffer) and file_ext in ["raw", "pcm", "mp3"] \
+                and not file_content.startswith(b'RIFF'):
+            # 'mp3' might be mislabeled raw data from some clients: assume raw PCM from Dev 1
+            file_content = AudioBuffer.from_pcm(file_content)
+
+        if isinstance(file_content, AudioBuffer):
+            # 🔇 Server-side VAD: drop noise triggers, trim leading/trailing silence
+            with file_content.pcm() as pcm:
+                speech = vad.detect(pcm)
+            audio_level = speech.level_db
+            if not speech.has_speech:
+                print(f"[STT] 🔇 No speech in {file_content.duration_seconds:.2f}s of audio. Skipping.")
+                return STTResponse(text="", audio_level=audio_level)
+            file_content.trim(speech.start, speech.end)
 
         # 🔧 Duration Check
-        audio_bytes = len(file_content)
         # Approx duration for 16khz 16bit mono = 32000 bytes/sec
-        duration_seconds = audio_bytes / 32000
+        duration_seconds = len(file_content) / 32000
         if duration_seconds < 0.3: # Increase threshold to reduce noise triggers
              print(f"[STT] ⚠️ Audio too short: {duration_seconds:.2f}s. Skipping.")
-             return STTResponse(text="")
-
-        # Create a file-like object
-        audio_file = io.BytesIO(file_content)
-        audio_file.name = f"voice.{file_ext}" # OpenAI/Groq needs a filename
+             return STTResponse(text="", audio_level=audio_level)
 
-        print(f"[STT] Calling Groq Whisper... ({duration_seconds:.2f}s)")
-
-        transcript = await client.audio.transcriptions.create(
-            model="whisper-large-v3", # 🚀 Changed to Groq model
-            file=audio_file,
-            language="ko", # Force Korean as per spec
-            prompt="VSCode, Chrome, Youtube, Study mode, Play mode, AI, 코딩, 개발, 유튜브, 롤, 알았어", 
-            temperature=0.0,
-            response_format="json"
-        )
-        
-        transcript_text = transcript.text
-        print(f"[STT] 🎤 Received Voice (Groq): \"{transcript_text}\"")
+        print(f"[STT] Transcribing {duration_seconds:.2f}s of audio...")
+        transcript_text = await stt_router.transcribe(file_content, file_ext, upload_format)
+        print(f"[STT] 🎤 Received Voice: \"{transcript_text}\"")
         
-        return STTResponse(text=transcript_text)
+        return STTResponse(text=transcript_text, audio_level=audio_level)
 
     except Exception as e:
-        print(f"❌ Groq Whisper Error: {e}")
+        print(f"❌ STT Error: {e}")
         return STTResponse(text="")
@@ -0,0 +1,240 @@
+import abc
+import asyncio
+import importlib.util
+import io
+import os
+import time
+from typing import Optional, Union
+
+import numpy as np
+from groq import AsyncGroq
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.hedging import HedgePolicy, hedged_call
+from app.core.config import get_settings
+from app.services import audio_codec
+from app.services.audio_buffer import AudioBuffer, MemoryFile
+
+settings = get_settings()
+
+STT_LANGUAGE = "ko"  # Force Korean as per spec
+STT_PROMPT = "VSCode, Chrome, Youtube, Study mode, Play mode, AI, 코딩, 개발, 유튜브, 롤, 알았어"
+
+Audio = Union[AudioBuffer, bytes]
+
+
+class STTBackend(abc.ABC):
+    """
+    Speech-to-text engine. `transcribe` gets either a (VAD-trimmed) AudioBuffer of
+    16kHz PCM or already-encoded bytes (HTTP uploads), and raises on failure.
+    """
+
+    name = "base"
+
+    @property
+    def available(self) -> bool:
+        return True
+
+    @abc.abstractmethod
+    async def transcribe(self, audio: Audio, file_ext: str = "wav", upload_format: Optional[str] = None) -> str:
+        ...
+
+
+# =============================================================================
+# Groq Whisper (remote)
+# =============================================================================
+
+# Initialize Groq Client (Lazy)
+_client_instance = None
+
+def get_groq_client():
+    global _client_instance
+    if _client_instance:
+        return _client_instance
+
+    api_key = os.getenv("GROQ_API_KEY")
+    if not api_key:
+        print("[STT] ⚠️ GROQ_API_KEY not found. Helper will fail if called.")
+        return None
+
+    _client_instance = AsyncGroq(
+        api_key=api_key,
+        timeout=10.0
+    )
+    return _client_instance
+
+
+class GroqBackend(STTBackend):
+    name = "groq"
+
+    @property
+    def available(self) -> bool:
+        return get_groq_client() is not None
+
+    async def transcribe(self, audio: Audio, file_ext: str = "wav", upload_format: Optional[str] = None) -> str:
+        client = get_groq_client()
+        if not client:
+            raise RuntimeError("Groq client not initialized. Please set GROQ_API_KEY environment variable.")
+
+        upload_format = upload_format or settings.STT_UPLOAD_FORMAT
+        if isinstance(audio, AudioBuffer) and upload_format != "wav":
+            # 🗜️ FLAC/Opus: smaller upload, off the event loop
+            audio_file, file_ext = await asyncio.to_thread(audio_codec.encode, audio, upload_format)
+        elif isinstance(audio, AudioBuffer):
+            audio_file, file_ext = audio.as_file("voice.wav"), "wav"
+        else:
+            audio_file = MemoryFile(memoryview(audio), f"voice.{file_ext}") # OpenAI/Groq needs a filename
+
+        print(f"[STT] Calling Groq Whisper... ({audio_file.size // 1024}KB {file_ext})")
+
+        with audio_file:
+            transcript = await client.audio.transcriptions.create(
+                model="whisper-large-v3", # 🚀 Changed to Groq model
+                file=audio_file,
+                language=STT_LANGUAGE,
+                prompt=STT_PROMPT,
+                temperature=0.0,
+                response_format="json"
+            )
+        return transcript.text
+
+
+# =============================================================================
+# Local Whisper (CPU, offline)
+# =============================================================================
+
+class LocalWhisperBackend(STTBackend):
+    """
+    faster-whisper (CTranslate2) on CPU with int8 weights. Optional dependency:
+    `pip install faster-whisper`. The model is loaded on first use (or preload()).
+    """
+
+    name = "local"
+
+    def __init__(self, model_size: str = "small", cpu_threads: int = 0):
+        self.model_size = model_size
+        self.cpu_threads = cpu_threads
+        self._model = None
+        self._load_lock = asyncio.Lock()
+        self._installed = importlib.util.find_spec("faster_whisper") is not None
+
+    @property
+    def available(self) -> bool:
+        return self._installed
+
+    async def preload(self):
+        if self._model is not None:
+            return
+        async with self._load_lock:
+            if self._model is None:
+                started = time.perf_counter()
+                self._model = await asyncio.to_thread(self._load_model)
+                print(f"🧠 [STT] Local Whisper '{self.model_size}' (int8) loaded in {time.perf_counter() - started:.1f}s")
+
+    def _load_model(self):
+        from faster_whisper import WhisperModel
+        return WhisperModel(self.model_size, device="cpu", compute_type="int8", cpu_threads=self.cpu_threads)
+
+    def _run(self, audio) -> str:
+        segments, _ = self._model.transcribe(
+            audio, language=STT_LANGUAGE, initial_prompt=STT_PROMPT, beam_size=1, temperature=0.0
+        )
+        return "".join(segment.text for segment in segments).strip()
+
+    async def transcribe(self, audio: Audio, file_ext: str = "wav", upload_format: Optional[str] = None) -> str:
+        await self.preload()
+        if isinstance(audio, AudioBuffer):
+            with audio.pcm() as pcm:
+                samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+        else:
+            samples = io.BytesIO(audio)  # decoded by faster-whisper (PyAV)
+        print(f"[STT] Calling Local Whisper ({self.model_size}, int8)...")
+        return await asyncio.to_thread(self._run, samples)
+
+
+# =============================================================================
+# Router
+# =============================================================================
+
+class STTRouter:
+    """
+    Sends audio to the primary backend while its circuit breaker is closed and
+    to the fallback (if any) when the primary errors or is tripped by latency /
+    errors. Without a usable fallback, the primary is always tried.
+    With a HedgePolicy, a slow primary call is duplicated (tail latency control).
+    """
+
+    def __init__(self, primary: STTBackend, fallback: Optional[STTBackend] = None,
+                 breaker: Optional[CircuitBreaker] = None, hedge: Optional[HedgePolicy] = None):
+        self.primary = primary
+        self.fallback = fallback
+        self.breaker = breaker or CircuitBreaker(f"stt-{primary.name}")
+        self.hedge = hedge
+        self._preload_tasks = []
+
+    def start(self):
+        """Preloads local models in the background (call from the running event loop)."""
+        for backend in (self.primary, self.fallback):
+            if isinstance(backend, LocalWhisperBackend) and backend.available:
+                self._preload_tasks.append(asyncio.create_task(backend.preload()))
+
+    async def stop(self):
+        """Cancels unfinished preloads (server shutdown)."""
+        tasks, self._preload_tasks = self._preload_tasks, []
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def _fallback_ready(self) -> bool:
+        return self.fallback is not None and self.fallback.available
+
+    async def transcribe(self, audio: Audio, file_ext: str = "wav", upload_format: Optional[str] = None) -> str:
+        has_fallback = self._fallback_ready()
+        if not has_fallback or self.breaker.allow():
+            started = time.perf_counter()
+            try:
+                if self.hedge is not None:
+                    text = await hedged_call(
+                        lambda: self.primary.transcribe(audio, file_ext, upload_format), self.hedge, f"stt-{self.primary.name}"
+                    )
+                else:
+                    text = await self.primary.transcribe(audio, file_ext, upload_format)
+            except Exception as e:
+                self.breaker.record_failure(type(e).__name__)
+                print(f"❌ [STT] {self.primary.name} failed: {e}")
+                if not has_fallback:
+                    raise
+            else:
+                self.breaker.record_success(time.perf_counter() - started)
+                return text
+
+        print(f"🔀 [STT] Routing to {self.fallback.name} (breaker: {self.breaker.state})")
+        return await self.fallback.transcribe(audio, file_ext, upload_format)
+
+    def stats(self) -> dict:
+        return {
+            "primary": self.primary.name,
+            "fallback": self.fallback.name if self.fallback else None,
+            "fallback_available": self._fallback_ready(),
+            "breaker": self.breaker.stats(),
+            "hedge": self.hedge.stats() if self.hedge else None,
+        }
+
+
+def _build_backend(name: str) -> Optional[STTBackend]:
+    if name == "groq":
+        return GroqBackend()
+    if name == "local":
+        return LocalWhisperBackend(settings.STT_LOCAL_MODEL)
+    return None
+
+
+# Global Instance
+stt_router = STTRouter(
+    primary=_build_backend(settings.STT_BACKEND) or GroqBackend(),
+    fallback=_build_backend(settings.STT_FALLBACK),
+    # Only remote backends have a latency tail worth hedging
+    hedge=HedgePolicy(settings.STT_HEDGE_PERCENTILE, settings.STT_HEDGE_BUDGET)
+    if settings.STT_HEDGE and settings.STT_BACKEND == "groq" else None,
+)
@@ -1,23 +1,31 @@
+import asyncio
 import grpc
 import json
 import re
+import time
 from app.protos import tracking_pb2, tracking_pb2_grpc
 from app.core.crypto import decrypt_data_raw
 from app.services.memory_service import memory_service
 from app.core.llm import get_llm, HAIKU_MODEL_ID
 from app.services import stt, chat
+from app.services.blacklist_service import blacklist_refresher
+from app.core.stream_registry import stream_registry
+from app.services.judge_throttle import judge_throttle
+from app.services.client_session import ClientSession
+from app.services.streaming_stt import IncrementalTranscriber
+from app.services.audio_buffer import AudioBuffer, AudioStreamLimits, AudioLimitExceeded, UnsupportedAudioFormat
+from app.services.context_prefetch import prefetch_user_context
+from app.services.voice_turns import voice_turns, VoiceTurn
+from app.core.config import get_settings
 from app.schemas.intelligence import ChatRequest
 
 
 from app.protos import core_pb2, core_pb2_grpc
 
+settings = get_settings()
+
 class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.CoreServiceServicer):
     
-    def __init__(self):
-        self._blacklist_cache = ["Overwatch", "MapleStory", "Destiny", "Battle.net", "Steam", "League of Legends", "Riot Client"]
-        self._blacklist_last_updated = 0
-        self._blacklist_ttl = 60  # Cache for 60 seconds
-    
     # ... (TranscribeAudio remains same) ...
 
     async def TranscribeAudio(self, request_iterator, context):
@@ -28,13 +36,37 @@ class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.C
         1. Receive audio stream from client
         2. Perform STT
         3. Stream AI response chunks back to client for real-time TTS
+
+        [Barge-in] Each stream is the user's current voice turn. A new stream by the
+        same user cancels the LLM stream / note generation of the previous one.
         """
-        audio_buffer = bytearray()
+        identity = self._extract_user_from_metadata(context)
+        # Anonymous streams all fall back to "dev1": barge-in only applies to real identities
+        turn = voice_turns.begin(identity or "dev1", key=None if identity else f"stream:{id(context)}")
+        try:
+            async for response in self._run_voice_turn(request_iterator, turn, context):
+                yield response
+        finally:
+            voice_turns.end(turn)
+
+    async def _run_voice_turn(self, request_iterator, turn: VoiceTurn, context):
+        user_id = turn.user_id
+        audio_buffer = AudioBuffer(spool_bytes=settings.VOICE_SPOOL_BYTES)
+        limits = AudioStreamLimits(settings.VOICE_MAX_AUDIO_BYTES, settings.VOICE_MAX_STREAM_SECONDS)
         final_media_info = {}
+        # [Prefetch] Identity is known from metadata before the first chunk:
+        # assemble the user's context while audio streams in and STT runs
+        context_task = turn.spawn(prefetch_user_context(user_id))
+        # [Streaming STT] Transcribe pause-delimited segments while the user is still talking
+        transcriber = IncrementalTranscriber(stt.transcribe_bytes) if settings.STT_STREAMING else None
 
+        rejected = None  # (status, error) of a stream dropped before STT
         try:
-            async for request in request_iterator:
-                audio_buffer.extend(request.audio_data)
+            async for request in limits.guard(request_iterator):
+                if transcriber:
+                    transcriber.feed(request.audio_data)
+                else:
+                    audio_buffer.extend(request.audio_data)
                 
                 # Validate media_info_json
                 if hasattr(request, 'media_info_json') and request.media_info_json:
@@ -46,15 +78,42 @@ class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.C
 
                 if request.is_final:
                     break
+        except AudioLimitExceeded as e:
+            rejected = (grpc.StatusCode.RESOURCE_EXHAUSTED, e)
+        except UnsupportedAudioFormat as e:
+            rejected = (grpc.StatusCode.INVALID_ARGUMENT, e)
         except Exception as e:
             print(f"gRPC Stream Error: {e}")
 
+        if rejected:
+            status, error = rejected
+            print(f"🛑 [Highway] Dropping {user_id}'s stream: {error}")
+            if transcriber:
+                transcriber.cancel()
+            context_task.cancel()
+            audio_buffer.close()
+            await context.abort(status, str(error))
+
         # 1. STT
-        stt_response = await stt.transcribe_bytes(bytes(audio_buffer), file_ext="mp3")
+        if transcriber:
+            stt_started = time.perf_counter()
+            stt_response = await turn.run(transcriber.finish())
+            if stt_response is not None:
+                print(f"⚡ [Highway] STT tail: {(time.perf_counter() - stt_started) * 1000:.0f}ms "
+                      f"after end of speech ({transcriber.segments} segments)")
+        else:
+            stt_response = await turn.run(stt.transcribe_bytes(audio_buffer))
+            audio_buffer.close()
+        if stt_response is None:
+            print(f"✋ [Highway] Turn #{turn.turn_id} superseded during STT")
+            if transcriber:
+                transcriber.cancel()  # segment STT calls were started outside the turn
+            return
         user_text = stt_response.text
         print(f"🗣️ [Highway] User said: \"{user_text}\"")
 
         if not user_text or not user_text.strip():
+            context_task.cancel()
             yield tracking_pb2.AudioResponse(
                 transcript="(No speech detected)",
                 is_emergency=False,
@@ -67,7 +126,6 @@ class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.C
             return
 
         # 2. Stream Chat Response (Highway AI)
-        user_id = self._extract_user_from_metadata(context) or "dev1"
         print(f"👤 [Highway] Identified User: {user_id}")
         
         chat_request = ChatRequest(text=user_text, user_id=user_id)
@@ -76,7 +134,7 @@ class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.C
         final_intent = {}
         
         # Use streaming chat function
-        async for text_chunk, is_complete, metadata in chat.chat_with_persona_stream(chat_request):
+        async for text_chunk, is_complete, metadata in turn.iterate(chat.chat_with_persona_stream(chat_request, context=context_task)):
             if is_complete:
                 # Final chunk with intent data
                 final_intent = metadata
@@ -108,7 +166,10 @@ class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.C
                     
                     try:
                         # Generate Content
-                        markdown_content = await memory_service.get_recent_summary_markdown(topic, user_id=user_id)
+                        markdown_content = await turn.run(memory_service.get_recent_summary_markdown(topic, user_id=user_id))
+                        if markdown_content is None:
+                            print(f"✋ [Highway] Turn #{turn.turn_id} superseded, note generation cancelled")
+                            return
                         
                         # Mutate Response to WRITE_FILE for Client
                         intent_data["command"] = "WRITE_FILE"
@@ -191,48 +252,101 @@ class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.C
         """
         Bidirectional Stream for Client Heartbeat (CoreService).
         Handles Game Detection & Nagging.
+
+        Heartbeats are consumed by a reader task that pushes commands into the
+        session outbox; background AI judgments push into the same queue, so the
+        heartbeat loop never waits on Bedrock. The session is registered in the
+        StreamRegistry so other subsystems can push commands to this user.
         """
         user_id = self._extract_user_from_metadata(context) or "dev1"
         print(f"⚡ [Core] SyncClient Connected. User: {user_id}")
         
-        # [UPDATED] Fetch from Data Server (Admin Page) with Caching
-        SERVER_BLACKLIST = await self._get_blacklist()
-        # Fallback to hardcoded if empty (network error on init)
-        if not SERVER_BLACKLIST:
-             SERVER_BLACKLIST = ["Overwatch", "MapleStory", "Destiny", "Battle.net", "Steam", "League of Legends", "Riot Client"]
+        session = ClientSession(user_id)
+        stream_registry.register(session)
+        reader = asyncio.create_task(self._consume_heartbeats(request_iterator, session))
+        try:
+            while True:
+                command = await session.outbox.get()
+                if command is None:
+                    break
+                yield command
+        finally:
+            reader.cancel()
+            session.close()
+            stream_registry.unregister(session)
+
+    async def _consume_heartbeats(self, request_iterator, session: ClientSession):
+        """
+        Heartbeat loop for one SyncClient stream. Pushes ServerCommands to the
+        session outbox and closes it with a None sentinel when the client stream ends.
+
+        [Fast Path] The session caches the verdict for the last apps_json string
+        (compared as-is: as cheap as hashing it, and no collision can hide a change).
+        The app list rarely changes between 1s heartbeats, so parsing,
+        blacklist matching and AI judging only run when it does.
+        """
+        user_id = session.user_id
+        outbox = session.outbox
+        input_window = session.input_window
 
-        
         try:
             async for heartbeat in request_iterator:
-                # 1. Parse Apps
-                apps = []
-                if heartbeat.apps_json:
-                    try:
-                        apps = json.loads(heartbeat.apps_json)
-                    except:
-                        pass
-                
-                # Skip detection if app list is empty
-                if not apps:
-                    continue
+                session.heartbeats += 1
+                # Counts cover the whole heartbeat interval: the window judges them per second
+                input_window.push_heartbeat(heartbeat, session.pacer.interval_seconds(heartbeat))
+                is_suspicious_input = input_window.is_suspicious()
 
-                kill_target = ""
-                command_type = core_pb2.ServerCommand.NONE
-                payload = ""
+                # 1. Parse Apps (only if changed since the last heartbeat)
+                # Blacklist snapshot from the Data Server (Admin Page), refreshed in the background
+                blacklist_matcher = blacklist_refresher.matcher
+                is_new_verdict = False
+                apps_changed = heartbeat.apps_json != session.apps_json
+                if apps_changed or blacklist_matcher is not session.matcher:
+                    session.reset_apps(heartbeat.apps_json, blacklist_matcher)
+                    if heartbeat.apps_json:
+                        try:
+                            session.apps = json.loads(heartbeat.apps_json)
+                        except:
+                            pass
 
-                # 2. Hybrid Game Detection
+                    # 2. Hybrid Game Detection
+
+                    # 2-1. Fast Blacklist (single pass over app names)
+                    if session.apps:
+                        hit = blacklist_matcher.find(session.apps)
+                        if hit:
+                            session.verdict_type = core_pb2.ServerCommand.KILL_PROCESS
+                            session.verdict_payload = hit
+                            is_new_verdict = True
+                            print(f"🚫 [Core] BLACKLIST DETECTED: {hit}")
+
+                # Adopt a finished background judgment if the app list is still the same
+                # (its commands were already pushed when it completed)
+                ai_task = session.ai_task
+                if ai_task is not None and ai_task.done():
+                    ai_result = ai_task.result()
+                    if session.ai_task_apps_json == session.apps_json and ai_result is not None:
+                        session.ai_judged = True
+                        if ai_result.is_game_detected and session.verdict_type == core_pb2.ServerCommand.NONE:
+                            session.verdict_type = core_pb2.ServerCommand.KILL_PROCESS
+                            session.verdict_payload = ai_result.target_app
+                    session.ai_task = None
+
+                # [Adaptive Rate] Slow the client down while idle / calmly studying,
+                # back to 1 Hz as soon as anything looks suspicious
+                new_interval = session.pacer.update(heartbeat, alert=(
+                    apps_changed or is_suspicious_input or session.ai_task is not None
+                    or session.verdict_type != core_pb2.ServerCommand.NONE
+                ))
+                if new_interval is not None:
+                    stream_registry.offer(outbox, core_pb2.ServerCommand(
+                        type=core_pb2.ServerCommand.SET_HEARTBEAT_INTERVAL,
+                        payload=str(new_interval)
+                    ))
                 
-                # 2-1. Fast Blacklist
-                for app in apps:
-                    for bad in SERVER_BLACKLIST:
-                        if bad.lower() in app.lower():
-                            kill_target = app
-                            command_type = core_pb2.ServerCommand.KILL_PROCESS
-                            payload = app
-                            print(f"🚫 [Core] BLACKLIST DETECTED: {app}")
-                            break
-                    if command_type != core_pb2.ServerCommand.NONE:
-                        break
+                # Skip detection if app list is empty
+                if not session.apps:
+                    continue
                 
                 # 2-2. AI Detection (If no blacklist hit)
                 # [Wall 2 -> Wall 3 Logic]
@@ -240,72 +354,82 @@ class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.C
                 # 1. Low Entropy Typing: Gaming usually uses limited keys (WASD, QWER) -> Low Entropy (< 3.0)
                 #    Productive work (Coding/Chatting) uses full keyboard -> High Entropy (> 4.0)
                 # 2. High Mouse Activity: Spam clicks (>10/s) or frantic movement (>1000px/s) usually means RTS/FPS.
+                # Judged over a rolling window (InputWindow) of per-second rates, not a single sample,
+                # so one burst of clicks or a short hotkey sequence doesn't wake the AI Judge.
+                # Passive browsing (no keys) never counts as typing, so it is IGNORED.
+                # (is_suspicious_input is computed right after the heartbeat is pushed)
                 
-                h = heartbeat
-                is_suspicious_input = False
-                
-                # Case A: Suspicious Keyboard (Repetitive Keys)
-                if h.keystroke_count > 5 and h.keyboard_entropy < 3.0:
-                    is_suspicious_input = True
-                    # print(f"🔍 [Wall 2] Suspicious Keyboard: Count={h.keystroke_count}, Entropy={h.keyboard_entropy:.2f}")
-                
-                # Case B: High Mouse Activity (LoL/FPS)
-                elif h.click_count > 10 or h.mouse_distance > 1000:
-                    is_suspicious_input = True
-                    # print(f"🔍 [Wall 2] Suspicious Mouse: Clicks={h.click_count}, Dist={h.mouse_distance}")
-
-                # Case C: Active Blacklist Check fallback (Input exists but not suspicious? Maybe just check anyway if we want strictness)
-                # User asked for "Suspicious" trigger.
-                # If I am just browsing (scroll, low click, no keys), entropy is 0. 
-                # Let's verify: If keys=0, entropy=0. 
-                # My logic: active_keys > 5. So passive browsing is IGNORED.
-                
-                if command_type == core_pb2.ServerCommand.NONE and is_suspicious_input:
-                    try:
-                        # Throttle AI checks? (Maybe doing it every heartbeat is too much?)
-                        # But heartbeat is 1s. Let's rely on GameDetector being fast or create a cache if needed.
-                        # For now, let's call it.
-                        from app.services import game_detector
-                        from app.schemas.game import GameDetectRequest
-                        
-                        detect_req = GameDetectRequest(apps=apps)
-                        ai_result = await game_detector.detect_games(detect_req)
-                        
-                        if ai_result.is_game_detected:
-                            kill_target = ai_result.target_app
-                            command_type = core_pb2.ServerCommand.KILL_PROCESS
-                            payload = kill_target
-                            msg = ai_result.message
-                            
-                            # Also send a MESSAGE to scold user?
-                            # Current protocol only supports one command per heartbeat response? 
-                            # Or we can yield multiple.
-                            
-                            print(f"🤖 [Core] AI DETECTED GAME: {kill_target}")
-                            
-                            # Yield Message First
-                            if msg:
-                                yield core_pb2.ServerCommand(
-                                    type=core_pb2.ServerCommand.SHOW_MESSAGE,
-                                    payload=msg
-                                )
+                # The AI verdict for an unchanged app list is already known -> judge once per list.
+                # Judgments run in the background and are rate-limited per user.
+                if (session.verdict_type == core_pb2.ServerCommand.NONE and is_suspicious_input
+                        and not session.ai_judged and session.ai_task is None
+                        and judge_throttle.try_acquire(user_id)):
+                    self._start_judgment(session)
 
-                    except Exception as e:
-                        print(f"⚠️ [Core] AI Error: {e}")
-
-                # 3. Yield Command
-                if command_type != core_pb2.ServerCommand.NONE:
-                    # [FIX] Log Game Detection to Data Service
-                    if command_type == core_pb2.ServerCommand.KILL_PROCESS:
-                         await self._log_game_detection(payload, "BLACKLIST_CoRE" if "AI" not in payload else "AI_JUDGE", user_id)
-
-                    yield core_pb2.ServerCommand(
-                        type=command_type,
-                        payload=payload
-                    )
+                # 3. Push Command (cached verdicts are re-sent until the app list changes)
+                if session.verdict_type != core_pb2.ServerCommand.NONE:
+                    # [FIX] Log Game Detection to Data Service (once per detection, not per heartbeat)
+                    if is_new_verdict and session.verdict_type == core_pb2.ServerCommand.KILL_PROCESS:
+                         await self._log_game_detection(session.verdict_payload, "BLACKLIST_CoRE", user_id)
+
+                    stream_registry.offer(outbox, core_pb2.ServerCommand(
+                        type=session.verdict_type,
+                        payload=session.verdict_payload
+                    ))
         
         except Exception as e:
             print(f"❌ [Core] SyncClient Disconnected OR Stream Ended: {e}")
+        finally:
+            session.close()
+            # Never block here: SyncClient cancels this task on exit, possibly with a full
+            # outbox (client stopped draining). The stream is over, so the oldest command
+            # can make room for the sentinel.
+            if outbox.full():
+                outbox.get_nowait()
+            outbox.put_nowait(None)
+
+    def _start_judgment(self, session: ClientSession):
+        """Starts the background AI judgment for the session's current app list (throttle already acquired)."""
+        user_id = session.user_id
+        session.ai_task_apps_json = session.apps_json
+        session.ai_task = asyncio.create_task(
+            self._judge_in_background(list(session.apps), session.outbox, user_id)
+        )
+        # Done callbacks also run for a task cancelled before its first step,
+        # when the coroutine's own finally never would
+        session.ai_task.add_done_callback(lambda _t: judge_throttle.release(user_id))
+
+    async def _judge_in_background(self, apps: list, outbox: asyncio.Queue, user_id: str):
+        """
+        Runs the AI game judge off the heartbeat loop and pushes its commands
+        to the stream as soon as the result is ready.
+        Returns the GameDetectResponse, or None on error.
+        """
+        try:
+            from app.services import game_detector
+            from app.schemas.game import GameDetectRequest
+
+            ai_result = await game_detector.detect_games(GameDetectRequest(apps=apps))
+
+            if ai_result.is_game_detected:
+                print(f"🤖 [Core] AI DETECTED GAME: {ai_result.target_app}")
+
+                # Message First, then the kill command
+                if ai_result.message:
+                    stream_registry.offer(outbox, core_pb2.ServerCommand(
+                        type=core_pb2.ServerCommand.SHOW_MESSAGE,
+                        payload=ai_result.message
+                    ))
+                stream_registry.offer(outbox, core_pb2.ServerCommand(
+                    type=core_pb2.ServerCommand.KILL_PROCESS,
+                    payload=ai_result.target_app
+                ))
+                await self._log_game_detection(ai_result.target_app, "AI_JUDGE", user_id)
+
+            return ai_result
+        except Exception as e:
+            print(f"⚠️ [Core] AI Error: {e}")
+            return None
 
     async def _log_game_detection(self, app_name: str, detection_source: str, user_id: str):
         """
@@ -343,38 +467,6 @@ class TrackingService(tracking_pb2_grpc.TrackingServiceServicer, core_pb2_grpc.C
         # ... (Legacy Implementation or just redirect) ...
         return tracking_pb2.AppListResponse(success=True, message="Deprecated. Use SyncClient.")
 
-    async def _get_blacklist(self):
-        """
-        Fetch blacklist from Data Service with caching
-        """
-        import time
-        import httpx
-
-        now = time.time()
-        if now - self._blacklist_last_updated < self._blacklist_ttl:
-            return self._blacklist_cache
-
-        try:
-            # Internal Cluster URL for Data Service
-            url = "http://jiaa-server-data.jiaa.svc.cluster.local:8082/api/v1/blacklist"
-            async with httpx.AsyncClient(timeout=2.0) as client:
-                resp = await client.get(url)
-                if resp.status_code == 200:
-                    data = resp.json().get("data", [])
-                    # Extract appName from list of objects
-                    new_list = [item["appName"] for item in data if item.get("appName")]
-                    
-                    if new_list:
-                        self._blacklist_cache = new_list
-                        self._blacklist_last_updated = now
-                        # print(f"🔄 [Tracking] Blacklist Updated: {len(new_list)} items")
-                    
-                    return self._blacklist_cache
-        except Exception as e:
-            print(f"⚠️ [Tracking] Failed to fetch blacklist: {e}")
-        
-        return self._blacklist_cache
-
     async def ReportAnalysisResult(self, request, context):
         print(f"📊 [Core] Analysis Report: {request.type}")
         return core_pb2.Ack(success=True)
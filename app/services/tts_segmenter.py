@@ -0,0 +1,140 @@
+import asyncio
+import re
+import time
+from typing import AsyncIterator, Callable, List, Optional, TypeVar
+
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+_EMOJI = "\u2600-\u27bf\U0001F300-\U0001FAFF"  # symbols (♡, ☆) and emoji
+# Where a TTS chunk may end:
+# - strong: sentence punctuation / newline / emoji runs (+ closing quotes), not inside "3.5" or "1~2"
+# - ending: polite / interrogative Korean sentence endings once the next word started
+#   ("알겠어요 바로"), but not the connective "-니까" ("그러니까 오늘은")
+# - comma: clause boundary, only after enough text
+_BREAK = re.compile(
+    rf"(?P<strong>[.!?…~\n{_EMOJI}]+[)\]\"'」』]*)(?!\d)"
+    rf"|(?P<ending>(?:요|니다|습니까|죠|(?<!니)까))(?=\s+[^\s.!?…~{_EMOJI}]|\s*$)"
+    r"|(?P<comma>[,，、])"
+)
+
+
+class TTSSegmenter:
+    """
+    Incremental splitter of streamed reply text into TTS chunks.
+
+    - The first chunk goes out at the earliest natural break with
+      `first_min_chars`, so audio starts as soon as possible.
+    - Later chunks need `min_chars` and take the last break available, which
+      merges short sentences instead of sending tiny fragments.
+    - Timer: text that waited `latency_target` (first chunk) / `max_wait`
+      (later) seconds without a break is cut at the last break or space.
+      Callers drive it with wait_time() + poll().
+    - Nothing is held past `max_chars`.
+    """
+
+    def __init__(self, latency_target: float = 0.5, max_wait: float = 1.2, min_chars: int = 10,
+                 first_min_chars: int = 2, max_chars: int = 120, clock: Callable[[], float] = time.monotonic):
+        self.latency_target = latency_target
+        self.max_wait = max_wait
+        self.min_chars = min_chars
+        self.first_min_chars = first_min_chars
+        self.max_chars = max_chars
+        self.clock = clock
+        self._buf = ""
+        self._since: Optional[float] = None   # when the buffered text started waiting
+        self.emitted = 0
+
+    @classmethod
+    def from_settings(cls, **kwargs) -> "TTSSegmenter":
+        settings = get_settings()
+        return cls(latency_target=settings.TTS_LATENCY_TARGET_MS / 1000, max_wait=settings.TTS_MAX_WAIT_MS / 1000,
+                   min_chars=settings.TTS_MIN_CHUNK_CHARS, **kwargs)
+
+    def push(self, text: str) -> List[str]:
+        if not text:
+            return []
+        if self._since is None:
+            self._since = self.clock()
+        self._buf += text
+        return self._emit(self._cut(force=False))
+
+    def wait_time(self) -> Optional[float]:
+        """Seconds until poll() should run (None: nothing buffered)."""
+        if self._since is None or not self._buf.strip():
+            return None
+        wait = self.latency_target if self.emitted == 0 else self.max_wait
+        return max(0.0, self._since + wait - self.clock())
+
+    def poll(self) -> List[str]:
+        """Timer expired: cut what is there at the best available point."""
+        wait = self.wait_time()
+        if wait is None or wait > 0:
+            return []
+        segments = self._emit(self._cut(force=True))
+        if not segments:
+            self._since = self.clock()  # one unbroken word so far: give it another period
+        return segments
+
+    def flush(self) -> List[str]:
+        return self._emit(len(self._buf))
+
+    def _cut(self, force: bool) -> int:
+        buf = self._buf
+        first = self.emitted == 0
+        need = self.first_min_chars if first else self.min_chars
+        best = -1
+        # The buffer never exceeds max_chars (+ one delta), so this scan is bounded
+        for match in _BREAK.finditer(buf):
+            end = match.end()
+            if not force and not buf[end:].strip():
+                continue  # "요" / "!" at the very end: the sentence may go on ("요?!", "요 😊")
+            threshold = self.min_chars if match.lastgroup == "comma" else need
+            if force or end >= threshold:
+                best = end
+                if first:
+                    break  # earliest break: first audio as soon as possible
+        if best < 0 and (force or len(buf) > self.max_chars):
+            limit = len(buf) if force else self.max_chars
+            space = buf.rfind(" ", 0, limit)
+            best = space if space > 0 else (-1 if force else self.max_chars)
+        return best
+
+    def _emit(self, cut: int) -> List[str]:
+        if cut <= 0:
+            return []
+        segment = self._buf[:cut].strip()
+        self._buf = self._buf[cut:].lstrip()
+        self._since = self.clock() if self._buf else None
+        if not segment:
+            return []
+        self.emitted += 1
+        return [segment]
+
+
+async def iterate_with_timer(stream: AsyncIterator[T], timeout: Callable[[], Optional[float]]) -> AsyncIterator[Optional[T]]:
+    """
+    Relays `stream`, yielding None whenever `timeout()` seconds pass without a new
+    item (timeout() returning None means wait indefinitely). The pending read is
+    kept across ticks, so no item is lost and the stream is never interrupted.
+    """
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(stream.__anext__())
+            done, _ = await asyncio.wait({pending}, timeout=timeout())
+            if not done:
+                yield None
+                continue
+            task, pending = pending, None
+            try:
+                item = task.result()
+            except StopAsyncIteration:
+                return
+            yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.wait({pending})
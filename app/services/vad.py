@@ -0,0 +1,74 @@
+import numpy as np
+
+# 16kHz mono 16-bit PCM, 30ms frames
+SAMPLE_RATE = 16000
+FRAME_SAMPLES = SAMPLE_RATE * 30 // 1000
+FRAME_BYTES = FRAME_SAMPLES * 2
+
+MIN_SPEECH_RMS = 300         # absolute floor (int16 RMS) for a speech frame
+NOISE_FLOOR_RATIO = 3.0      # ... or this many times the clip's own noise floor
+HIGH_ZCR = 0.35              # zero-crossing rate of hiss / fan noise
+MIN_SPEECH_FRAMES = 5        # < 150ms of speech = noise trigger
+PAD_FRAMES = 7               # ~200ms kept around speech so Whisper hears the onsets
+
+
+class VadResult:
+    """Speech region of a clip (byte offsets into the PCM) and its loudness."""
+
+    __slots__ = ("start", "end", "speech_frames", "level_db")
+
+    def __init__(self, start: int, end: int, speech_frames: int, level_db: float):
+        self.start = start                  # first kept byte
+        self.end = end                      # byte after the last kept sample
+        self.speech_frames = speech_frames
+        self.level_db = level_db            # speech RMS, dB re 1 LSB (0 ~ 90)
+
+    @property
+    def has_speech(self) -> bool:
+        return self.speech_frames >= MIN_SPEECH_FRAMES
+
+
+def _frames(pcm) -> np.ndarray:
+    samples = np.frombuffer(pcm, dtype=np.int16, count=len(pcm) // 2)
+    n = len(samples) // FRAME_SAMPLES
+    return samples[:n * FRAME_SAMPLES].reshape(n, FRAME_SAMPLES).astype(np.float32)
+
+
+def frame_rms(pcm) -> np.ndarray:
+    """RMS of every complete 30ms frame in `pcm` (bytes / memoryview of int16 PCM)."""
+    frames = _frames(pcm)
+    return np.sqrt(np.mean(frames * frames, axis=1))
+
+
+def level_db(rms: float) -> float:
+    return float(20 * np.log10(max(rms, 1.0)))
+
+
+def detect(pcm) -> VadResult:
+    """
+    Energy + zero-crossing VAD over a whole clip, vectorized per frame.
+    A frame is voiced speech when it is loud enough (absolute floor and relative to
+    the clip's noise floor) and not hiss-like (high ZCR). Fricatives at the edges
+    of an utterance are covered by the PAD_FRAMES margin.
+    """
+    frames = _frames(pcm)
+    if not len(frames):
+        return VadResult(0, 0, 0, 0.0)
+
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / FRAME_SAMPLES
+
+    # Relative to the noise floor, but never above half the loud frames (a clip that is all speech)
+    noise_floor, loud = np.percentile(rms, (10, 90))
+    threshold = max(MIN_SPEECH_RMS, min(float(noise_floor) * NOISE_FLOOR_RATIO, float(loud) * 0.5))
+    speech = (rms > threshold) & (zcr < HIGH_ZCR)
+    speech_idx = np.flatnonzero(speech)
+    if not len(speech_idx):
+        return VadResult(0, 0, 0, level_db(float(np.sqrt(np.mean(rms * rms)))))
+
+    first = max(0, int(speech_idx[0]) - PAD_FRAMES)
+    last = min(len(frames), int(speech_idx[-1]) + 1 + PAD_FRAMES)
+    end = len(pcm) - len(pcm) % 2 if last == len(frames) else last * FRAME_BYTES
+    speech_rms = float(np.sqrt(np.mean(rms[speech_idx] ** 2)))
+    return VadResult(first * FRAME_BYTES, end, len(speech_idx), level_db(speech_rms))
@@ -0,0 +1,116 @@
+import asyncio
+import itertools
+import time
+from typing import AsyncIterator, Awaitable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+_turn_ids = itertools.count(1)
+
+
+class VoiceTurn:
+    """
+    One voice utterance -> response pipeline of a user.
+
+    Work belonging to the turn (STT, context prefetch, LLM stream steps, note
+    generation) runs as tasks owned by the turn, so a barge-in can cancel all
+    of it at once.
+    """
+
+    __slots__ = ("turn_id", "user_id", "key", "started_at", "superseded", "_tasks")
+
+    def __init__(self, user_id: str, key: Optional[str] = None):
+        self.turn_id = next(_turn_ids)
+        self.user_id = user_id
+        self.key = key or user_id  # registry slot: a new turn with the same key supersedes this one
+        self.started_at = time.monotonic()
+        self.superseded = False
+        self._tasks = set()
+
+    def track(self, task: asyncio.Future) -> asyncio.Future:
+        """Attaches an already running task to this turn."""
+        if self.superseded:
+            task.cancel()
+            return task
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def spawn(self, coro) -> asyncio.Task:
+        return self.track(asyncio.ensure_future(coro))
+
+    async def run(self, coro: Awaitable[T]) -> Optional[T]:
+        """Awaits `coro` as part of the turn. Returns None if the turn is superseded meanwhile."""
+        try:
+            return await self.spawn(coro)
+        except asyncio.CancelledError:
+            if self.superseded:
+                return None
+            raise
+
+    async def iterate(self, stream: AsyncIterator[T]) -> AsyncIterator[T]:
+        """
+        Relays an async generator (e.g. the LLM stream) until it ends or the turn
+        is superseded. On barge-in the generator is closed, which stops the upstream
+        Bedrock stream instead of letting it generate tokens nobody will hear.
+        """
+        try:
+            while not self.superseded:
+                step = self.spawn(stream.__anext__())
+                try:
+                    item = await step
+                except StopAsyncIteration:
+                    return
+                except asyncio.CancelledError:
+                    if self.superseded:
+                        return
+                    raise
+                yield item
+        finally:
+            await stream.aclose()
+
+    def cancel(self):
+        self.superseded = True
+        for task in list(self._tasks):
+            task.cancel()
+
+
+class VoiceTurnRegistry:
+    """
+    Latest voice turn per user; starting a new one supersedes the previous.
+
+    Streams without a verified identity pass their own `key` (one per stream),
+    so unrelated anonymous clients never cancel each other's turns.
+    """
+
+    def __init__(self):
+        self._active: Dict[str, VoiceTurn] = {}
+        self.turns = 0
+        self.barge_ins = 0
+
+    def begin(self, user_id: str, key: Optional[str] = None) -> VoiceTurn:
+        turn = VoiceTurn(user_id, key)
+        previous = self._active.get(turn.key)
+        if previous is not None:
+            self.barge_ins += 1
+            previous.cancel()
+            print(f"✋ [Voice] Barge-in by {user_id}: turn #{previous.turn_id} superseded by #{turn.turn_id}")
+        self._active[turn.key] = turn
+        self.turns += 1
+        return turn
+
+    def end(self, turn: VoiceTurn):
+        """Turn finished (or its stream went away): stop whatever it still has running."""
+        turn.cancel()
+        if self._active.get(turn.key) is turn:
+            del self._active[turn.key]
+
+    def current(self, user_id: str) -> Optional[VoiceTurn]:
+        return self._active.get(user_id)
+
+    def stats(self) -> dict:
+        return {"active_turns": len(self._active), "turns": self.turns, "barge_ins": self.barge_ins}
+
+
+# Global Instance
+voice_turns = VoiceTurnRegistry()
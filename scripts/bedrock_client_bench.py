@@ -0,0 +1,100 @@
+"""
+Bedrock Client Benchmark - per-call construction vs the pooled get_llm().
+
+Reports, for the old pattern (new boto3 client + ChatBedrock on every call)
+and the pooled one:
+- construction overhead per get_llm() call (p50/p95 over --repeat runs)
+- with --live: end-to-end latency of a tiny Haiku invoke, which also pays the
+  TLS handshake on every fresh client (needs AWS credentials)
+
+Usage:
+    python scripts/bedrock_client_bench.py --repeat 50
+    python scripts/bedrock_client_bench.py --live --calls 10 --json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Construction does not talk to AWS; dummy keys keep the offline run credential-free
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "bench")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "bench")
+
+from langchain_aws import ChatBedrock  # noqa: E402
+
+from app.core import llm as llm_pool  # noqa: E402
+from app.core.config import get_settings  # noqa: E402
+
+settings = get_settings()
+PROMPT = "한 단어로 대답해: 안녕?"
+
+
+def unpooled_llm(model_id: str, temperature: float):
+    """The pre-pool get_llm(): a fresh client (and connection pool) per call."""
+    return ChatBedrock(
+        client=llm_pool.create_bedrock_client(),
+        model_id=model_id,
+        model_kwargs={"temperature": temperature, "max_tokens": 4096},
+        region_name=settings.BEDROCK_REGION,
+    )
+
+
+def percentiles(timings: list) -> dict:
+    timings = sorted(timings)
+    return {
+        "p50_ms": round(statistics.median(timings) * 1000, 2),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))] * 1000, 2),
+    }
+
+
+def bench_construction(factory, repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        factory(llm_pool.HAIKU_MODEL_ID, 0.1)
+        timings.append(time.perf_counter() - start)
+    return percentiles(timings)
+
+
+def bench_invoke(factory, calls: int) -> dict:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        factory(llm_pool.HAIKU_MODEL_ID, 0.1).invoke(PROMPT)
+        timings.append(time.perf_counter() - start)
+    return percentiles(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bedrock client pooling benchmark")
+    parser.add_argument("--repeat", type=int, default=30, help="get_llm() calls per variant")
+    parser.add_argument("--live", action="store_true", help="also invoke Haiku (needs AWS credentials)")
+    parser.add_argument("--calls", type=int, default=5, help="live invokes per variant")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    variants = {"per_call": unpooled_llm, "pooled": llm_pool.get_llm}
+    report = {"construction": {}, "invoke": {}}
+    for name, factory in variants.items():
+        llm_pool.reset_llm_pool()
+        report["construction"][name] = bench_construction(factory, args.repeat)
+    if args.live:
+        for name, factory in variants.items():
+            llm_pool.reset_llm_pool()
+            factory(llm_pool.HAIKU_MODEL_ID, 0.1)  # both variants start from a built object
+            report["invoke"][name] = bench_invoke(factory, args.calls)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    for section, results in report.items():
+        for name, stats in results.items():
+            print(f"{section:<13} {name:<9} p50 {stats['p50_ms']:>9.2f}ms   p95 {stats['p95_ms']:>9.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+"""
+Heartbeat Fleet Simulator - CoreService.SyncClient throughput benchmark.
+
+Starts a local gRPC server (TrackingService as CoreService) in a child process
+with the Data Service and the LLM stubbed out, then opens N bidirectional
+SyncClient streams that send realistic 1 Hz ClientHeartbeat sequences.
+
+Reports:
+- heartbeats/sec actually delivered
+- p50/p99 heartbeat -> command latency (blacklisted-game streams)
+- server event-loop lag (p50/p99/max)
+- server RSS per stream
+
+Usage:
+    python scripts/heartbeat_fleet_sim.py --streams 2000 --duration 30
+    python scripts/heartbeat_fleet_sim.py --streams 5000 --mix coder=0.7,gamer=0.1,unknown_game=0.1,idle=0.1 --json
+"""
+import argparse
+import asyncio
+import base64
+import collections
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_MIX = "coder=0.6,gamer=0.1,unknown_game=0.1,idle=0.2"
+
+BASE_APPS = ["Code", "Google Chrome", "Slack", "Terminal", "Finder", "KakaoTalk", "Notion", "Spotify"]
+
+
+# =============================================================================
+# Server (child process)
+# =============================================================================
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    # ru_maxrss is KB on Linux, bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def _install_stubs(llm_latency: float):
+    """Replace Redis-backed memory, the Data Service and Bedrock with local stubs."""
+    import types
+
+    class _StubMemory:
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: None
+
+    memory_module = types.ModuleType("app.services.memory_service")
+    memory_module.memory_service = _StubMemory()
+    memory_module.MemoryService = _StubMemory
+    sys.modules["app.services.memory_service"] = memory_module
+
+    from app.services import game_detector
+    from app.schemas.game import GameDetectResponse
+    from app.services.tracking_service import TrackingService
+
+    async def fake_detect_games(request):
+        await asyncio.sleep(llm_latency)
+        games = [a for a in request.apps if "Minecraft" in a]
+        if games:
+            return GameDetectResponse(is_game_detected=True, target_app=games[0],
+                                      detected_games=games, message="지금 게임할 시간입니까?", confidence=1.0)
+        return GameDetectResponse(is_game_detected=False, message="No games detected.", confidence=1.0)
+
+    async def fake_log_game_detection(self, app_name, detection_source, user_id):
+        return None
+
+    game_detector.detect_games = fake_detect_games
+    TrackingService._log_game_detection = fake_log_game_detection
+    return TrackingService
+
+
+def run_server(port: int, llm_latency: float, conn):
+    asyncio.run(_serve(port, llm_latency, conn))
+
+
+async def _serve(port: int, llm_latency: float, conn):
+    TrackingService = _install_stubs(llm_latency)
+    import grpc
+    from app.protos import core_pb2_grpc
+    from app.core.stream_registry import stream_registry
+
+    server = grpc.aio.server()
+    core_pb2_grpc.add_CoreServiceServicer_to_server(TrackingService(), server)
+    server.add_insecure_port(f"127.0.0.1:{port}")
+    await server.start()
+
+    lags = collections.deque(maxlen=20000)
+
+    async def monitor_loop_lag(interval=0.05):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lags.append(time.perf_counter() - start - interval)
+
+    monitor = asyncio.create_task(monitor_loop_lag())
+    loop = asyncio.get_running_loop()
+    conn.send({"ready": True, "rss": _rss_bytes()})
+
+    while True:
+        msg = await loop.run_in_executor(None, conn.recv)
+        if msg == "sample":
+            lag_list = sorted(lags)
+            lags.clear()
+            conn.send({
+                "rss": _rss_bytes(),
+                "streams": stream_registry.stats(),
+                "lag": _percentiles(lag_list),
+            })
+        elif msg == "stop":
+            monitor.cancel()
+            await server.stop(grace=1.0)
+            conn.send({"stopped": True})
+            return
+
+
+# =============================================================================
+# Clients (parent process)
+# =============================================================================
+
+def _percentiles(values):
+    if not values:
+        return {"p50": 0.0, "p99": 0.0, "max": 0.0, "count": 0}
+    values = sorted(values)
+    n = len(values)
+    return {
+        "p50": values[int(0.50 * (n - 1))],
+        "p99": values[int(0.99 * (n - 1))],
+        "max": values[-1],
+        "count": n,
+    }
+
+
+def _fake_token(user_id: str) -> str:
+    def b64(obj):
+        return base64.b64encode(json.dumps(obj).encode()).decode().rstrip("=")
+    return f"{b64({'alg': 'none'})}.{b64({'sub': user_id})}.sig"
+
+
+class Profile:
+    """Heartbeat generator for one simulated user."""
+
+    def __init__(self, kind: str, rng: random.Random):
+        self.kind = kind
+        self.rng = rng
+        self.apps = rng.sample(BASE_APPS, k=rng.randint(3, 6))
+        if kind == "gamer":
+            self.apps.append(rng.choice(["League of Legends", "Riot Client", "Steam", "Overwatch"]))
+        elif kind == "unknown_game":
+            self.apps.append("Minecraft Launcher")
+        self._apps_json = json.dumps(self.apps)
+
+    def next(self):
+        from app.protos import core_pb2
+        rng = self.rng
+
+        # App list changes now and then (new tab / app), exercising the slow path
+        if rng.random() < 0.02:
+            self._apps_json = json.dumps(self.apps + [f"Google Chrome - tab {rng.randint(0, 999)}"])
+
+        if self.kind == "coder":
+            keys, entropy, clicks, mouse = rng.randint(5, 30), rng.uniform(3.8, 4.8), rng.randint(0, 3), rng.randint(0, 600)
+        elif self.kind in ("gamer", "unknown_game"):
+            keys, entropy, clicks, mouse = rng.randint(6, 40), rng.uniform(1.0, 2.8), rng.randint(5, 25), rng.randint(400, 3000)
+        else:
+            keys, entropy, clicks, mouse = 0, 0.0, rng.randint(0, 1), rng.randint(0, 50)
+
+        return core_pb2.ClientHeartbeat(
+            client_id="sim",
+            keystroke_count=keys,
+            keyboard_entropy=entropy,
+            click_count=clicks,
+            mouse_distance=mouse,
+            is_os_idle=self.kind == "idle",
+            apps_json=self._apps_json,
+        )
+
+
+class Stats:
+    def __init__(self):
+        self.sent = 0
+        self.commands = collections.Counter()
+        self.latencies = []
+        self.errors = 0
+
+
+async def run_stream(stub, user_id: str, profile: Profile, interval: float, stop_at: float, stats: Stats):
+    from app.protos import core_pb2
+
+    # Blacklisted-game streams answer every heartbeat with exactly one KILL_PROCESS,
+    # so send -> receive latency can be matched FIFO.
+    track_latency = profile.kind == "gamer"
+    pending = collections.deque()
+
+    async def heartbeats():
+        # Spread the first heartbeat over one interval so streams don't tick in lockstep
+        await asyncio.sleep(profile.rng.uniform(0, interval))
+        while time.perf_counter() < stop_at:
+            hb = profile.next()
+            if track_latency:
+                pending.append(time.perf_counter())
+            stats.sent += 1
+            yield hb
+            await asyncio.sleep(interval)
+
+    try:
+        call = stub.SyncClient(heartbeats(), metadata=[("authorization", f"Bearer {_fake_token(user_id)}")])
+        async for command in call:
+            stats.commands[core_pb2.ServerCommand.CommandType.Name(command.type)] += 1
+            if track_latency and command.type == core_pb2.ServerCommand.KILL_PROCESS and pending:
+                stats.latencies.append(time.perf_counter() - pending.popleft())
+    except Exception as e:
+        if time.perf_counter() < stop_at:
+            stats.errors += 1
+            if stats.errors <= 5:
+                print(f"⚠️ [Sim] Stream {user_id} error: {e}")
+
+
+def _parse_mix(mix: str):
+    kinds, weights = [], []
+    for part in mix.split(","):
+        kind, weight = part.split("=")
+        kinds.append(kind.strip())
+        weights.append(float(weight))
+    return kinds, weights
+
+
+async def run_fleet(args, conn):
+    import grpc
+    from app.protos import core_pb2_grpc
+
+    rng = random.Random(args.seed)
+    kinds, weights = _parse_mix(args.mix)
+    stats = Stats()
+
+    n_channels = max(1, -(-args.streams // args.streams_per_channel))
+    channels = [grpc.aio.insecure_channel(f"127.0.0.1:{args.port}") for _ in range(n_channels)]
+    stubs = [core_pb2_grpc.CoreServiceStub(ch) for ch in channels]
+
+    start = time.perf_counter()
+    stop_at = start + args.ramp + args.duration
+    tasks = []
+    for i in range(args.streams):
+        profile = Profile(rng.choices(kinds, weights)[0], random.Random(rng.random()))
+        tasks.append(asyncio.create_task(
+            run_stream(stubs[i % n_channels], f"sim-{i}", profile, args.interval, stop_at, stats)
+        ))
+        # Ramp up connections evenly
+        if args.ramp and i % 100 == 99:
+            await asyncio.sleep(args.ramp * 100 / args.streams)
+
+    # Steady state: measure only after the ramp
+    await asyncio.sleep(max(0.0, start + args.ramp - time.perf_counter()))
+    conn.send("sample")  # reset server lag window
+    conn.recv()
+    sent_before, lat_before = stats.sent, len(stats.latencies)
+    steady_start = time.perf_counter()
+
+    await asyncio.sleep(max(0.0, stop_at - time.perf_counter()))
+    steady_elapsed = time.perf_counter() - steady_start
+    conn.send("sample")
+    server = conn.recv()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+    for ch in channels:
+        await ch.close()
+
+    return stats, server, steady_elapsed, stats.sent - sent_before, stats.latencies[lat_before:]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SyncClient heartbeat fleet simulator")
+    parser.add_argument("--streams", type=int, default=1000, help="number of concurrent SyncClient streams")
+    parser.add_argument("--duration", type=float, default=30.0, help="steady-state seconds to measure")
+    parser.add_argument("--ramp", type=float, default=10.0, help="seconds to open all streams")
+    parser.add_argument("--interval", type=float, default=1.0, help="heartbeat interval per stream (s)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="profile weights, e.g. " + DEFAULT_MIX)
+    parser.add_argument("--llm-latency", type=float, default=0.8, help="stubbed AI judge latency (s)")
+    parser.add_argument("--streams-per-channel", type=int, default=100)
+    parser.add_argument("--port", type=int, default=50061)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    ctx = multiprocessing.get_context("spawn")
+    parent_conn, child_conn = ctx.Pipe()
+    server_proc = ctx.Process(target=run_server, args=(args.port, args.llm_latency, child_conn), daemon=True)
+    server_proc.start()
+    baseline = parent_conn.recv()
+
+    try:
+        stats, server, elapsed, sent, latencies = asyncio.run(run_fleet(args, parent_conn))
+    finally:
+        parent_conn.send("stop")
+        if parent_conn.poll(5):
+            parent_conn.recv()
+        server_proc.join(timeout=5)
+
+    live = server["streams"]["live_streams"] or args.streams
+    report = {
+        "streams": args.streams,
+        "live_streams": server["streams"]["live_streams"],
+        "duration_s": round(elapsed, 2),
+        "heartbeats_per_sec": round(sent / elapsed, 1) if elapsed else 0.0,
+        "command_latency_ms": {k: round(v * 1000, 2) if k != "count" else v
+                               for k, v in _percentiles(latencies).items()},
+        "event_loop_lag_ms": {k: round(v * 1000, 2) if k != "count" else v
+                              for k, v in server["lag"].items()},
+        "rss_mb": round(server["rss"] / 1e6, 1),
+        "rss_per_stream_kb": round((server["rss"] - baseline["rss"]) / live / 1024, 2),
+        "commands": dict(stats.commands),
+        "stream_errors": stats.errors,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print("=" * 60)
+    print("⚡ SyncClient Fleet Simulation")
+    print("=" * 60)
+    print(f"Streams:            {report['streams']} (live at end: {report['live_streams']})")
+    print(f"Steady state:       {report['duration_s']}s")
+    print(f"Heartbeats/sec:     {report['heartbeats_per_sec']}")
+    lat = report["command_latency_ms"]
+    print(f"Command latency:    p50={lat['p50']}ms p99={lat['p99']}ms max={lat['max']}ms (n={lat['count']})")
+    lag = report["event_loop_lag_ms"]
+    print(f"Event-loop lag:     p50={lag['p50']}ms p99={lag['p99']}ms max={lag['max']}ms")
+    print(f"Server RSS:         {report['rss_mb']} MB ({report['rss_per_stream_kb']} KB/stream)")
+    print(f"Commands received:  {report['commands']}")
+    print(f"Stream errors:      {report['stream_errors']}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Prompt Cache Report - chat_with_persona with and without Bedrock prompt caching.
+
+Reports the static (cacheable) system block vs the per-turn block of
+chat_with_persona and, with --live, runs the same turns against Haiku with the
+cache checkpoint on and off:
+- input tokens billed at full price, cache read / cache write tokens
+- time to first token and total latency (p50)
+
+Bedrock only caches prefixes of at least the model's minimum (2048 tokens for
+Claude 3.5 Haiku); shorter prefixes are processed normally, which shows up
+here as zero cache reads.
+
+Usage:
+    python scripts/prompt_cache_report.py
+    python scripts/prompt_cache_report.py --live --turns 5 --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# The cached run needs the checkpoint, whatever the server default is
+os.environ["BEDROCK_PROMPT_CACHE"] = "true"
+
+from langchain_core.messages import HumanMessage, SystemMessage  # noqa: E402
+
+from app.core.llm import HAIKU_MODEL_ID, cached_system_message, get_llm  # noqa: E402
+from app.services.persona_prompt import PERSONA_SYSTEM_PROMPT  # noqa: E402
+
+MIN_CACHEABLE_TOKENS = 2048  # Claude 3.5 Haiku on Bedrock
+SAMPLE_TURN = """Your user is **"dev1"**.
+
+[Persona]
+GENTLE mode: Be warm and supportive. Praise the user.
+
+[Semantic Memory]
+(none)
+
+[Behavioral Report]
+=== Behavioral Report ===
+Study Time: 120 min
+Play Time: 15 min
+Play Ratio: 11.1%
+=========================
+
+Input Text: {text}
+"""
+INPUTS = ["VSCode 켜줘", "롤 한 판만 할게", "알았어 그만할게", "오늘 공부한 거 정리해줘", "심심해"]
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough count without a tokenizer: ~4 chars per ASCII token, ~1 token per Hangul syllable."""
+    hangul = len(re.findall(r"[가-힣]", text))
+    return (len(text) - hangul) // 4 + hangul
+
+
+def system_message(cached: bool) -> SystemMessage:
+    if cached:
+        return cached_system_message(PERSONA_SYSTEM_PROMPT, HAIKU_MODEL_ID)
+    return SystemMessage(content=PERSONA_SYSTEM_PROMPT)
+
+
+async def run_turn(llm, cached: bool, text: str) -> dict:
+    messages = [system_message(cached), HumanMessage(content=SAMPLE_TURN.format(text=text))]
+    start = time.perf_counter()
+    first_token = None
+    message = None
+    async for chunk in llm.astream(messages):
+        if first_token is None and chunk.content:
+            first_token = time.perf_counter() - start
+        message = chunk if message is None else message + chunk
+    usage = message.usage_metadata or {}
+    details = usage.get("input_token_details") or {}
+    return {
+        "ttft": first_token or 0.0,
+        "total": time.perf_counter() - start,
+        "input_tokens": usage.get("input_tokens", 0),
+        "cache_read": details.get("cache_read", 0),
+        "cache_write": details.get("cache_creation", 0),
+    }
+
+
+async def live_report(turns: int) -> dict:
+    llm = get_llm(HAIKU_MODEL_ID, temperature=0.1)
+    report = {}
+    for cached in (False, True):
+        runs = [await run_turn(llm, cached, INPUTS[i % len(INPUTS)]) for i in range(turns)]
+        report["cached" if cached else "uncached"] = {
+            "ttft_p50_ms": round(statistics.median(r["ttft"] for r in runs) * 1000),
+            "total_p50_ms": round(statistics.median(r["total"] for r in runs) * 1000),
+            "input_tokens": sum(r["input_tokens"] for r in runs),
+            "cache_read_tokens": sum(r["cache_read"] for r in runs),
+            "cache_write_tokens": sum(r["cache_write"] for r in runs),
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bedrock prompt caching report for chat_with_persona")
+    parser.add_argument("--live", action="store_true", help="call Haiku (needs AWS credentials)")
+    parser.add_argument("--turns", type=int, default=5, help="live turns per variant")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    static_tokens = estimate_tokens(PERSONA_SYSTEM_PROMPT)
+    report = {
+        "static_block": {"chars": len(PERSONA_SYSTEM_PROMPT), "est_tokens": static_tokens,
+                         "cacheable": static_tokens >= MIN_CACHEABLE_TOKENS},
+        "turn_block": {"est_tokens": estimate_tokens(SAMPLE_TURN.format(text=INPUTS[0]))},
+    }
+    if args.live:
+        report["live"] = asyncio.run(live_report(args.turns))
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    static = report["static_block"]
+    print(f"static block  {static['chars']} chars, ~{static['est_tokens']} tokens "
+          f"({'cacheable' if static['cacheable'] else f'below the {MIN_CACHEABLE_TOKENS}-token cache minimum'})")
+    print(f"turn block    ~{report['turn_block']['est_tokens']} tokens")
+    for name, stats in report.get("live", {}).items():
+        print(f"{name:<9} TTFT p50 {stats['ttft_p50_ms']:>5}ms  total p50 {stats['total_p50_ms']:>5}ms  "
+              f"input {stats['input_tokens']:>6}  cache read {stats['cache_read_tokens']:>6}  "
+              f"cache write {stats['cache_write_tokens']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+STT Upload Benchmark - WAV vs FLAC vs Opus for Groq Whisper.
+
+Encodes the same utterance in every upload format and reports, per format:
+- upload bytes and ratio vs WAV
+- encode time (p50 over --repeat runs)
+- estimated upload time at --egress-mbps (+ RTT)
+- with --live: real transcribe_bytes latency and transcript (needs GROQ_API_KEY)
+
+Input is a 16kHz mono 16-bit WAV/PCM file (--input) or a synthetic
+speech-like signal.
+
+Usage:
+    python scripts/stt_upload_bench.py --seconds 5 --egress-mbps 2
+    python scripts/stt_upload_bench.py --input sample_ko.wav --live --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import audio_codec, stt  # noqa: E402
+from app.services.audio_buffer import AudioBuffer  # noqa: E402
+
+
+def synthetic_speech(seconds: float, seed: int = 0) -> bytes:
+    """Syllable-rate modulated harmonics with pauses and a little room noise."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * 16000)) / 16000
+    pitch = 160 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / 16000
+    voiced = sum(np.sin(k * phase) / k for k in range(1, 8))
+    syllables = np.clip(np.sin(2 * np.pi * 4 * t), 0, None) * (np.sin(2 * np.pi * 0.25 * t) > -0.6)
+    signal = voiced * syllables * 4000 + rng.normal(0, 80, len(t))
+    return signal.astype(np.int16).tobytes()
+
+
+def load_pcm(path: str) -> bytes:
+    with open(path, "rb") as f:
+        data = f.read()
+    buffer = AudioBuffer()
+    buffer.extend(data)  # drops a WAV header if present
+    return bytes(buffer.pcm())
+
+
+def bench_encode(pcm: bytes, upload_format: str, repeat: int) -> dict:
+    buffer = AudioBuffer.from_pcm(pcm)
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        audio_file, ext = audio_codec.encode(buffer, upload_format)
+        timings.append(time.perf_counter() - start)
+        size = audio_file.size
+        audio_file.close()
+    return {"ext": ext, "bytes": size, "encode_ms": statistics.median(timings) * 1000}
+
+
+async def bench_live(pcm: bytes, upload_format: str, repeat: int) -> dict:
+    timings = []
+    text = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await stt.transcribe_bytes(AudioBuffer.from_pcm(pcm), upload_format=upload_format)
+        timings.append(time.perf_counter() - start)
+        text = result.text
+    return {"stt_ms_p50": statistics.median(timings) * 1000, "stt_ms_max": max(timings) * 1000, "text": text}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="STT upload format benchmark")
+    parser.add_argument("--input", help="16kHz mono 16-bit WAV or raw PCM file")
+    parser.add_argument("--seconds", type=float, default=5.0, help="synthetic utterance length")
+    parser.add_argument("--formats", default=",".join(audio_codec.UPLOAD_FORMATS))
+    parser.add_argument("--repeat", type=int, default=20, help="encode runs per format")
+    parser.add_argument("--egress-mbps", type=float, default=5.0, help="uplink used for the upload estimate")
+    parser.add_argument("--rtt-ms", type=float, default=40.0)
+    parser.add_argument("--live", action="store_true", help="also call Groq Whisper (GROQ_API_KEY)")
+    parser.add_argument("--live-repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    pcm = load_pcm(args.input) if args.input else synthetic_speech(args.seconds)
+    duration = len(pcm) / 32000
+    wav_bytes = len(pcm) + 44
+
+    report = {"audio_seconds": round(duration, 2), "formats": {}}
+    for upload_format in args.formats.split(","):
+        row = bench_encode(pcm, upload_format, args.repeat)
+        upload_ms = row["bytes"] * 8 / (args.egress_mbps * 1e6) * 1000 + args.rtt_ms
+        row.update({
+            "ratio": round(row["bytes"] / wav_bytes, 3),
+            "encode_ms": round(row["encode_ms"], 2),
+            "upload_ms_est": round(upload_ms, 1),
+            "prep_plus_upload_ms": round(row["encode_ms"] + upload_ms, 1),
+        })
+        if args.live:
+            live = asyncio.run(bench_live(pcm, upload_format, args.live_repeat))
+            row.update({k: round(v, 1) if isinstance(v, float) else v for k, v in live.items()})
+        report["formats"][upload_format] = row
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return
+
+    print("=" * 72)
+    print(f"🗜️ STT Upload Benchmark ({report['audio_seconds']}s audio, "
+          f"{args.egress_mbps} Mbps egress, {args.rtt_ms:.0f}ms RTT)")
+    print("=" * 72)
+    print(f"{'format':<8}{'bytes':>10}{'ratio':>8}{'encode ms':>11}{'upload ms':>11}{'total ms':>10}"
+          + (f"{'STT p50 ms':>12}" if args.live else ""))
+    for upload_format, row in report["formats"].items():
+        line = (f"{upload_format:<8}{row['bytes']:>10}{row['ratio']:>8}{row['encode_ms']:>11}"
+                f"{row['upload_ms_est']:>11}{row['prep_plus_upload_ms']:>10}")
+        if args.live:
+            line += f"{row['stt_ms_p50']:>12}  \"{row['text']}\""
+        print(line)
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
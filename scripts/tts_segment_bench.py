@@ -0,0 +1,137 @@
+"""
+TTS Segment Benchmark - legacy break-point chunker vs TTSSegmenter.
+
+Replays persona replies as simulated LLM token streams (virtual clock, no
+sleeping) and reports per chunker:
+- time to first audible chunk (p50 / max, from request start)
+- TTS chunks per reply and the share of tiny chunks (< --tiny chars)
+
+TTSSegmenter is run at each --targets latency target (ms) to show the
+first-chunk latency vs chunk count trade-off.
+
+Usage:
+    python scripts/tts_segment_bench.py
+    python scripts/tts_segment_bench.py --ttft-ms 400 --token-ms 30 --targets 300,500,800 --json
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.tts_segmenter import TTSSegmenter  # noqa: E402
+
+REPLIES = [
+    "네, 알겠습니다 사용자님! 지금 바로 VSCode 실행해드릴게요~",
+    "저번에도 한 판만 하신다고 하셨잖아요! 안 됩니다. 오늘 공부 목표부터 끝내요.",
+    "와, 오늘 벌써 두 시간이나 공부하셨네요 정말 대단해요 이대로 조금만 더 힘내봐요",
+    "음 그러니까 지금은 쉬는 시간이 아니라 공부 시간이에요 유튜브는 이따가 봐요",
+    "좋아요 😊 그럼 백준 열어드릴게요. 오늘은 몇 문제 풀 건가요?",
+    "프로세스 종료합니다.",
+    "사용자님, 휴대폰 보고 계신 거 다 보여요. 저만 봐주세요♡",
+    "오늘 공부한 내용 정리해드릴게요 잠시만 기다려 주세요",
+]
+
+
+def tokenize(text: str, rng: random.Random) -> list:
+    tokens, i = [], 0
+    while i < len(text):
+        size = rng.randint(1, 3)
+        tokens.append(text[i:i + size])
+        i += size
+    return tokens
+
+
+def legacy_chunks(tokens: list, times: list) -> list:
+    """The pre-segmenter chat_with_persona_stream chunker (break_points + rfind)."""
+    out, buffer = [], ""
+    for token, t in zip(tokens, times):
+        buffer += token
+        for bp in [".", ",", "~", "♡", "!", "?", "\\n"]:
+            if bp in buffer:
+                idx = buffer.rfind(bp)
+                if idx >= (2 if bp in ["!", "?", "♡", "\\n"] else 10):
+                    out.append((t, buffer[:idx + 1].strip()))
+                    buffer = buffer[idx + 1:]
+                    break
+    if buffer.strip():
+        out.append((times[-1], buffer.strip()))
+    return out
+
+
+class VirtualClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def segmenter_chunks(tokens: list, times: list, latency_target: float) -> list:
+    clock = VirtualClock()
+    segmenter = TTSSegmenter(latency_target=latency_target, max_wait=max(latency_target, 1.2), clock=clock)
+    out = []
+    for token, t in zip(tokens, times):
+        wait = segmenter.wait_time()
+        while wait is not None and clock.now + wait <= t:
+            clock.now += wait  # the timer fires before this token arrives
+            out += [(clock.now, s) for s in segmenter.poll()]
+            wait = segmenter.wait_time()
+        clock.now = t
+        out += [(t, s) for s in segmenter.push(token)]
+    out += [(clock.now, s) for s in segmenter.flush()]
+    return out
+
+
+def summarize(runs: list, tiny: int) -> dict:
+    first = [chunks[0][0] for chunks in runs if chunks]
+    counts = [len(chunks) for chunks in runs]
+    texts = [text for chunks in runs for _, text in chunks]
+    return {
+        "first_chunk_p50_ms": round(statistics.median(first) * 1000),
+        "first_chunk_max_ms": round(max(first) * 1000),
+        "chunks_per_reply": round(statistics.mean(counts), 2),
+        "tiny_chunk_share": round(sum(len(t) < tiny for t in texts) / len(texts), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TTS chunking benchmark")
+    parser.add_argument("--ttft-ms", type=float, default=350, help="LLM time to first token")
+    parser.add_argument("--token-ms", type=float, default=25, help="mean gap between tokens")
+    parser.add_argument("--targets", default="300,500,800", help="TTSSegmenter latency targets (ms)")
+    parser.add_argument("--tiny", type=int, default=5, help="chunks shorter than this count as tiny")
+    parser.add_argument("--rounds", type=int, default=20, help="tokenizations per reply")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    streams = []
+    for _ in range(args.rounds):
+        for reply in REPLIES:
+            tokens = tokenize(reply, rng)
+            t, times = args.ttft_ms / 1000, []
+            for _ in tokens:
+                times.append(t)
+                t += rng.expovariate(1000 / args.token_ms)  # bursty, as real token streams are
+            streams.append((tokens, times))
+
+    report = {"legacy": summarize([legacy_chunks(*s) for s in streams], args.tiny)}
+    for target in (float(x) for x in args.targets.split(",")):
+        report[f"segmenter@{target:.0f}ms"] = summarize(
+            [segmenter_chunks(*s, latency_target=target / 1000) for s in streams], args.tiny)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{'chunker':<18} {'first p50':>10} {'first max':>10} {'chunks/reply':>13} {'tiny':>7}")
+    for name, stats in report.items():
+        print(f"{name:<18} {stats['first_chunk_p50_ms']:>8}ms {stats['first_chunk_max_ms']:>8}ms "
+              f"{stats['chunks_per_reply']:>13} {stats['tiny_chunk_share']:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
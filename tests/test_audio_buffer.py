@@ -0,0 +1,131 @@
+import asyncio
+import wave
+
+import httpx
+import pytest
+
+from app.services.audio_buffer import (AudioBuffer, AudioLimitExceeded, AudioStreamLimits, MemoryFile,
+                                      UnsupportedAudioFormat, wav_format)
+from app.services.stt import create_wav_header
+
+
+def test_wav_matches_legacy_header_concat():
+    pcm = bytes(range(256)) * 100
+    buffer = AudioBuffer()
+    for i in range(0, len(pcm), 1000):
+        buffer.extend(pcm[i:i + 1000])
+
+    assert len(buffer) == len(pcm)
+    assert buffer.wav() == create_wav_header(pcm)
+    with wave.open(buffer.as_file()) as wav:
+        assert (wav.getframerate(), wav.getnchannels(), wav.getnframes()) == (16000, 1, len(pcm) // 2)
+
+
+def test_client_wav_header_is_replaced():
+    pcm = b"\x01\x00" * 800
+    buffer = AudioBuffer()
+    buffer.extend(create_wav_header(pcm[:600]))
+    buffer.extend(pcm[600:])
+    assert buffer.pcm() == pcm
+    assert buffer.wav() == create_wav_header(pcm)
+
+
+def test_client_wav_header_in_another_format_is_rejected():
+    header = create_wav_header(bytes(960), sample_rate=48000)
+    assert wav_format(header) == (48000, 1, 16)
+    with pytest.raises(UnsupportedAudioFormat, match="48000 Hz"):
+        AudioBuffer().extend(header)
+    with pytest.raises(UnsupportedAudioFormat):
+        AudioBuffer().extend(create_wav_header(bytes(960), channels=2))
+
+
+def test_client_wav_header_with_extra_chunks_is_parsed():
+    pcm = b"\x01\x00" * 100
+    header = create_wav_header(pcm)
+    # RIFF/WAVE, then a LIST chunk before 'fmt ' (as some recorders write it)
+    wav = header[:12] + b"LIST" + (3).to_bytes(4, "little") + b"abc\x00" + header[12:]
+    assert wav_format(wav) == (16000, 1, 16)
+    assert AudioBuffer.from_pcm(wav).pcm() == pcm
+    assert wav_format(b"RIFF\x00\x00\x00\x00WAVEdata") is None
+
+
+def test_split_truncates_in_place_and_copies_overlap():
+    buffer = AudioBuffer.from_pcm(bytes(range(100)))
+    rest = buffer.split(60, overlap=10)
+    assert buffer.pcm() == bytes(range(60))
+    assert rest.pcm() == bytes(range(50, 100))
+
+
+def test_memory_file_uploads_through_httpx_multipart():
+    buffer = AudioBuffer.from_pcm(b"\x02\x00" * 50_000)
+    with buffer.as_file("voice.wav") as audio_file:
+        request = httpx.Request("POST", "http://stt.invalid/", files={"file": audio_file})
+        body = request.read()
+    assert bytes(buffer.wav()) in body
+    assert b'filename="voice.wav"' in body
+    # Released view: the buffer can keep growing afterwards
+    buffer.extend(b"\x00\x00")
+
+
+def test_memory_file_seek_and_read():
+    f = MemoryFile(memoryview(b"abcdef"), "x")
+    assert f.read(2) == b"ab"
+    f.seek(-2, 2)
+    assert f.read() == b"ef"
+    assert f.read() == b""
+    f.seek(0)
+    assert f.read() == b"abcdef"
+
+
+def test_spooled_buffer_behaves_like_in_memory():
+    pcm = bytes(range(256)) * 100
+    spooled = AudioBuffer(spool_bytes=4096)
+    for i in range(0, len(pcm), 1000):
+        spooled.extend(pcm[i:i + 1000])
+
+    assert spooled.spooled
+    assert spooled.wav() == create_wav_header(pcm)
+
+    rest = spooled.split(20000, overlap=100)
+    assert rest.pcm() == pcm[19900:]
+    spooled.trim(1000, 9000)
+    assert spooled.pcm() == pcm[1000:9000]
+
+    spooled.close()
+    assert not spooled.spooled and len(spooled) == 0
+
+
+class FakeChunk:
+    def __init__(self, audio_data: bytes):
+        self.audio_data = audio_data
+
+
+async def chunks(count: int, size: int = 3200, delay: float = 0.0):
+    for _ in range(count):
+        await asyncio.sleep(delay)
+        yield FakeChunk(b"\0" * size)
+
+
+@pytest.mark.asyncio
+async def test_stream_limits_pass_small_streams():
+    limits = AudioStreamLimits(max_bytes=32000, max_seconds=5)
+    received = [chunk async for chunk in limits.guard(chunks(10))]
+    assert len(received) == 10 and limits.received == 32000
+
+
+@pytest.mark.asyncio
+async def test_stream_limits_stop_oversized_streams():
+    limits = AudioStreamLimits(max_bytes=32000)
+    received = []
+    with pytest.raises(AudioLimitExceeded):
+        async for chunk in limits.guard(chunks(100)):
+            received.append(chunk)
+    assert len(received) == 10
+
+
+@pytest.mark.asyncio
+async def test_stream_limits_stop_stalled_streams():
+    limits = AudioStreamLimits(max_seconds=0.05)
+    with pytest.raises(AudioLimitExceeded):
+        async for _ in limits.guard(chunks(3, delay=1.0)):
+            pass
@@ -0,0 +1,48 @@
+import io
+
+import numpy as np
+import pytest
+
+from app.services import audio_codec
+from app.services.audio_buffer import AudioBuffer
+
+soundfile = pytest.importorskip("soundfile")
+
+
+def speech_like(seconds=2.0, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * 16000)) / 16000
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 3 * t)
+    signal = sum(np.sin(2 * np.pi * f * t) / k for k, f in enumerate((180, 360, 540, 720), 1))
+    return (envelope * signal * 5000 + rng.normal(0, 50, len(t))).astype(np.int16)
+
+
+def test_flac_is_lossless_and_smaller():
+    samples = speech_like()
+    buffer = AudioBuffer.from_pcm(samples.tobytes())
+    audio_file, ext = audio_codec.encode(buffer, "flac")
+    assert ext == "flac" and audio_file.name == "voice.flac"
+    assert audio_file.size < len(buffer)
+
+    with audio_file:
+        decoded, rate = soundfile.read(io.BytesIO(audio_file.read()), dtype="int16")
+    assert rate == 16000
+    assert np.array_equal(decoded, samples)
+    # The source buffer can keep growing after encoding
+    buffer.extend(b"\x00\x00")
+
+
+def test_opus_is_much_smaller():
+    buffer = AudioBuffer.from_pcm(speech_like().tobytes())
+    audio_file, ext = audio_codec.encode(buffer, "opus")
+    assert ext == "ogg"
+    assert audio_file.size * 4 < len(buffer)
+
+
+def test_wav_and_unknown_formats_pass_through():
+    buffer = AudioBuffer.from_pcm(speech_like(0.5).tobytes())
+    for fmt in ("wav", "mp3"):
+        audio_file, ext = audio_codec.encode(buffer, fmt)
+        assert ext == "wav"
+        assert audio_file.size == len(buffer) + 44
+        audio_file.close()
@@ -0,0 +1,81 @@
+import asyncio
+import base64
+import binascii
+import json
+import struct
+
+import httpx
+import pytest
+from botocore.credentials import Credentials
+
+from app.core import bedrock_async
+from app.core.bedrock_async import AsyncBedrockChat, BedrockStreamError
+
+
+def event_message(headers: dict, payload: bytes) -> bytes:
+    """Encodes one AWS event-stream message (string headers only)."""
+    encoded_headers = b"".join(
+        struct.pack("B", len(name)) + name.encode() + struct.pack(">BH", 7, len(value)) + value.encode()
+        for name, value in headers.items()
+    )
+    total = 12 + len(encoded_headers) + len(payload) + 4
+    prelude = struct.pack(">II", total, len(encoded_headers))
+    prelude += struct.pack(">I", binascii.crc32(prelude))
+    message = prelude + encoded_headers + payload
+    return message + struct.pack(">I", binascii.crc32(message))
+
+
+def chunk_event(event: dict) -> bytes:
+    payload = json.dumps({"bytes": base64.b64encode(json.dumps(event).encode()).decode()}).encode()
+    return event_message({":message-type": "event", ":event-type": "chunk", ":content-type": "application/json"}, payload)
+
+
+async def split_stream(body: bytes, at: int):
+    yield body[:at]
+    yield body[at:]
+
+
+def use_transport(handler):
+    bedrock_async._credentials = Credentials("AKIDEXAMPLE", "secret")
+    bedrock_async._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    bedrock_async._http_loop = asyncio.get_running_loop()
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_text_deltas_from_event_stream():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["url"] = str(request.url)
+        seen["auth"] = request.headers["authorization"]
+        seen["body"] = json.loads(request.content)
+        body = (chunk_event({"type": "message_start"})
+                + chunk_event({"type": "content_block_delta", "delta": {"type": "text_delta", "text": "안녕"}})
+                + chunk_event({"type": "content_block_delta", "delta": {"type": "text_delta", "text": "하세요!"}})
+                + chunk_event({"type": "message_stop"}))
+        # split mid-message: the decoder must buffer partial frames
+        return httpx.Response(200, content=split_stream(body, 37))
+
+    use_transport(handler)
+    llm = AsyncBedrockChat("us.anthropic.claude-3-5-haiku-20241022-v1:0", temperature=0.1)
+    parts = [text async for text in llm.astream("hi", system="be short")]
+
+    assert parts == ["안녕", "하세요!"]
+    assert seen["url"].endswith("/model/us.anthropic.claude-3-5-haiku-20241022-v1%3A0/invoke-with-response-stream")
+    assert seen["auth"].startswith("AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/")
+    assert seen["body"]["system"] == "be short" and seen["body"]["temperature"] == 0.1
+
+
+@pytest.mark.asyncio
+async def test_exception_event_after_text_is_raised():
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = (chunk_event({"type": "content_block_delta", "delta": {"text": "네"}})
+                + event_message({":message-type": "exception", ":exception-type": "throttlingException"}, b"{}"))
+        return httpx.Response(200, content=body)
+
+    use_transport(handler)
+    parts = []
+    with pytest.raises(BedrockStreamError, match="throttlingException"):
+        async for text in AsyncBedrockChat("model").astream("hi"):
+            parts.append(text)
+    assert parts == ["네"]
@@ -0,0 +1,53 @@
+from app.services.blacklist_matcher import BlacklistMatcher
+
+
+BLACKLIST = ["Overwatch", "MapleStory", "Destiny", "Battle.net", "Steam", "League of Legends", "Riot Client"]
+
+
+def naive_find(apps, blacklist):
+    for app in apps:
+        for bad in blacklist:
+            if bad.lower() in app.lower():
+                return app
+    return None
+
+
+def test_matches_case_insensitive_substring():
+    matcher = BlacklistMatcher(BLACKLIST)
+    apps = ["Code", "Google Chrome", "steam_osx", "Slack"]
+    assert matcher.find(apps) == "steam_osx"
+    assert matcher.match("RIOT CLIENT Services") == "Riot Client"
+
+
+def test_no_match_returns_none():
+    matcher = BlacklistMatcher(BLACKLIST)
+    assert matcher.find(["Code", "Terminal", "Discord"]) is None
+    assert matcher.find([]) is None
+
+
+def test_overlapping_patterns_use_failure_links():
+    # "abd" fails midway through "abc", and the suffix "bcd" must still be found
+    matcher = BlacklistMatcher(["abd", "bcd", "cx"])
+    assert matcher.match("xxabcdyy") == "bcd"
+    assert matcher.match("abcx") == "cx"
+    assert matcher.match("ab") is None
+
+
+def test_empty_entries_are_ignored():
+    matcher = BlacklistMatcher(["", "Minecraft"])
+    assert matcher.patterns == ("Minecraft",)
+    assert matcher.find(["Code"]) is None
+    assert BlacklistMatcher([]).find(["Anything"]) is None
+
+
+def test_agrees_with_nested_loop():
+    blacklist = BLACKLIST + [f"game{i:04d}" for i in range(2000)]
+    matcher = BlacklistMatcher(blacklist)
+    cases = [
+        ["Code", "Chrome", "Battle.net Launcher"],
+        ["Code", "myGAME0042helper"],
+        ["Finder", "WindowServer", "Slack"],
+        ["Destiny 2", "Overwatch"],
+    ]
+    for apps in cases:
+        assert matcher.find(apps) == naive_find(apps, blacklist)
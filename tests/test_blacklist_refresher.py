@@ -0,0 +1,59 @@
+import httpx
+import pytest
+
+from app.services.blacklist_service import BlacklistRefresher, DEFAULT_BLACKLIST
+
+
+def make_refresher(handler):
+    refresher = BlacklistRefresher(url="http://data.test/api/v1/blacklist")
+    refresher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return refresher
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_swaps_snapshot_only_on_change():
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'},
+                              json={"data": [{"appName": "Minecraft"}, {"appName": ""}]})
+
+    refresher = make_refresher(handler)
+    assert refresher.matcher.patterns == tuple(DEFAULT_BLACKLIST)
+
+    assert await refresher.refresh() is True
+    snapshot = refresher.matcher
+    assert snapshot.patterns == ("Minecraft",)
+
+    # Second poll is answered with 304 and keeps the very same snapshot object
+    assert await refresher.refresh() is False
+    assert refresher.matcher is snapshot
+    assert seen_headers == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_errors_keep_previous_snapshot():
+    def handler(request):
+        return httpx.Response(500)
+
+    refresher = make_refresher(handler)
+    before = refresher.matcher
+    assert await refresher.refresh() is False
+    assert refresher.matcher is before
+
+
+@pytest.mark.asyncio
+async def test_stop_ends_refresh_task_and_closes_client():
+    refresher = BlacklistRefresher(url="http://127.0.0.1:9/api/v1/blacklist", interval=60)
+    await refresher.start()  # the fetch fails (nothing listening): defaults are kept
+    task, client = refresher._task, refresher._client
+    assert task is not None and not task.done()
+
+    await refresher.stop()
+
+    assert task.cancelled()
+    assert client.is_closed
+    assert refresher._task is None and refresher._client is None
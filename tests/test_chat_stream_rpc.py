@@ -0,0 +1,50 @@
+import pytest
+
+from app.core import grpc_server
+from app.schemas.intelligence import ChatRequest
+from app.services import chat
+
+
+async def fake_stream(request, context=None):
+    yield ("오늘 공부한 내용", False, {"emotion": "NORMAL", "chunk_index": 0})
+    yield ("정리해드릴게요.", False, {"emotion": "NORMAL", "chunk_index": 1})
+    yield ("", True, {"intent": "NOTE", "judgment": "NEUTRAL", "action_code": "GENERATE_NOTE",
+                      "action_detail": "Daily Report", "emotion": "NORMAL"})
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_final_message_matches_unary_note_contract(monkeypatch):
+    topics = []
+
+    async def fake_summary(topic):
+        topics.append(topic)
+        return "# Daily Report\n- asyncio"
+
+    monkeypatch.setattr(chat, "chat_with_persona_stream", fake_stream)
+    monkeypatch.setattr(chat.memory_service, "get_recent_summary_markdown", fake_summary, raising=False)
+
+    responses = [r async for r in grpc_server.stream_chat(ChatRequest(text="TIL 정리해줘", user_id="dev1"))]
+
+    assert [r.text_chunk for r in responses[:-1]] == ["오늘 공부한 내용", "정리해드릴게요."]
+    final = responses[-1]
+    assert final.is_complete
+    assert final.action_code == "WRITE_FILE"
+    assert final.action_detail == "Daily_Report_Note.md"
+    assert final.message == "# Daily Report\n- asyncio"
+    assert topics == ["Daily Report"]
+
+
+@pytest.mark.asyncio
+async def test_chat_stream_passes_other_intents_through(monkeypatch):
+    async def command_stream(request, context=None):
+        yield ("VSCode 열어드릴게요!", False, {"emotion": "EXCITE", "chunk_index": 0})
+        yield ("", True, {"intent": "COMMAND", "judgment": "STUDY", "action_code": "OPEN_APP",
+                          "action_detail": "Code", "emotion": "EXCITE"})
+
+    monkeypatch.setattr(chat, "chat_with_persona_stream", command_stream)
+
+    responses = [r async for r in grpc_server.stream_chat(ChatRequest(text="VSCode 켜줘", user_id="dev1"))]
+
+    final = responses[-1]
+    assert (final.action_code, final.action_detail) == ("OPEN_APP", "Code")
+    assert final.message == "VSCode 열어드릴게요!"
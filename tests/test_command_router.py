@@ -0,0 +1,86 @@
+import time
+
+import pytest
+
+from app.services.command_router import _COMMAND, _TIL, MAX_ROUTE_CHARS, CommandRouter
+
+
+@pytest.fixture
+def router():
+    return CommandRouter()
+
+
+@pytest.mark.parametrize("text, action_code, action_detail", [
+    ("VSCode 켜줘", "OPEN_APP", "Code"),
+    ("vs code 좀 켜 줘", "OPEN_APP", "Code"),
+    ("백준 열어줘!", "OPEN_APP", "https://www.acmicpc.net/"),
+    ("깃허브 열어", "OPEN_APP", "https://github.com"),
+    ("유튜브 꺼", "KILL_APP", "Chrome"),
+    ("디스코드 종료해줘", "KILL_APP", "Discord"),
+    ("리그 오브 레전드 꺼줘요", "KILL_APP", "LeagueClient"),
+])
+def test_open_and_kill_commands(router, text, action_code, action_detail):
+    result = router.route(text)
+    assert result["intent"] == "COMMAND"
+    assert result["action_code"] == action_code
+    assert result["action_detail"] == action_detail
+    assert result["message"]
+
+
+def test_agreement_kills_the_named_game(router):
+    result = router.route("알았어.. 이제 진짜 롤 끌게.")
+    assert result["action_code"] == "KILL_APP"
+    assert result["action_detail"] == "LeagueClient"
+    assert result["judgment"] == "PLAY"
+    assert "프로세스 종료" in result["message"]
+
+
+def test_agreement_uses_the_running_game(router):
+    result = router.route("알았어 [현재 실행 중인 앱: Code, LeagueClient, Chrome]")
+    assert result["action_detail"] == "LeagueClient"
+    # No game (or more than one) running: the LLM has to find it
+    assert router.route("알았어 끌게") is None
+    assert router.route("알았어 [현재 실행 중인 앱: LeagueClient, Minecraft]") is None
+
+
+def test_til_requests(router):
+    for text in ["TIL 정리해줘", "오늘 공부한 거 정리해줘", "퀴즈 내줘"]:
+        result = router.route(text)
+        assert (result["intent"], result["action_code"], result["action_detail"]) == ("NOTE", "GENERATE_NOTE", "Daily_Report")
+
+
+@pytest.mark.parametrize("text", [
+    "한 판만 더 할게",                 # excuse: depends on violation history
+    "알았어 조금만 더 하고 끌게",
+    "유튜브 틀어줘",                   # PLAY launch: depends on trust
+    "롤 켜줘",
+    "VSCode 켜고 유튜브 꺼줘",         # several commands
+    "파이썬 데코레이터 정리해줘",      # note with a topic
+    "안녕하세요! 오늘 공부 시작할게요.",
+    "알았어",
+    "until",
+    "",
+])
+def test_unsure_goes_to_the_llm(router, text):
+    assert router.route(text) is None
+
+
+def test_counters(router):
+    router.route("VSCode 켜줘")
+    router.route("심심해")
+    assert (router.routed, router.deferred) == (1, 1)
+
+
+def test_repeated_fillers_fail_in_linear_time(router):
+    # Whisper repetition loop: used to backtrack exponentially (n=14 took seconds)
+    text = "알파인아 " * 200 + "켜줘 x"
+    start = time.perf_counter()
+    assert _COMMAND.fullmatch(text) is None
+    assert _TIL.fullmatch(text) is None
+    assert router.route("알파인아 " * 50 + "켜줘 x") is None
+    assert time.perf_counter() - start < 0.05
+
+
+def test_long_utterances_skip_routing(router):
+    assert router.route("알파인아 " * 3 + "크롬 켜줘")["action_detail"] == "Chrome"
+    assert router.route("알파인아 " * (MAX_ROUTE_CHARS // 4) + "크롬 켜줘") is None
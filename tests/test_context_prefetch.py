@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from app.schemas.intelligence import ChatRequest
+from app.services import chat, context_prefetch
+from app.services.context_prefetch import VoiceContext, prefetch_user_context
+
+STATS = {"ratio": 11.1, "study_count": 120, "play_count": 15, "violations": ["LoL 14:00", "YouTube 15:00"]}
+
+
+class FakeMemory:
+    def __init__(self):
+        self.queries = []
+
+    def get_trust_score(self, user_id):
+        return 82
+
+    def get_user_context(self, query):
+        self.queries.append(query)
+        return "User played LoL during study time."
+
+
+class FakeStats:
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def get_recent_summary(self, user_id, days):
+        await asyncio.sleep(self.delay)
+        return STATS
+
+
+@pytest.mark.asyncio
+async def test_prefetch_collects_trust_stats_and_violations(monkeypatch):
+    memory = FakeMemory()
+    monkeypatch.setattr(context_prefetch, "memory_service", memory)
+    monkeypatch.setattr(context_prefetch, "statistic_service", FakeStats())
+
+    context = await prefetch_user_context("dev1")
+
+    assert context.trust_score == 82
+    assert context.stats == STATS
+    assert context.recent_violations == "User played LoL during study time."
+    assert memory.queries == [context_prefetch.VIOLATION_QUERY]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_keeps_defaults_for_slow_sources(monkeypatch):
+    monkeypatch.setattr(context_prefetch, "memory_service", FakeMemory())
+    monkeypatch.setattr(context_prefetch, "statistic_service", FakeStats(delay=1.0))
+    monkeypatch.setattr(context_prefetch, "PREFETCH_TIMEOUT", 0.05)
+
+    context = await prefetch_user_context("dev1")
+
+    assert context.stats is None          # timed out
+    assert context.trust_score == 82      # the other sources still arrive
+
+
+class PromptCapture:
+    def __init__(self):
+        self.prompts = []
+
+    async def astream(self, prompt):
+        self.prompts.append(prompt)
+        yield '좋아요! [INTENT] {"intent": "CHAT", "judgment": "NEUTRAL", "action_code": "NONE"}'
+
+
+async def run_stream(monkeypatch, context):
+    llm = PromptCapture()
+    monkeypatch.setattr(chat, "get_streaming_llm", lambda **kw: llm)
+    monkeypatch.setattr(chat, "route_command", lambda request: None)
+    monkeypatch.setattr(chat.memory_service, "get_user_context", lambda query: "", raising=False)
+    monkeypatch.setattr(chat.memory_service, "get_trust_score", lambda user_id: 50, raising=False)
+    items = [item async for item in chat.chat_with_persona_stream(ChatRequest(text="심심해", user_id="dev1"), context=context)]
+    assert items[-1][1] is True
+    return llm.prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_prefetched_context_reaches_the_prompt(monkeypatch):
+    voice_context = VoiceContext("dev1")
+    voice_context.trust_score = 82
+    voice_context.stats = STATS
+    voice_context.recent_violations = "User played LoL during study time."
+    prefetched = asyncio.get_running_loop().create_future()
+    prefetched.set_result(voice_context)
+
+    prompt = await run_stream(monkeypatch, prefetched)
+
+    assert "User's Trust Score: 82/100" in prompt
+    assert "Recent 3 days: study 120 min, play 15 min (play ratio 11.1%). Recent violations: LoL 14:00, YouTube 15:00" in prompt
+    assert "Violation Memory: User played LoL during study time." in prompt
+
+
+@pytest.mark.asyncio
+async def test_unfinished_prefetch_falls_back_to_defaults(monkeypatch):
+    pending = asyncio.get_running_loop().create_future()  # prefetch still running
+
+    prompt = await run_stream(monkeypatch, pending)
+
+    assert "User's Trust Score: 50/100" in prompt
+    assert "Recent 3 days" not in prompt
+    assert not pending.cancelled()  # shielded: the caller still owns the prefetch
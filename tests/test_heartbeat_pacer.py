@@ -0,0 +1,54 @@
+from app.protos import core_pb2
+from app.services.heartbeat_pacer import (
+    HeartbeatPacer, FAST_INTERVAL_MS, CALM_INTERVAL_MS, IDLE_INTERVAL_MS, CALM_AFTER_BEATS, IDLE_AFTER_BEATS
+)
+
+
+def studying():
+    return core_pb2.ClientHeartbeat(keystroke_count=20, keyboard_entropy=4.5, click_count=1, mouse_distance=200)
+
+
+def idle():
+    return core_pb2.ClientHeartbeat(is_os_idle=True)
+
+
+def test_calm_study_backs_off_once():
+    pacer = HeartbeatPacer()
+    changes = [pacer.update(studying()) for _ in range(CALM_AFTER_BEATS + 5)]
+    assert [c for c in changes if c is not None] == [CALM_INTERVAL_MS]
+
+
+def test_idle_backs_off_further_and_returns():
+    pacer = HeartbeatPacer()
+    changes = [pacer.update(idle()) for _ in range(IDLE_AFTER_BEATS)]
+    assert changes[-1] == IDLE_INTERVAL_MS
+    # User comes back but hasn't been calm long enough yet -> full cadence
+    assert pacer.update(studying()) == FAST_INTERVAL_MS
+
+
+def test_spike_or_alert_snaps_back_to_fast():
+    pacer = HeartbeatPacer()
+    for _ in range(CALM_AFTER_BEATS):
+        pacer.update(studying())
+    assert pacer.interval_ms == CALM_INTERVAL_MS
+
+    spike = core_pb2.ClientHeartbeat(keystroke_count=30, keyboard_entropy=1.5)
+    assert pacer.update(spike) == FAST_INTERVAL_MS
+    assert pacer.update(studying(), alert=True) is None
+    assert pacer.interval_ms == FAST_INTERVAL_MS
+
+
+def test_spike_is_judged_per_second_of_the_interval():
+    pacer = HeartbeatPacer()
+    for _ in range(CALM_AFTER_BEATS):
+        pacer.update(studying())
+    assert pacer.interval_ms == CALM_INTERVAL_MS
+
+    # 3s of normal clicking / mouse movement, summed by the client
+    calm_3s = core_pb2.ClientHeartbeat(keystroke_count=60, keyboard_entropy=4.5, click_count=15, mouse_distance=2400)
+    assert pacer.interval_seconds(calm_3s) == 3
+    assert pacer.update(calm_3s) is None
+
+    # A client-reported interval wins over the announced one
+    clicks_1s = core_pb2.ClientHeartbeat(keystroke_count=20, keyboard_entropy=4.5, click_count=15, interval_ms=1000)
+    assert pacer.update(clicks_1s) == FAST_INTERVAL_MS
@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from app.core.hedging import HedgePolicy, hedged_call
+
+
+class SlowThenFast:
+    """First attempt hangs, every later attempt answers quickly."""
+
+    def __init__(self, first_delay=5.0, later_delay=0.01):
+        self.delays = [first_delay]
+        self.later_delay = later_delay
+        self.started = 0
+        self.cancelled = 0
+
+    async def __call__(self):
+        delay = self.delays[self.started] if self.started < len(self.delays) else self.later_delay
+        attempt = self.started
+        self.started += 1
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return f"attempt{attempt}"
+
+
+def test_budget_caps_hedge_rate():
+    policy = HedgePolicy(budget_ratio=0.1, max_burst=2)
+    granted = 0
+    for _ in range(1000):
+        policy.on_request()
+        granted += policy.try_hedge()
+    assert granted <= 100
+
+
+def test_delay_tracks_percentile():
+    policy = HedgePolicy(percentile=90, min_samples=10, default_delay=2.0, min_delay=0.0)
+    assert policy.delay() == 2.0
+    for latency in range(1, 101):
+        policy.record(latency / 100)
+    assert policy.delay() == pytest.approx(0.901, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_slow_call_is_hedged_and_loser_cancelled():
+    policy = HedgePolicy(default_delay=0.05, budget_ratio=1.0)
+    call = SlowThenFast()
+    assert await hedged_call(call, policy) == "attempt1"
+    await asyncio.sleep(0)
+    assert call.started == 2 and call.cancelled == 1
+    assert policy.hedges == 1 and policy.hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_without_budget():
+    policy = HedgePolicy(default_delay=0.01, budget_ratio=0.0)
+    call = SlowThenFast(first_delay=0.05)
+    assert await hedged_call(call, policy) == "attempt0"
+    assert call.started == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_of_both_attempts_raises():
+    attempts = []
+
+    async def boom():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            await asyncio.sleep(0.05)  # primary: past the hedge delay, then fails
+        raise RuntimeError(f"down{len(attempts)}")
+
+    policy = HedgePolicy(default_delay=0.01, budget_ratio=1.0)
+    with pytest.raises(RuntimeError, match="down"):
+        await hedged_call(boom, policy)
+    assert attempts == [0, 1]
+    assert policy.hedges == 1 and policy.hedge_wins == 0
+
+
+@pytest.mark.asyncio
+async def test_latency_is_recorded_from_the_request_start():
+    policy = HedgePolicy(default_delay=0.05, budget_ratio=1.0)
+    assert await hedged_call(SlowThenFast(later_delay=0.01), policy) == "attempt1"
+    # The hedge won ~0.06s after the request started (not its own ~0.01s);
+    # the cancelled primary is kept as a sample of at least that long
+    samples = list(policy._latencies)
+    assert len(samples) == 2
+    assert all(latency >= 0.05 for latency in samples)
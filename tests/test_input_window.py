@@ -0,0 +1,82 @@
+from app.services.input_window import InputWindow
+
+
+def fill(window, n, keys=0, entropy=0.0, clicks=0, mouse=0):
+    for _ in range(n):
+        window.push(keys, entropy, clicks, mouse)
+
+
+def test_needs_minimum_samples():
+    window = InputWindow(window=30)
+    fill(window, 5, keys=20, entropy=1.5)
+    assert not window.is_suspicious()
+
+
+def test_single_click_spike_is_not_suspicious():
+    window = InputWindow(window=30)
+    fill(window, 20, keys=12, entropy=4.3, clicks=1, mouse=200)
+    window.push(12, 4.3, 25, 3000)
+    assert not window.is_suspicious()
+
+
+def test_sustained_wasd_typing_is_suspicious():
+    window = InputWindow(window=30)
+    fill(window, 20, keys=15, entropy=1.8)
+    assert window.is_suspicious()
+    assert window.mean_active_entropy() < 3.0
+
+
+def test_sustained_mouse_activity_is_suspicious():
+    window = InputWindow(window=30)
+    fill(window, 10, clicks=2, mouse=300)
+    fill(window, 10, clicks=15, mouse=1500)
+    assert window.is_suspicious()
+
+
+def test_old_samples_are_evicted():
+    window = InputWindow(window=30)
+    fill(window, 30, keys=15, entropy=1.8)
+    assert window.is_suspicious()
+    # 30 seconds of normal coding pushes the gaming samples out of the window
+    fill(window, 30, keys=15, entropy=4.5)
+    assert len(window) == 30
+    assert not window.is_suspicious()
+    assert abs(window.mean_active_entropy() - 4.5) < 1e-6
+
+
+def test_idle_browsing_ignored():
+    window = InputWindow(window=30)
+    fill(window, 30, keys=0, entropy=0.0, clicks=1, mouse=100)
+    assert window.active_seconds == 0
+    assert not window.is_suspicious()
+
+
+def test_window_spans_seconds_at_any_cadence():
+    window = InputWindow(window=60)
+    # 5s heartbeats: 12 samples fill the 60s window
+    for _ in range(20):
+        window.push(60, 4.5, 5, 1000, seconds=5)
+    assert len(window) == 12
+    assert window.seconds == 60
+    assert window.mean_clicks() == 1.0
+    assert window.mean_mouse() == 200.0
+
+
+def test_counts_are_judged_per_second():
+    # Normal coding summed over 5s heartbeats is not a spike of gaming input
+    calm = InputWindow(window=60)
+    for _ in range(12):
+        calm.push(60, 4.5, 30, 4000, seconds=5)
+    assert calm.active_seconds == 60
+    assert not calm.is_suspicious()
+
+    # Per-second typing threshold: 20 keys over 5s (4/s) is not typing
+    browsing = InputWindow(window=60)
+    for _ in range(12):
+        browsing.push(20, 1.5, 0, 0, seconds=5)
+    assert browsing.active_seconds == 0
+
+    gaming = InputWindow(window=60)
+    for _ in range(3):
+        gaming.push(75, 1.5, 0, 0, seconds=5)
+    assert gaming.is_suspicious()
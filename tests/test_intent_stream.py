@@ -0,0 +1,57 @@
+from app.services.intent_stream import IntentStreamParser
+
+
+def feed_all(parser, chunks):
+    segments = []
+    for chunk in chunks:
+        segments += parser.feed(chunk)
+    return segments
+
+
+def test_separator_split_across_chunks():
+    parser = IntentStreamParser()
+    segments = feed_all(parser, ["네, 알겠습니다 사용자님! 바로 켤게", "요 [INT", "ENT]\n{ \"intent\": \"COMMAND\", ",
+                                 "\"action_code\": \"OPEN_APP\", \"action_detail\": \"Code\" }"])
+
+    assert segments == ["네, 알겠습니다", "사용자님! 바로 켤게요"]
+    assert parser.separator_found
+    assert parser.intent == {"intent": "COMMAND", "action_code": "OPEN_APP", "action_detail": "Code"}
+
+
+def test_partial_separator_prefix_is_not_spoken():
+    parser = IntentStreamParser()
+    assert feed_all(parser, ["안녕하세요!", " [IN"]) == []
+    assert parser.feed("DEX] 확인") == ["안녕하세요!"]  # not the separator after all: spoken
+    assert parser.finish() == ["[INDEX] 확인"]
+
+
+def test_intent_is_ready_before_the_stream_ends():
+    parser = IntentStreamParser()
+    feed_all(parser, ["좋아요! [INTENT] {\"intent\": \"CHAT\", \"emotion\": \"LOVE\"}"])
+    assert parser.intent == {"intent": "CHAT", "emotion": "LOVE"}
+    parser.feed(" trailing tokens {")
+    assert parser.intent == {"intent": "CHAT", "emotion": "LOVE"}
+
+
+def test_braces_inside_json_strings():
+    parser = IntentStreamParser()
+    feed_all(parser, ["[INTENT]", "{\"action_detail\": \"a}b{\\\"c\", ", "\"intent\": \"NOTE\"}"])
+    assert parser.intent == {"action_detail": "a}b{\"c", "intent": "NOTE"}
+
+
+def test_short_weak_breaks_wait_for_more_text():
+    parser = IntentStreamParser()
+    assert parser.feed("음, 그") == []
+    assert parser.feed("러니까 오늘은 공부해요. 화이팅") == ["음, 그러니까 오늘은 공부해요."]
+    assert parser.finish() == ["화이팅"]
+
+
+def test_finish_falls_back_to_tail_search():
+    parser = IntentStreamParser()
+    feed_all(parser, ["알겠어요~ [INTENT] {\"intent\": \"CHAT\", \"judgment\": \"STUDY\"", "}"])
+    assert parser.intent == {"intent": "CHAT", "judgment": "STUDY"}
+
+    broken = IntentStreamParser()
+    feed_all(broken, ["네! [INTENT] {\"intent\": "])
+    assert broken.finish() == []
+    assert broken.intent is None
@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+from app.services.judge_throttle import JudgeThrottle
+
+
+def test_in_flight_judgment_debounces_user():
+    throttle = JudgeThrottle(burst=3, refill_seconds=30.0)
+    assert throttle.try_acquire("dev1", now=0.0)
+    assert not throttle.try_acquire("dev1", now=0.1)
+    # Other users are independent
+    assert throttle.try_acquire("dev2", now=0.1)
+    throttle.release("dev1")
+    assert throttle.try_acquire("dev1", now=0.2)
+
+
+def test_bucket_empties_and_refills():
+    throttle = JudgeThrottle(burst=2, refill_seconds=10.0)
+    for t in (0.0, 1.0):
+        assert throttle.try_acquire("dev1", now=t)
+        throttle.release("dev1")
+    assert not throttle.try_acquire("dev1", now=2.0)
+    # 10s later one token is back
+    assert throttle.try_acquire("dev1", now=12.0)
+    throttle.release("dev1")
+    assert not throttle.try_acquire("dev1", now=12.5)
+
+
+@pytest.mark.asyncio
+async def test_judgment_cancelled_before_it_starts_releases_user(monkeypatch):
+    from app.services import tracking_service
+    from app.services.client_session import ClientSession
+
+    throttle = JudgeThrottle()
+    monkeypatch.setattr(tracking_service, "judge_throttle", throttle)
+    session = ClientSession("dev1")
+    session.apps = ["LeagueClient"]
+
+    assert throttle.try_acquire("dev1")
+    tracking_service.TrackingService()._start_judgment(session)
+    task = session.ai_task
+    session.close()  # stream ends before the judgment ever ran
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert task.cancelled()
+    assert throttle.try_acquire("dev1")
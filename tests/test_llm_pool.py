@@ -0,0 +1,44 @@
+from app.core import llm
+from app.core.config import get_settings
+
+
+def test_get_llm_is_cached_per_model_and_temperature():
+    llm.reset_llm_pool()
+    haiku = llm.get_llm(llm.HAIKU_MODEL_ID, 0.1)
+
+    assert llm.get_llm(llm.HAIKU_MODEL_ID, 0.1) is haiku
+    assert llm.get_llm(llm.HAIKU_MODEL_ID, 0.7) is not haiku
+    assert llm.get_llm(llm.SONNET_MODEL_ID, 0.1) is not haiku
+
+
+def test_models_share_one_tuned_client():
+    llm.reset_llm_pool()
+    haiku = llm.get_llm(llm.HAIKU_MODEL_ID)
+    sonnet = llm.get_llm(llm.SONNET_MODEL_ID, 0.7)
+
+    assert haiku.client is sonnet.client is llm.get_bedrock_client()
+    config = haiku.client.meta.config
+    assert config.max_pool_connections == get_settings().BEDROCK_MAX_POOL_CONNECTIONS
+    assert config.tcp_keepalive
+    assert config.retries["mode"] == "standard"
+
+
+def test_reset_drops_the_pool():
+    llm.reset_llm_pool()
+    client = llm.get_bedrock_client()
+    llm.reset_llm_pool()
+    assert llm.get_bedrock_client() is not client
+
+
+def test_system_prompt_gets_a_cache_checkpoint_where_supported(monkeypatch):
+    monkeypatch.setattr(llm.settings, "BEDROCK_PROMPT_CACHE", True)
+    cached = llm.cached_system_message("rules", llm.HAIKU_MODEL_ID)
+    assert cached.content == [{"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}}]
+
+    plain = llm.cached_system_message("rules", llm.SONNET_MODEL_ID)
+    assert plain.content == "rules"
+
+
+def test_prompt_cache_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("BEDROCK_PROMPT_CACHE", raising=False)
+    assert not type(get_settings())().BEDROCK_PROMPT_CACHE
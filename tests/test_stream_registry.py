@@ -0,0 +1,55 @@
+import pytest
+
+from app.core.stream_registry import StreamRegistry
+from app.protos import core_pb2
+from app.services.client_session import ClientSession
+
+
+def make_command(payload="hi"):
+    return core_pb2.ServerCommand(type=core_pb2.ServerCommand.SHOW_MESSAGE, payload=payload)
+
+
+def test_push_reaches_every_stream_of_user():
+    registry = StreamRegistry()
+    pc, cam, other = ClientSession("dev1"), ClientSession("dev1"), ClientSession("dev2")
+    for session in (pc, cam, other):
+        registry.register(session)
+
+    assert registry.push("dev1", make_command()) == 2
+    assert pc.outbox.get_nowait().payload == "hi"
+    assert cam.outbox.get_nowait().payload == "hi"
+    assert other.outbox.empty()
+    assert registry.push("nobody", make_command()) == 0
+    assert registry.get(cam.session_id) is cam
+
+    stats = registry.stats()
+    assert stats["connected_users"] == 2
+    assert stats["live_streams"] == 3
+
+
+def test_unregister_and_full_outbox():
+    registry = StreamRegistry()
+    session = ClientSession("dev1", outbox_maxsize=1)
+    registry.register(session)
+    assert registry.push("dev1", make_command("a")) == 1
+    assert registry.push("dev1", make_command("b")) == 0
+    assert registry.stats()["dropped_commands"] == 1
+
+    registry.unregister(session)
+    assert not registry.is_connected("dev1")
+    assert registry.get(session.session_id) is None
+    assert registry.stats()["live_streams"] == 0
+
+
+def test_session_is_slotted_and_accounted():
+    session = ClientSession("dev1")
+    with pytest.raises(AttributeError):
+        session.unexpected = 1
+
+    registry = StreamRegistry()
+    registry.register(session)
+    idle = registry.memory_stats()["avg_bytes_per_session"]
+    assert idle > 0
+
+    session.apps = ["Code", "Google Chrome", "Slack"]
+    assert registry.memory_stats()["avg_bytes_per_session"] > idle
@@ -0,0 +1,72 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.schemas.intelligence import STTResponse
+from app.services.streaming_stt import IncrementalTranscriber, merge_transcripts, SAMPLE_RATE
+
+
+def tone(seconds, amplitude=8000):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.int16).tobytes()
+
+
+def silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.int16).tobytes()
+
+
+def chunks(data, size=3200):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class FakeSTT:
+    def __init__(self):
+        self.calls = []
+
+    async def __call__(self, data, file_ext):
+        self.calls.append(len(data))
+        index = len(self.calls)
+        await asyncio.sleep(0)
+        return STTResponse(text=f"seg{index}")
+
+
+def test_merge_transcripts_dedupes_overlap():
+    assert merge_transcripts(["유튜브 좀 꺼", "꺼 줘 지금", ""]) == "유튜브 좀 꺼 줘 지금"
+    assert merge_transcripts(["안녕", "반가워"]) == "안녕 반가워"
+
+
+@pytest.mark.asyncio
+async def test_segments_are_sent_before_final():
+    fake = FakeSTT()
+    transcriber = IncrementalTranscriber(fake)
+    audio = tone(2.0) + silence(0.6) + tone(1.0)
+    for chunk in chunks(audio):
+        transcriber.feed(chunk)
+
+    # First sentence is already on its way while the second one streams in
+    assert transcriber.segments == 1
+    result = await transcriber.finish()
+    assert result.text == "seg1 seg2"
+    assert len(fake.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_long_speech_is_cut_with_overlap_and_silence_is_skipped():
+    fake = FakeSTT()
+    transcriber = IncrementalTranscriber(fake)
+    for chunk in chunks(silence(1.0) + tone(17.0) + silence(2.0)):
+        transcriber.feed(chunk)
+    await transcriber.finish()
+    # 20s of audio, 8s forced cuts; the trailing silence-only tail is never uploaded
+    assert len(fake.calls) == 3
+    assert sum(fake.calls) > len(silence(1.0) + tone(17.0))
+
+
+@pytest.mark.asyncio
+async def test_short_utterance_goes_out_on_finish():
+    fake = FakeSTT()
+    transcriber = IncrementalTranscriber(fake)
+    transcriber.feed(tone(0.8))
+    assert transcriber.segments == 0
+    assert (await transcriber.finish()).text == "seg1"
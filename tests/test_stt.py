@@ -0,0 +1,43 @@
+import httpx
+import numpy as np
+import pytest
+from groq import AsyncGroq
+
+from app.services import stt, stt_backends
+from app.services.audio_buffer import AudioBuffer
+
+
+def tone(seconds, amplitude=6000):
+    t = np.arange(int(seconds * 16000)) / 16000
+    return (amplitude * np.sin(2 * np.pi * 200 * t)).astype(np.int16).tobytes()
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    sizes = []
+
+    def handler(request):
+        sizes.append(len(request.read()))
+        return httpx.Response(200, json={"text": "안녕"})
+
+    client = AsyncGroq(api_key="test", http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(stt_backends, "_client_instance", client)
+    return sizes
+
+
+@pytest.mark.asyncio
+async def test_silence_never_reaches_groq(uploads):
+    result = await stt.transcribe_bytes(bytes(32000 * 3), file_ext="raw")
+    assert result.text == ""
+    assert uploads == []
+
+
+@pytest.mark.asyncio
+async def test_speech_is_trimmed_before_upload(uploads):
+    buffer = AudioBuffer.from_pcm(bytes(32000 * 2) + tone(1.0) + bytes(32000 * 2))
+    result = await stt.transcribe_bytes(buffer)
+    assert result.text == "안녕"
+    assert 70 < result.audio_level < 75
+    # ~1s of speech + 2 x 210ms padding instead of 5s
+    assert len(buffer) < 32000 * 1.5
+    assert uploads[0] < 32000 * 1.5 + 1000
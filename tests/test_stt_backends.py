@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from app.core.circuit_breaker import CircuitBreaker
+from app.services.stt_backends import STTBackend, STTRouter
+
+
+class FakeBackend(STTBackend):
+    def __init__(self, name, fail=False, available=True):
+        self.name = name
+        self.fail = fail
+        self._available = available
+        self.calls = 0
+
+    @property
+    def available(self):
+        return self._available
+
+    async def transcribe(self, audio, file_ext="wav", upload_format=None):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError(f"{self.name} down")
+        return f"{self.name} text"
+
+
+def test_breaker_trips_on_consecutive_failures_and_recovers():
+    breaker = CircuitBreaker("test", failure_threshold=2, cooldown_seconds=30)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+    later = breaker._opened_at + 31
+    assert breaker.allow(now=later)            # one half-open probe
+    assert not breaker.allow(now=later + 1)    # ... at a time
+    breaker.record_success(0.5)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_trips_on_slow_calls():
+    breaker = CircuitBreaker("test", slow_call_seconds=2.0, slow_call_ratio=0.5, min_calls=4)
+    for latency in (0.5, 3.0, 0.4, 2.5):
+        breaker.record_success(latency)
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+@pytest.mark.asyncio
+async def test_router_falls_back_on_error_then_skips_tripped_primary():
+    primary, local = FakeBackend("groq", fail=True), FakeBackend("local")
+    router = STTRouter(primary, local, CircuitBreaker("stt", failure_threshold=2))
+
+    assert await router.transcribe(b"") == "local text"
+    assert await router.transcribe(b"") == "local text"
+    assert router.breaker.state == CircuitBreaker.OPEN
+    assert await router.transcribe(b"") == "local text"
+    assert primary.calls == 2 and local.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_router_without_fallback_always_uses_primary():
+    primary = FakeBackend("groq", fail=True)
+    router = STTRouter(primary, FakeBackend("local", available=False), CircuitBreaker("stt", failure_threshold=1))
+    for _ in range(3):
+        with pytest.raises(RuntimeError):
+            await router.transcribe(b"")
+    assert primary.calls == 3
+
+
+def test_backend_without_transcribe_fails_at_construction():
+    class Incomplete(STTBackend):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.asyncio
+async def test_router_stop_cancels_preloads():
+    router = STTRouter(FakeBackend("groq"))
+    preload = asyncio.create_task(asyncio.sleep(10))
+    router._preload_tasks.append(preload)
+
+    await router.stop()
+
+    assert preload.cancelled()
+    assert router._preload_tasks == []
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import types
+
+import pytest
+
+from app.protos import core_pb2
+from app.services import tracking_service
+from app.services.blacklist_matcher import BlacklistMatcher
+from app.services.client_session import ClientSession
+from app.services.judge_throttle import JudgeThrottle
+
+STUDY_APPS = json.dumps(["Code", "Chrome"])
+GAME_APPS = json.dumps(["Code", "LeagueClient"])
+
+
+class CountingMatcher(BlacklistMatcher):
+    def __init__(self, patterns):
+        super().__init__(patterns)
+        self.finds = 0
+
+    def find(self, apps):
+        self.finds += 1
+        return super().find(apps)
+
+
+class CountingJson:
+    def __init__(self):
+        self.loads_calls = 0
+
+    def loads(self, text):
+        self.loads_calls += 1
+        return json.loads(text)
+
+
+async def heartbeats(*apps_list):
+    for apps_json in apps_list:
+        yield core_pb2.ClientHeartbeat(apps_json=apps_json)
+
+
+async def consume(service, session, *apps_list):
+    await service._consume_heartbeats(heartbeats(*apps_list), session)
+    commands = []
+    while (command := session.outbox.get_nowait()) is not None:
+        commands.append(command)
+    return [c for c in commands if c.type != core_pb2.ServerCommand.SET_HEARTBEAT_INTERVAL]
+
+
+@pytest.fixture
+def patched(monkeypatch):
+    matcher = CountingMatcher(["LeagueClient"])
+    counting_json = CountingJson()
+    monkeypatch.setattr(tracking_service, "blacklist_refresher", types.SimpleNamespace(matcher=matcher))
+    monkeypatch.setattr(tracking_service, "json", counting_json)
+
+    service = tracking_service.TrackingService()
+    logged = []
+
+    async def log_detection(app_name, source, user_id):
+        logged.append(app_name)
+
+    monkeypatch.setattr(service, "_log_game_detection", log_detection)
+    return service, matcher, counting_json, logged
+
+
+@pytest.mark.asyncio
+async def test_unchanged_apps_json_reuses_the_cached_verdict(patched):
+    service, matcher, counting_json, logged = patched
+    session = ClientSession("dev1")
+
+    commands = await consume(service, session, GAME_APPS, GAME_APPS, GAME_APPS)
+
+    # Parsed and matched once, verdict re-sent on every heartbeat, logged once
+    assert counting_json.loads_calls == 1
+    assert matcher.finds == 1
+    assert [(c.type, c.payload) for c in commands] == [(core_pb2.ServerCommand.KILL_PROCESS, "LeagueClient")] * 3
+    assert logged == ["LeagueClient"]
+
+
+@pytest.mark.asyncio
+async def test_changed_apps_json_runs_detection_again(patched):
+    service, matcher, counting_json, logged = patched
+    session = ClientSession("dev1")
+
+    commands = await consume(service, session, STUDY_APPS, STUDY_APPS, GAME_APPS)
+
+    assert counting_json.loads_calls == 2
+    assert matcher.finds == 2
+    assert [c.payload for c in commands] == ["LeagueClient"]
+    assert logged == ["LeagueClient"]
+
+
+@pytest.mark.asyncio
+async def test_unchanged_apps_json_is_judged_once(patched, monkeypatch):
+    service, matcher, counting_json, logged = patched
+    session = ClientSession("dev1")
+    monkeypatch.setattr(tracking_service, "judge_throttle", JudgeThrottle())
+    judged = []
+
+    async def judge(apps, outbox, user_id):
+        judged.append(apps)
+        return types.SimpleNamespace(is_game_detected=False, target_app="")
+
+    monkeypatch.setattr(service, "_judge_in_background", judge)
+
+    async def gaming_heartbeats():
+        # WASD-style typing: suspicious once the input window has enough samples
+        for _ in range(16):
+            yield core_pb2.ClientHeartbeat(apps_json=STUDY_APPS, keystroke_count=20, keyboard_entropy=1.5)
+            await asyncio.sleep(0)
+
+    await service._consume_heartbeats(gaming_heartbeats(), session)
+
+    assert judged == [["Code", "Chrome"]]
+    assert counting_json.loads_calls == 1
+    assert session.ai_judged
+
+
+@pytest.mark.asyncio
+async def test_cancelled_reader_does_not_block_on_a_full_outbox(patched):
+    service, matcher, counting_json, logged = patched
+    session = ClientSession("dev1")
+    while not session.outbox.full():
+        session.outbox.put_nowait(core_pb2.ServerCommand(type=core_pb2.ServerCommand.KILL_PROCESS))
+
+    async def stalled_client():
+        await asyncio.Event().wait()
+        yield core_pb2.ClientHeartbeat()
+
+    reader = asyncio.create_task(service._consume_heartbeats(stalled_client(), session))
+    await asyncio.sleep(0)
+    reader.cancel()
+
+    await asyncio.wait_for(asyncio.wait({reader}), timeout=0.5)
+    assert reader.done()
+    assert session.outbox.full()
@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+
+from app.services.tts_segmenter import TTSSegmenter, iterate_with_timer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def push_all(segmenter, parts):
+    out = []
+    for part in parts:
+        out += segmenter.push(part)
+    return out
+
+
+def test_first_chunk_at_earliest_sentence_ending():
+    segmenter = TTSSegmenter()
+    assert push_all(segmenter, ["알겠어", "요 바로 ", "켜드릴게요 사용자님. 잠시만"]) == ["알겠어요", "바로 켜드릴게요 사용자님."]
+    assert segmenter.flush() == ["잠시만"]
+
+
+def test_later_chunks_merge_short_sentences():
+    segmenter = TTSSegmenter(min_chars=10)
+    assert push_all(segmenter, ["네! ", "좋아요 사용자님. ", "오늘도 가요! ", "화이팅"]) == ["네!", "좋아요 사용자님. 오늘도 가요!"]
+
+
+def test_breaks_at_the_end_wait_for_the_next_token():
+    segmenter = TTSSegmenter()
+    assert segmenter.push("정말요?") == []
+    assert segmenter.push("! 대박") == ["정말요?!"]
+
+
+def test_no_false_breaks():
+    segmenter = TTSSegmenter()
+    # decimals, ranges and the connective -니까 are not sentence ends
+    assert push_all(segmenter, ["3.5초 ", "걸리니까 ", "1~2분 "]) == []
+
+
+def test_newline_and_emoji_are_breaks():
+    segmenter = TTSSegmenter()
+    assert push_all(segmenter, ["안녕\n", "반가워"]) == ["안녕"]
+    assert push_all(segmenter, [" 오늘도 같이 공부해요 ", "😊", " 그럼"]) == ["반가워 오늘도 같이 공부해요 😊"]
+
+
+def test_timer_cuts_at_last_space_after_latency_target():
+    clock = FakeClock()
+    segmenter = TTSSegmenter(latency_target=0.5, max_wait=1.0, clock=clock)
+    segmenter.push("음 그러니까 오늘은 공")
+    assert segmenter.wait_time() == 0.5
+    clock.now = 0.4
+    assert segmenter.poll() == []
+    clock.now = 0.5
+    assert segmenter.poll() == ["음 그러니까 오늘은"]
+    assert segmenter.wait_time() == 1.0  # later chunks use max_wait
+
+
+def test_max_chars_bounds_the_buffer():
+    segmenter = TTSSegmenter(max_chars=20)
+    out = push_all(segmenter, ["가나다 " * 5, "라마"])
+    assert out and all(len(segment) <= 20 for segment in out)
+
+
+async def slow_stream(items, delay):
+    for item in items:
+        await asyncio.sleep(delay)
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_iterate_with_timer_ticks_without_losing_items():
+    received = [item async for item in iterate_with_timer(slow_stream(["a", "b"], 0.05), lambda: 0.02)]
+    assert [item for item in received if item is not None] == ["a", "b"]
+    assert None in received
@@ -0,0 +1,46 @@
+import numpy as np
+
+from app.services import vad
+
+RATE = vad.SAMPLE_RATE
+
+
+def tone(seconds, amplitude=6000):
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (amplitude * np.sin(2 * np.pi * 200 * t)).astype(np.int16).tobytes()
+
+
+def noise(seconds, amplitude=60, seed=0):
+    return np.random.default_rng(seed).normal(0, amplitude, int(seconds * RATE)).astype(np.int16).tobytes()
+
+
+def test_trims_leading_and_trailing_silence():
+    pcm = noise(1.0) + tone(1.0) + noise(1.5, seed=1)
+    result = vad.detect(pcm)
+    assert result.has_speech
+    pad = vad.PAD_FRAMES * vad.FRAME_BYTES
+    assert abs(result.start - (RATE * 2 - pad)) <= vad.FRAME_BYTES
+    assert abs(result.end - (RATE * 4 + pad)) <= 2 * vad.FRAME_BYTES
+    # 6000 amplitude sine -> RMS ~4243 -> ~72.5 dB re 1 LSB
+    assert 71 < result.level_db < 74
+
+
+def test_silence_and_hiss_have_no_speech():
+    assert not vad.detect(bytes(RATE * 2)).has_speech
+    assert not vad.detect(noise(2.0)).has_speech
+    assert not vad.detect(noise(2.0, amplitude=3000)).has_speech  # white noise: high ZCR
+    assert not vad.detect(b"").has_speech
+
+
+def test_continuous_speech_is_kept_whole():
+    pcm = tone(3.0)
+    result = vad.detect(pcm)
+    assert (result.start, result.end) == (0, len(pcm))
+
+
+def test_frame_rms_matches_loop():
+    pcm = tone(0.5) + noise(0.5)
+    samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float64)
+    expected = [np.sqrt(np.mean(samples[i:i + vad.FRAME_SAMPLES] ** 2))
+                for i in range(0, len(samples) - vad.FRAME_SAMPLES + 1, vad.FRAME_SAMPLES)]
+    assert np.allclose(vad.frame_rms(pcm), expected, rtol=1e-4)
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+from app.services.voice_turns import VoiceTurnRegistry
+
+
+async def llm_stream(log, chunks=50):
+    try:
+        for i in range(chunks):
+            await asyncio.sleep(0.01)
+            yield f"chunk{i}"
+    finally:
+        log.append("closed")
+
+
+@pytest.mark.asyncio
+async def test_new_turn_cancels_previous_llm_stream():
+    registry = VoiceTurnRegistry()
+    log = []
+    received = []
+
+    async def old_turn():
+        turn = registry.begin("u1")
+        try:
+            async for chunk in turn.iterate(llm_stream(log)):
+                received.append(chunk)
+        finally:
+            registry.end(turn)
+
+    task = asyncio.create_task(old_turn())
+    await asyncio.sleep(0.035)
+    new_turn = registry.begin("u1")
+
+    await asyncio.wait_for(task, 1)
+    assert 0 < len(received) < 10
+    assert log == ["closed"]
+    assert registry.barge_ins == 1
+    assert registry.current("u1") is new_turn
+
+
+@pytest.mark.asyncio
+async def test_superseded_side_work_returns_none():
+    registry = VoiceTurnRegistry()
+    turn = registry.begin("u1")
+    note = asyncio.create_task(turn.run(asyncio.sleep(10, result="note")))
+    await asyncio.sleep(0)
+    registry.begin("u1")
+    assert await note is None
+    assert await turn.run(asyncio.sleep(0, result="late")) is None
+
+
+@pytest.mark.asyncio
+async def test_other_users_are_untouched():
+    registry = VoiceTurnRegistry()
+    turn = registry.begin("u1")
+    registry.begin("u2")
+    assert await turn.run(asyncio.sleep(0, result="ok")) == "ok"
+    registry.end(turn)
+    assert registry.stats() == {"active_turns": 1, "turns": 2, "barge_ins": 0}
+
+
+@pytest.mark.asyncio
+async def test_streams_keyed_separately_do_not_barge_in():
+    registry = VoiceTurnRegistry()
+    first = registry.begin("dev1", key="stream:1")
+    second = registry.begin("dev1", key="stream:2")
+    assert not first.superseded
+    assert first.user_id == second.user_id == "dev1"
+    registry.end(first)
+    assert registry.current("stream:2") is second
+    assert registry.barge_ins == 0